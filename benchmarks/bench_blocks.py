@@ -0,0 +1,21 @@
+"""Block collision counting at increasing mass ratios."""
+from harness import benchmark
+
+from crowd_dynamics.blocks import SlidingBlocks, event_table
+
+@benchmark(params=[1e2, 1e4, 1e6, 1e8, 1e10], quick=[1e2, 1e4, 1e6, 1e8], unit='collisions')
+def event_table_ratio(ratio):
+    """Full event table for masses 1 and `ratio` (pi * sqrt(ratio) collisions)."""
+    def run():
+        return event_table(1.0, ratio).collisions
+    return run
+
+@benchmark(params=[1e2, 1e4, 1e6, 1e8], quick=[1e2, 1e4, 1e6], unit='collisions')
+def block_scene_ratio(ratio):
+    """Exact pixel-space stepping of the main.py blocks until they separate for good."""
+    def run():
+        scene = SlidingBlocks(m1=ratio, v1=-300.0, m2=1.0, v2=0.0)
+        while scene.v2 < 0 or scene.v2 > scene.v1:
+            scene.step(10.0)
+        return scene.collisions
+    return run
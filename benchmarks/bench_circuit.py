@@ -0,0 +1,53 @@
+"""Circuit.solve_dc on square resistor grids driven by one source."""
+import numpy as np
+
+from harness import benchmark
+
+from crowd_dynamics.circuits import Circuit, Resistor, VoltageSource
+
+def grid(side, seed=0):
+    rng = np.random.default_rng(seed)
+    circuit = Circuit()
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                circuit.add_resistor(Resistor(f"{r}_{c}", f"{r}_{c + 1}", rng.uniform(50, 150)))
+            if r + 1 < side:
+                circuit.add_resistor(Resistor(f"{r}_{c}", f"{r + 1}_{c}", rng.uniform(50, 150)))
+    circuit.add_voltage_source(VoltageSource("0_0", f"{side - 1}_{side - 1}", 5.0))
+    return circuit
+
+@benchmark(params=[5, 10, 20, 40, 80], quick=[5, 10, 20, 40], unit='nodes')
+def solve_dc_cold(side):
+    """Assemble, factor and solve from scratch."""
+    circuit = grid(side)
+
+    def run():
+        circuit._invalidate()
+        circuit.solve_dc()
+        return side * side
+    return run
+
+@benchmark(params=[10, 20, 40, 80], quick=[10, 20, 40], unit='solves')
+def solve_dc_edit(side):
+    """Re-solve after changing one resistor (cached factorization plus low-rank update)."""
+    circuit = grid(side)
+    circuit.solve_dc()
+    rng = np.random.default_rng(1)
+
+    def run():
+        resistor = circuit.resistors[rng.integers(len(circuit.resistors))]
+        resistor.resistance *= rng.uniform(0.9, 1.1)
+        circuit.solve_dc()
+        return 1
+    return run
+
+@benchmark(params=[10, 20, 40, 80], quick=[10, 20, 40], unit='samples')
+def monte_carlo(side):
+    """Tolerance sweep: stacked dense solves on small grids, a sparse LU per sample above the cap."""
+    circuit = grid(side)
+
+    def run():
+        circuit.monte_carlo(20, seed=0)
+        return 20
+    return run
@@ -0,0 +1,27 @@
+"""Grid and network integrators from crowd_dynamics.waves and crowd_dynamics.springs."""
+import numpy as np
+
+from harness import benchmark
+
+from crowd_dynamics.springs import SpringNetwork
+from crowd_dynamics.waves import PointSource, WaveField
+
+@benchmark(params=[128, 512, 2048], quick=[128, 512], unit='cell updates')
+def wave_step(grid):
+    field = WaveField(grid, grid)
+    field.add_source(PointSource(grid // 2, grid // 2, frequency=0.04))
+
+    def run():
+        field.step(10)
+        return 10 * grid * grid
+    return run
+
+@benchmark(params=[10, 100, 300], quick=[10, 100], unit='mass updates')
+def spring_lattice(side):
+    net = SpringNetwork.lattice(side, side, anchor=0.1, damping=0.01)
+    x0 = np.random.default_rng(0).normal(0, 0.1, side * side)
+
+    def run():
+        net.integrate(x0, np.zeros_like(x0), 1.0, 0.01, record_every=100)
+        return 100 * side * side
+    return run
@@ -0,0 +1,16 @@
+"""Lorenz attractor solves with the right-hand side from crowd_dynamics.ode."""
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from harness import benchmark
+
+from crowd_dynamics.ode import lorenz
+
+@benchmark(params=[10, 40, 160], unit='rhs evaluations')
+def lorenz_solve(t_end):
+    """The solve_ivp call behind the interactive plot, over [0, t_end]."""
+    def run():
+        sol = solve_ivp(lambda t, y: lorenz(t, y, 10, 28, 8 / 3), [0, t_end], [1, 1, 1],
+                        t_eval=np.linspace(0, t_end, 250 * t_end))
+        return sol.nfev
+    return run
@@ -0,0 +1,16 @@
+"""N-body gravity force evaluation (crowd_dynamics.nbody with n bodies)."""
+import numpy as np
+
+from harness import benchmark
+
+from crowd_dynamics.nbody import GravitySystem
+
+@benchmark(params=[10, 100, 1000, 3000], quick=[10, 100, 1000], unit='pair forces')
+def gravity_step(n):
+    rng = np.random.default_rng(0)
+    scene = GravitySystem(rng.uniform(1, 10, n), rng.uniform(0, 1000, (n, 2)), rng.normal(0, 1, (n, 2)))
+
+    def run():
+        scene.step(1 / scene.rate)
+        return n * (n - 1)
+    return run
@@ -0,0 +1,48 @@
+"""Turing machine steps per second on a binary counter."""
+from harness import benchmark
+
+from crowd_dynamics.turing import TuringMachine, parse_transitions
+
+# Counts up in binary forever: sweep right, increment with carry, sweep back
+COUNTER = parse_transitions("""
+q0 0 -> q0 0 R
+q0 1 -> q0 1 R
+q0 # -> q1 # L
+q1 1 -> q1 0 L
+q1 0 -> q2 1 L
+q1 # -> q2 1 L
+q2 0 -> q2 0 L
+q2 1 -> q2 1 L
+q2 # -> q0 # R
+""")
+
+@benchmark(params=[10 ** 5, 10 ** 6, 10 ** 7], quick=[10 ** 5, 10 ** 6], unit='steps')
+def compiled_run(steps):
+    machine = TuringMachine('0', COUNTER)
+
+    def run():
+        machine.reset()
+        machine.run(steps)
+        return machine.step_count
+    return run
+
+@benchmark(params=[10 ** 6, 10 ** 7, 10 ** 8], quick=[10 ** 6], unit='steps')
+def macro_run(steps):
+    machine = TuringMachine('0', COUNTER)
+
+    def run():
+        machine.reset()
+        machine.run_macro(steps, block_size=4)
+        return machine.step_count
+    return run
+
+@benchmark(params=[10 ** 5, 10 ** 6], unit='steps')
+def recorded_run(steps):
+    machine = TuringMachine('0', COUNTER)
+
+    def run():
+        machine.reset()
+        machine.record()
+        machine.run(steps)
+        return machine.step_count
+    return run
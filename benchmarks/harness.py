@@ -0,0 +1,31 @@
+"""Shared setup for the benchmark modules.
+
+Importing this puts the repository root on sys.path, so the workloads can
+import crowd_dynamics, and selects the dummy SDL video driver and
+matplotlib's Agg backend in case one of them pulls in a viewer.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('MPLBACKEND', 'Agg')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+def benchmark(params, unit, quick=None):
+    """Mark `fn(param) -> run` as a benchmark.
+
+    `fn` does the setup for one parameter value and returns a `run()`
+    callable that does the timed work and returns how many `unit`s it
+    processed. `quick` is the subset of `params` run without --full.
+    """
+    def mark(fn):
+        fn.params = list(params)
+        fn.quick = list(params if quick is None else quick)
+        fn.unit = unit
+        return fn
+    return mark
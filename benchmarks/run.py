@@ -0,0 +1,118 @@
+"""Run the headless benchmark suite and compare results between commits.
+
+    python benchmarks/run.py                       # quick parameter sets
+    python benchmarks/run.py --full -k turing      # every size, only matching names
+    python benchmarks/run.py --save                # also write results/<commit>.json
+    python benchmarks/run.py --compare results/OLD.json results/NEW.json
+
+Benchmarks are functions marked with harness.benchmark in bench_*.py files.
+Each parameter value is set up once; the first call is the warm-up and is
+run under tracemalloc for the peak Python-side allocation (numpy arrays
+included, SDL surfaces not). The work is then repeated until --min-time has
+passed, and the best time gives the throughput in the benchmark's unit/s.
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+from harness import ROOT
+
+def discover(pattern=None):
+    """(name, function) for every benchmark whose name contains `pattern`."""
+    found = []
+    for path in sorted(glob.glob(os.path.join(HERE, 'bench_*.py'))):
+        module = importlib.import_module(os.path.basename(path)[:-3])
+        for attr, fn in vars(module).items():
+            name = f"{module.__name__[6:]}.{attr}"
+            if hasattr(fn, 'params') and (pattern is None or pattern in name):
+                found.append((name, fn))
+    return found
+
+def measure(fn, param, min_time=0.5, max_repeats=100):
+    run = fn(param)
+    tracemalloc.start()
+    units = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = []
+    while len(times) < max_repeats and (not times or sum(times) < min_time):
+        start = time.perf_counter()
+        units = run()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {'seconds': best, 'repeats': len(times), 'units': units,
+            'throughput': units / best if best > 0 else float('inf'), 'peak_bytes': peak}
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def run_suite(pattern=None, full=False, min_time=0.5):
+    results = []
+    for name, fn in discover(pattern):
+        for param in (fn.params if full else fn.quick):
+            result = measure(fn, param, min_time)
+            result.update(name=name, param=param, unit=fn.unit)
+            results.append(result)
+            print(f"{name:<32} {param:>12g}  {result['seconds'] * 1000:10.3f} ms  "
+                  f"{result['throughput']:12.4g} {fn.unit}/s  {result['peak_bytes'] / 2 ** 20:9.2f} MiB",
+                  flush=True)
+    return results
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+def compare(old, new, threshold=0.1):
+    """Print new/old throughput and memory ratios for cases present in both."""
+    old = {(r['name'], r['param']): r for r in old}
+    for r in new:
+        before = old.get((r['name'], r['param']))
+        if before is None:
+            continue
+        speedup = r['throughput'] / before['throughput']
+        flag = '' if abs(speedup - 1) < threshold else ('  faster' if speedup > 1 else '  SLOWER')
+        print(f"{r['name']:<32} {r['param']:>12g}  x{speedup:7.3f} throughput  "
+              f"x{r['peak_bytes'] / max(before['peak_bytes'], 1):7.3f} memory{flag}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the simulation benchmarks.")
+    parser.add_argument('-k', dest='pattern', help="only benchmarks whose name contains this")
+    parser.add_argument('--full', action='store_true', help="run every parameter, including slow ones")
+    parser.add_argument('--min-time', type=float, default=0.5, help="seconds to repeat each case for")
+    parser.add_argument('--save', nargs='?', const='', metavar='PATH',
+                        help="write results as JSON (default benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', nargs='+', metavar='JSON',
+                        help="compare OLD.json with NEW.json (or with a fresh run)")
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) == 2:
+        compare(load(args.compare[0]), load(args.compare[1]))
+        return
+    results = run_suite(args.pattern, args.full, args.min_time)
+    report = {'commit': commit(), 'python': platform.python_version(), 'machine': platform.platform(),
+              'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+    if args.save is not None:
+        path = args.save or os.path.join(HERE, 'results', report['commit'] + '.json')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+        print(f"saved {path}")
+    if args.compare:
+        compare(load(args.compare[0]), results)
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,29 @@
+import sys
 import pygame as game
 import math
 import time
+from hud import Hud
+from click_audio import ClickScheduler
+from frame_profiler import profiler_from_env
+from crowd_dynamics import scenarios
+
+PRESET_FILE = "scenarios/blocks.yaml"
+
+# Block properties from a scenario file: python block_simulation.py [scenarios.yaml] [name]
+scenario_file = sys.argv[1] if len(sys.argv) > 1 else PRESET_FILE
+try:
+    scenario = scenarios.select(scenario_file, sys.argv[2] if len(sys.argv) > 2 else "default", kind="blocks")
+    presets = scenarios.presets(PRESET_FILE, kind="blocks")
+except (OSError, ValueError) as error:
+    sys.exit(str(error))
+B1_mass, B1_velocity = scenario.params["m1"], scenario.params["v1"]
+B2_mass, B2_velocity = scenario.params["m2"], scenario.params["v2"]
 
 # Initialize pygame and get screen info
 game.init()
 info = game.display.Info()
 screen_size = (info.current_w, info.current_h)
 
-# Terminal input for customizing block parameters
-print("\nCustomize the block properties:")
-B1_mass = float(input("Enter mass of Block 1 (large block): "))
-B1_velocity = float(input("Enter velocity of Block 1 (e.g., -300): "))
-B2_mass = float(input("Enter mass of Block 2 (small block): "))
-B2_velocity = float(input("Enter velocity of Block 2 (e.g., 0): "))
-
 # Fonts and screen
 game.font.init()
 font = game.font.Font(None, 48)
@@ -23,10 +33,13 @@ screen = game.display.set_mode(screen_size)
 try:
     tick_sound = game.mixer.Sound("tick.wav")
 except:
-    # Create a fallback sound if file not found
-    tick_sound = game.mixer.Sound.fromstring(bytes([128] * 1000), 22050, 8, 1)
+    # Fall back to a synthesized click if the file is not found
+    tick_sound = None
+clicks = ClickScheduler(tick_sound)
 screen.set_alpha(None)
 clock = game.time.Clock()
+hud = Hud(screen)
+profiler = profiler_from_env()
 
 # Global variables
 running = True
@@ -136,12 +149,10 @@ def toggle_slow_motion():
 
 # 6. Collision Sound Pitch Scaling
 def adjust_collision_sound(relative_velocity):
-    """Scale the collision sound pitch based on relative impact velocity."""
-    # Faster collision = higher pitch
+    """Queue a click whose loudness scales with the relative impact velocity."""
     base_volume = 0.7
     volume_scale = min(abs(relative_velocity) / 1000, 1.0)
-    tick_sound.set_volume(base_volume * volume_scale)
-    # In a real implementation, you'd use pygame's sound.set_pitch() if available
+    clicks.hit(base_volume * volume_scale)
     return abs(relative_velocity)
 
 
@@ -163,19 +174,12 @@ def update_graph_data():
 # 8. Physics Preset Scenarios
 def load_preset_scenario(scenario_name):
     """Load preset interesting physics scenarios."""
-    scenarios = {
-        "pi_approximation": {"B1_mass": 100, "B1_velocity": 0, "B2_mass": 1, "B2_velocity": 10},
-        "perfect_transfer": {"B1_mass": 1, "B1_velocity": -5, "B2_mass": 1, "B2_velocity": 0},
-        "giant_mass": {"B1_mass": 10000, "B1_velocity": -2, "B2_mass": 1, "B2_velocity": 0},
-        "both_moving": {"B1_mass": 5, "B1_velocity": -3, "B2_mass": 2, "B2_velocity": 4},
-    }
-    
-    if scenario_name in scenarios:
-        scenario = scenarios[scenario_name]
-        B1.m = scenario["B1_mass"]
-        B1.v1 = scenario["B1_velocity"]
-        B2.m = scenario["B2_mass"]
-        B2.v1 = scenario["B2_velocity"]
+    if scenario_name in presets:
+        scenario = presets[scenario_name].params
+        B1.m = scenario["m1"]
+        B1.v1 = scenario["v1"]
+        B2.m = scenario["m2"]
+        B2.v1 = scenario["v2"]
         # Reset position
         B1.x = screen_size[0] * 0.65
         B2.x = screen_size[0] * 0.4
@@ -194,11 +198,11 @@ def draw_momentum_vectors():
     b1_momentum = B1.m * B1.v1 * momentum_scale
     b1_start_pos = (B1.x + B1.size // 2, B1.y - 20)
     b1_end_pos = (B1.x + B1.size // 2 + b1_momentum, B1.y - 20)
-    game.draw.line(screen, (255, 0, 0), b1_start_pos, b1_end_pos, 3)
+    hud.line((255, 0, 0), b1_start_pos, b1_end_pos, 3)
     # Add arrowhead
     if B1.v1 != 0:
         direction = 1 if B1.v1 > 0 else -1
-        game.draw.polygon(screen, (255, 0, 0), [
+        hud.polygon((255, 0, 0), [
             (b1_end_pos[0], b1_end_pos[1]),
             (b1_end_pos[0] - direction * 10, b1_end_pos[1] - 5),
             (b1_end_pos[0] - direction * 10, b1_end_pos[1] + 5)
@@ -208,11 +212,11 @@ def draw_momentum_vectors():
     b2_momentum = B2.m * B2.v1 * momentum_scale
     b2_start_pos = (B2.x + B2.size // 2, B2.y - 20)
     b2_end_pos = (B2.x + B2.size // 2 + b2_momentum, B2.y - 20)
-    game.draw.line(screen, (0, 255, 0), b2_start_pos, b2_end_pos, 3)
+    hud.line((0, 255, 0), b2_start_pos, b2_end_pos, 3)
     # Add arrowhead
     if B2.v1 != 0:
         direction = 1 if B2.v1 > 0 else -1
-        game.draw.polygon(screen, (0, 255, 0), [
+        hud.polygon((0, 255, 0), [
             (b2_end_pos[0], b2_end_pos[1]),
             (b2_end_pos[0] - direction * 10, b2_end_pos[1] - 5),
             (b2_end_pos[0] - direction * 10, b2_end_pos[1] + 5)
@@ -289,10 +293,10 @@ def draw_graph():
     graph_y = 20
     
     # Draw graph background
-    game.draw.rect(screen, (50, 50, 50), game.Rect(graph_x, graph_y, graph_width, graph_height))
+    hud.rect((50, 50, 50), game.Rect(graph_x, graph_y, graph_width, graph_height))
     
     # Draw axes
-    game.draw.line(screen, white, (graph_x, graph_y + graph_height//2), 
+    hud.line(white, (graph_x, graph_y + graph_height//2), 
                   (graph_x + graph_width, graph_y + graph_height//2), 1)
     
     # Draw Block 1 velocity line
@@ -313,14 +317,14 @@ def draw_graph():
     
     # Draw lines
     if len(points_b1) > 1:
-        game.draw.lines(screen, (255, 0, 0), False, points_b1, 1)
+        hud.lines((255, 0, 0), False, points_b1, 1)
     if len(points_b2) > 1:
-        game.draw.lines(screen, (0, 255, 0), False, points_b2, 1)
+        hud.lines((0, 255, 0), False, points_b2, 1)
     
     # Draw labels
-    screen.blit(small_font.render("Velocity History", True, white), (graph_x, graph_y - 20))
-    screen.blit(small_font.render("Block 1", True, (255, 0, 0)), (graph_x + 10, graph_y + 10))
-    screen.blit(small_font.render("Block 2", True, (0, 255, 0)), (graph_x + 100, graph_y + 10))
+    hud.text(small_font, "Velocity History", (graph_x, graph_y - 20))
+    hud.text(small_font, "Block 1", (graph_x + 10, graph_y + 10), (255, 0, 0))
+    hud.text(small_font, "Block 2", (graph_x + 100, graph_y + 10), (0, 255, 0))
 
 
 # Display controls help
@@ -340,11 +344,11 @@ def draw_controls_help():
         "1-4: Load preset scenarios"
     ]
     
-    game.draw.rect(screen, (40, 40, 40), game.Rect(controls_x - 10, controls_y - 10, 280, 30 + len(controls) * 25))
-    screen.blit(desc_font.render("Keyboard Controls:", True, white), (controls_x, controls_y))
+    hud.rect((40, 40, 40), game.Rect(controls_x - 10, controls_y - 10, 280, 30 + len(controls) * 25))
+    hud.text(desc_font, "Keyboard Controls:", (controls_x, controls_y))
     
     for i, control in enumerate(controls):
-        screen.blit(small_font.render(control, True, white), (controls_x, controls_y + 30 + i * 25))
+        hud.text(small_font, control, (controls_x, controls_y + 30 + i * 25))
 
 
 # Draw collision prediction
@@ -355,69 +359,69 @@ def draw_collision_prediction():
     if next_time is not None and next_time < 100:  # Don't show for far future collisions
         if collision_type == "wall":
             # Highlight wall
-            game.draw.rect(screen, (255, 200, 0), game.Rect(0, B2.y, 5, B2.size), 2)
+            hud.rect((255, 200, 0), game.Rect(0, B2.y, 5, B2.size), 2)
             # Draw time text
-            screen.blit(small_font.render(f"Wall collision in {next_time:.2f}s", True, (255, 200, 0)), 
-                      (20, B2.y - 30))
+            hud.text(small_font, f"Wall collision in {next_time:.2f}s", (20, B2.y - 30), (255, 200, 0))
         elif collision_type == "blocks":
             # Draw line between blocks
             collision_x = B1.x
-            game.draw.line(screen, (255, 200, 0), (collision_x, B1.y - 10), (collision_x, B1.y + B1.size + 10), 2)
+            hud.line((255, 200, 0), (collision_x, B1.y - 10), (collision_x, B1.y + B1.size + 10), 2)
             # Draw time text
-            screen.blit(small_font.render(f"Block collision in {next_time:.2f}s", True, (255, 200, 0)), 
-                      (collision_x - 100, B1.y - 30))
+            hud.text(small_font, f"Block collision in {next_time:.2f}s", (collision_x - 100, B1.y - 30), (255, 200, 0))
 
 
 # Game loop
 while running:
+    profiler.frame("events")
     for event in game.event.get():
         if event.type == game.QUIT:
             running = False
 
     distance = B1.x - (B2.x + B2.size)
-    screen.fill("black")
 
     # Handle user input
+    profiler.mark("input")
     handle_interactive_controls()
     
     # Update graph data
     update_graph_data()
 
     # Display info panel
-    screen.blit(font.render("Collisions: " + str(collision), True, white), (50, 30))
-    screen.blit(font.render("Distance: " + str(int(distance)) + " px", True, white), (50, 80))
+    profiler.mark("hud")
+    hud.text(font, "Collisions: " + str(collision), (50, 30))
+    hud.text(font, "Distance: " + str(int(distance)) + " px", (50, 80))
 
     # Block 1 Info (Big Block)
-    screen.blit(desc_font.render("Block 1 (Big):", True, white), (50, 150))
-    screen.blit(small_font.render("Mass: " + str(round(B1.m, 2)) + " kg", True, white), (60, 180))
-    screen.blit(small_font.render("Velocity: " + str(round(B1.v1, 3)) + " px/s", True, white), (60, 210))
-    screen.blit(small_font.render("Momentum: " + str(round(B1.m * B1.v1, 3)) + " kg·px/s", True, white), (60, 240))
-    screen.blit(small_font.render("KE: " + str(round(0.5 * B1.m * B1.v1**2, 3)) + " J", True, white), (60, 270))
-    screen.blit(small_font.render("X-Position: " + str(round(B1.x, 2)) + " px", True, white), (60, 300))
+    hud.text(desc_font, "Block 1 (Big):", (50, 150))
+    hud.text(small_font, "Mass: " + str(round(B1.m, 2)) + " kg", (60, 180))
+    hud.text(small_font, "Velocity: " + str(round(B1.v1, 3)) + " px/s", (60, 210))
+    hud.text(small_font, "Momentum: " + str(round(B1.m * B1.v1, 3)) + " kg·px/s", (60, 240))
+    hud.text(small_font, "KE: " + str(round(0.5 * B1.m * B1.v1**2, 3)) + " J", (60, 270))
+    hud.text(small_font, "X-Position: " + str(round(B1.x, 2)) + " px", (60, 300))
 
     # Block 2 Info (Small Block)
-    screen.blit(desc_font.render("Block 2 (Small):", True, white), (50, 350))
-    screen.blit(small_font.render("Mass: " + str(round(B2.m, 2)) + " kg", True, white), (60, 380))
-    screen.blit(small_font.render("Velocity: " + str(round(B2.v1, 3)) + " px/s", True, white), (60, 410))
-    screen.blit(small_font.render("Momentum: " + str(round(B2.m * B2.v1, 3)) + " kg·px/s", True, white), (60, 440))
-    screen.blit(small_font.render("KE: " + str(round(0.5 * B2.m * B2.v1**2, 3)) + " J", True, white), (60, 470))
-    screen.blit(small_font.render("X-Position: " + str(round(B2.x, 2)) + " px", True, white), (60, 500))
+    hud.text(desc_font, "Block 2 (Small):", (50, 350))
+    hud.text(small_font, "Mass: " + str(round(B2.m, 2)) + " kg", (60, 380))
+    hud.text(small_font, "Velocity: " + str(round(B2.v1, 3)) + " px/s", (60, 410))
+    hud.text(small_font, "Momentum: " + str(round(B2.m * B2.v1, 3)) + " kg·px/s", (60, 440))
+    hud.text(small_font, "KE: " + str(round(0.5 * B2.m * B2.v1**2, 3)) + " J", (60, 470))
+    hud.text(small_font, "X-Position: " + str(round(B2.x, 2)) + " px", (60, 500))
 
     # Energy conservation info
     initial_energy, current_energy, conservation_percentage = calculate_energy_conservation()
-    screen.blit(desc_font.render("Energy Conservation:", True, white), (50, 550))
-    screen.blit(small_font.render(f"Initial: {round(initial_energy, 2)} J", True, white), (60, 580))
-    screen.blit(small_font.render(f"Current: {round(current_energy, 2)} J", True, white), (60, 610))
+    hud.text(desc_font, "Energy Conservation:", (50, 550))
+    hud.text(small_font, f"Initial: {round(initial_energy, 2)} J", (60, 580))
+    hud.text(small_font, f"Current: {round(current_energy, 2)} J", (60, 610))
     energy_color = (0, 255, 0) if conservation_percentage > 95 else (255, 255, 0) if conservation_percentage > 80 else (255, 0, 0)
-    screen.blit(small_font.render(f"Conservation: {round(conservation_percentage, 2)}%", True, energy_color), (60, 640))
+    hud.text(small_font, f"Conservation: {round(conservation_percentage, 2)}%", (60, 640), energy_color)
 
     # Pi approximation (if applicable)
     pi_approx = calculate_pi_approximation()
     if pi_approx is not None:
-        screen.blit(desc_font.render("Pi Approximation:", True, white), (50, 670))
-        screen.blit(small_font.render(f"π ≈ {round(pi_approx, 6)}", True, (255, 200, 0)), (60, 700))
-        screen.blit(small_font.render(f"Actual π: {round(math.pi, 6)}", True, white), (60, 730))
-        screen.blit(small_font.render(f"Error: {round(abs(pi_approx - math.pi)/math.pi * 100, 4)}%", True, white), (60, 760))
+        hud.text(desc_font, "Pi Approximation:", (50, 670))
+        hud.text(small_font, f"π ≈ {round(pi_approx, 6)}", (60, 700), (255, 200, 0))
+        hud.text(small_font, f"Actual π: {round(math.pi, 6)}", (60, 730))
+        hud.text(small_font, f"Error: {round(abs(pi_approx - math.pi)/math.pi * 100, 4)}%", (60, 760))
 
     # Draw momentum vectors
     draw_momentum_vectors()
@@ -433,23 +437,25 @@ while running:
     
     # Draw slow motion indicator
     if slow_motion:
-        screen.blit(font.render("SLOW MOTION", True, (255, 200, 0)), (screen_size[0]//2 - 100, 30))
+        hud.text(font, "SLOW MOTION", (screen_size[0]//2 - 100, 30), (255, 200, 0))
     
     # Draw gravity indicator
     if gravity_enabled:
-        screen.blit(font.render("GRAVITY ON", True, (0, 200, 255)), (screen_size[0]//2 - 80, 80))
+        hud.text(font, "GRAVITY ON", (screen_size[0]//2 - 80, 80), (0, 200, 255))
 
     # Draw blocks
-    game.draw.rect(screen, white, game.Rect(B1.x, B1.y, B1.size, B1.size))
-    game.draw.rect(screen, white, game.Rect(B2.x, B2.y, B2.size, B2.size))
-    game.draw.line(screen, (0, 255, 0), (0, B1.y + B1.size), (screen_size[0], B1.y + B1.size), 5)
+    hud.rect(white, game.Rect(B1.x, B1.y, B1.size, B1.size))
+    hud.rect(white, game.Rect(B2.x, B2.y, B2.size, B2.size))
+    hud.line((0, 255, 0), (0, B1.y + B1.size), (screen_size[0], B1.y + B1.size), 5)
 
     # Fast-forward convergence hack
+    profiler.mark("physics")
     while abs(B2.v1) > 20000:
         if ((B2.x + B2.size) >= B1.x) and (B1.v1 <= B2.v1):
             collision += 1
             # Store pre-collision velocities for efficiency calculation
             pre_v1, pre_v2 = B1.v1, B2.v1
+            adjust_collision_sound(B2.v1 - B1.v1)
             
             B1.v2 = (((B1.m * B1.v1) + (B2.m * B2.v1)) - (B2.m * (B1.v1 - B2.v1))) / (B1.m + B2.m)
             B2.v2 = B1.v2 + (B1.v1 - B2.v1)
@@ -460,6 +466,7 @@ while running:
             efficiency = calculate_collision_efficiency(pre_v1, pre_v2, B1.v1, B2.v1)
         elif (B2.x <= 0) and (B2.v1 < 0):
             collision += 1
+            adjust_collision_sound(B2.v1)
             B2.v1 *= -1
 
         B1.x += B1.v1 * dt
@@ -482,7 +489,6 @@ while running:
         
         # Adjust sound based on collision velocity
         adjust_collision_sound(relative_velocity)
-        game.mixer.Sound.play(tick_sound)
 
     elif (B2.x <= 0) and (B2.v1 < 0):
         collision += 1
@@ -491,7 +497,6 @@ while running:
         
         # Adjust sound based on collision velocity
         adjust_collision_sound(relative_velocity)
-        game.mixer.Sound.play(tick_sound)
 
     # Apply gravity if enabled
     if gravity_enabled:
@@ -517,8 +522,13 @@ while running:
         B2.x = screen_size[0] - B2.size
         B2.v1 *= -1  # Bounce
 
-    game.display.flip()
+    profiler.mark("draw")
+    profiler.draw(hud)
+    hud.present()
+    profiler.mark("tick")
     current_dt = clock.tick(60) / 1000  # Fixed at 60 FPS for consistency
+    profiler.mark("audio")
+    clicks.flush(current_dt)
     dt = current_dt * (0.1 if slow_motion else 1.0)  # Apply slow motion if enabled
     total_time += dt
 
@@ -0,0 +1,103 @@
+"""Collision event table for collision.html, and a small local server for it.
+
+Between collisions both blocks move at constant speed, so the whole run is
+described by the list of collision events (time, positions, velocities).
+The table (built in crowd_dynamics.blocks) uses the same mulA / mulW velocity
+matrices and the same collision-time formulas as analyzecondition() in the
+page; the page then interpolates between events instead of storing a
+position every timestep.
+
+    python collision_events.py [port]
+
+serves the repository directory (open http://localhost:8000/collision.html)
+plus, for a run given by ?m1=1&m2=100&v1=0&v2=-1:
+
+    GET /info      JSON: collision count, last collision time, page size
+    GET /events    float64 little-endian rows of [t, x1, x2, v1, v2]
+                   (JSON with &format=json); &t0=&t1= limits the rows to a
+                   time range, starting with the last event at or before t0,
+                   and &limit= caps the row count
+    GET /summary   &t0=&t1=&bins= level-of-detail rows of
+                   [t_first, t_last, x1_min, x1_max, x2_min, x2_max, count]
+
+Long runs are generated in pages; only page start states and coarse
+summaries are kept for the whole run, and pages themselves live in an LRU
+cache, so a run with 10^7+ collisions can be scrubbed in bounded memory.
+"""
+import json
+import math
+import os
+import sys
+from functools import lru_cache
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# The engine lives in crowd_dynamics.blocks; these names are re-exported so
+# existing `from collision_events import event_table` code keeps working
+from crowd_dynamics.blocks import (BLOCK, BOX_WIDTH, CACHE_PAGES, MAX_ROWS, PAGE_SIZE, START, WALL, EventStream,
+                                   EventTable, event_table, velocity_matrices)
+
+@lru_cache(maxsize=8)
+def stream(m1, m2, v1, v2):
+    """Shared EventStream per parameter set, for the server."""
+    return EventStream(m1, m2, v1, v2)
+
+# -----------------------------
+# Local HTTP endpoint
+# -----------------------------
+class EventHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path not in ('/info', '/events', '/summary'):
+            return super().do_GET()
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            run = stream(float(query.get('m1', 1)), float(query.get('m2', 100)),
+                         float(query.get('v1', 0)), float(query.get('v2', -1)))
+            t0 = float(query.get('t0', 0))
+            t1 = float(query.get('t1', math.inf))
+            bins = int(query.get('bins', 512))
+            limit = min(int(query.get('limit', MAX_ROWS)), MAX_ROWS)
+        except ValueError as error:
+            self.send_error(400, str(error))
+            return
+
+        headers = {}
+        if url.path == '/info':
+            body, content_type = json.dumps(run.info()).encode(), 'application/json'
+        elif url.path == '/summary':
+            rows = run.summary(t0, min(t1, run.info()['end_time']), max(bins, 1))
+            body, content_type = rows.astype('<f8').tobytes(), 'application/octet-stream'
+        else:
+            index, rows = run.events(t0, t1, limit)
+            headers['X-First-Index'] = str(index)
+            table = EventTable(rows[:, 0], rows[:, 1:3], rows[:, 3:5])
+            if query.get('format') == 'json':
+                body, content_type = table.to_json().encode(), 'application/json'
+            else:
+                body, content_type = table.to_bytes(), 'application/octet-stream'
+            headers['X-Events'] = str(len(table))
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Access-Control-Expose-Headers', 'X-First-Index, X-Events')
+        self.end_headers()
+        self.wfile.write(body)
+
+def serve(port=8000, directory=None):
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    handler = lambda *args, **kwargs: EventHandler(*args, directory=directory, **kwargs)
+    server = ThreadingHTTPServer(('localhost', port), handler)
+    print(f"Serving http://localhost:{port}/collision.html")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8000)
@@ -2,7 +2,11 @@ import pygame
 import math
 import sys
 import random
+import numpy as np
 from pygame.locals import *
+from crowd_dynamics import particles
+from hud import TextCache
+from frame_profiler import profiler_from_env
 
 # Initialize pygame
 pygame.init()
@@ -35,89 +39,17 @@ pygame.display.set_caption("Musical Harmonics with Collision")
 font = pygame.font.SysFont('Arial', 20)
 title_font = pygame.font.SysFont('Arial', 32)
 
-class Particle:
+profiler = profiler_from_env()
+
+class Particle(particles.Particle):
+    width, height = WIDTH, HEIGHT
+
     def __init__(self, x, y, radius=10):
-        self.x = x
-        self.y = y
-        self.radius = radius
         self.color = random.choice(HIGHLIGHT_COLORS)
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
-        self.mass = self.radius ** 2  # Mass proportional to area
-        
-    def move(self):
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Bounce off walls
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.vx = -self.vx
-        elif self.x + self.radius > WIDTH:
-            self.x = WIDTH - self.radius
-            self.vx = -self.vx
-            
-        if self.y - self.radius < 0:
-            self.y = self.radius
-            self.vy = -self.vy
-        elif self.y + self.radius > HEIGHT:
-            self.y = HEIGHT - self.radius
-            self.vy = -self.vy
-    
+        super().__init__(x, y, radius)
+
     def draw(self, surface):
         pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
-        
-    def distance(self, other):
-        dx = self.x - other.x
-        dy = self.y - other.y
-        return math.sqrt(dx**2 + dy**2)
-    
-    def check_collision(self, other):
-        distance = self.distance(other)
-        if distance < self.radius + other.radius:
-            return True
-        return False
-    
-    def resolve_collision(self, other):
-        # Calculate direction vector
-        dx = other.x - self.x
-        dy = other.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-        
-        # Normalize direction vector
-        if distance == 0:  # Avoid division by zero
-            dx, dy = 1, 0
-        else:
-            dx, dy = dx/distance, dy/distance
-            
-        # Calculate relative velocity
-        dvx = self.vx - other.vx
-        dvy = self.vy - other.vy
-        
-        # Calculate velocity along the normal direction
-        velocity_along_normal = dvx * dx + dvy * dy
-        
-        # If particles are moving away from each other, no collision response
-        if velocity_along_normal > 0:
-            return
-        
-        # Calculate impulse scalar
-        restitution = 1.0  # Perfect elasticity
-        impulse_scalar = -(1 + restitution) * velocity_along_normal
-        impulse_scalar /= 1/self.mass + 1/other.mass
-        
-        # Apply impulse
-        self.vx -= impulse_scalar * dx / self.mass
-        self.vy -= impulse_scalar * dy / self.mass
-        other.vx += impulse_scalar * dx / other.mass
-        other.vy += impulse_scalar * dy / other.mass
-        
-        # Separate the particles to avoid sticking
-        overlap = (self.radius + other.radius - distance) / 2.0
-        self.x -= overlap * dx
-        self.y -= overlap * dy
-        other.x += overlap * dx
-        other.y += overlap * dy
 
 class HarmonicVisualizer:
     def __init__(self):
@@ -134,6 +66,13 @@ class HarmonicVisualizer:
         self.particles = []
         self.num_particles = 40
         self.create_particles()
+
+        # Harmonic mode caches: point tables per num_points, the circle/points/
+        # labels/instructions layer and that layer with the current chords
+        self.text = TextCache()
+        self.point_tables = {}
+        self.static_layer = (None, None)
+        self.chord_layer = (None, None)
         
     def create_particles(self):
         self.particles = []
@@ -145,15 +84,7 @@ class HarmonicVisualizer:
             self.particles.append(Particle(x, y, radius))
     
     def update_collision(self):
-        # Move all particles
-        for particle in self.particles:
-            particle.move()
-        
-        # Check for collisions
-        for i in range(len(self.particles)):
-            for j in range(i+1, len(self.particles)):
-                if self.particles[i].check_collision(self.particles[j]):
-                    self.particles[i].resolve_collision(self.particles[j])
+        particles.step(self.particles)
     
     def draw_collision(self):
         screen.fill(BACKGROUND)
@@ -181,17 +112,21 @@ class HarmonicVisualizer:
             text_surf = font.render(text, True, TEXT_COLOR)
             screen.blit(text_surf, (20, HEIGHT - 150 + i * 25))
     
-    def draw_harmonic(self):
-        screen.fill(BACKGROUND)
-        
-        # Draw title
-        if self.animate:
-            title_text = f"Musical Harmonics - Ratio: 1:{self.animation_value:.2f}"
-        else:
-            title_text = f"Musical Harmonics - Ratio: 1:{self.current_multiplier}"
-        title_surf = title_font.render(title_text, True, TEXT_COLOR)
-        screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, 30))
-        
+    def point_table(self, num_points):
+        """Point and label centre positions around the circle, cached per num_points."""
+        if num_points not in self.point_tables:
+            angle = 2 * np.pi * np.arange(num_points) / num_points
+            unit = np.column_stack([np.cos(angle), np.sin(angle)])
+            self.point_tables[num_points] = (CENTER + RADIUS * unit, CENTER + (RADIUS + 20) * unit)
+        return self.point_tables[num_points]
+
+    def draw_static(self):
+        """Background, instructions, circle, points and labels for the current num_points."""
+        if self.static_layer[0] == self.num_points:
+            return self.static_layer[1]
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        layer.fill(BACKGROUND)
+
         # Draw instructions
         instructions = [
             "Controls:",
@@ -202,46 +137,61 @@ class HarmonicVisualizer:
             "A: Toggle animation",
             "Left/Right: Adjust animation speed"
         ]
-        
+
         for i, text in enumerate(instructions):
-            text_surf = font.render(text, True, TEXT_COLOR)
-            screen.blit(text_surf, (20, HEIGHT - 170 + i * 25))
-        
+            layer.blit(self.text.render(font, text, TEXT_COLOR), (20, HEIGHT - 170 + i * 25))
+
         # Draw circle
-        pygame.draw.circle(screen, LINE_COLOR, CENTER, RADIUS, 1)
-        
+        pygame.draw.circle(layer, LINE_COLOR, CENTER, RADIUS, 1)
+
         # Draw points around the circle
-        points = []
-        for i in range(self.num_points):
-            angle = 2 * math.pi * i / self.num_points
-            x = CENTER[0] + RADIUS * math.cos(angle)
-            y = CENTER[1] + RADIUS * math.sin(angle)
-            points.append((x, y))
-            pygame.draw.circle(screen, LINE_COLOR, (int(x), int(y)), 3)
-            
+        points, label_centers = self.point_table(self.num_points)
+        for i, (x, y) in enumerate(points.tolist()):
+            pygame.draw.circle(layer, LINE_COLOR, (int(x), int(y)), 3)
+
             # Draw point number
             if self.num_points <= 60:  # Only show numbers if not too crowded
-                num_text = font.render(str(i), True, TEXT_COLOR)
-                text_x = CENTER[0] + (RADIUS + 20) * math.cos(angle)
-                text_y = CENTER[1] + (RADIUS + 20) * math.sin(angle)
-                screen.blit(num_text, (text_x - num_text.get_width() // 2, text_y - num_text.get_height() // 2))
-        
-        # Draw lines between points based on the multiplier
+                num_text = self.text.render(font, str(i), TEXT_COLOR)
+                text_x, text_y = label_centers[i]
+                layer.blit(num_text, (text_x - num_text.get_width() // 2, text_y - num_text.get_height() // 2))
+
+        self.static_layer = (self.num_points, layer)
+        return layer
+
+    def draw_chords(self, multiplier):
+        """Static layer with the chords i -> i * multiplier (mod num_points) drawn on top.
+
+        Chords only depend on int(multiplier), so while animating the layer is
+        rebuilt once per whole step rather than every frame.
+        """
+        key = (self.num_points, int(multiplier))
+        if self.chord_layer[0] == key:
+            return self.chord_layer[1]
+        layer = self.draw_static().copy()
+        points, _ = self.point_table(self.num_points)
+        index = np.arange(self.num_points)
+        ends = points[(index * int(multiplier)) % self.num_points]
+        # Use a color based on the starting point for visual interest
+        for i, (start_point, end_point) in enumerate(zip(points.tolist(), ends.tolist())):
+            pygame.draw.line(layer, HIGHLIGHT_COLORS[i % len(HIGHLIGHT_COLORS)], start_point, end_point, 1)
+        self.chord_layer = (key, layer)
+        return layer
+
+    def draw_harmonic(self):
+        multiplier = self.animation_value if self.animate else self.current_multiplier
         if self.show_lines:
-            multiplier = self.current_multiplier
-            if self.animate:
-                multiplier = self.animation_value
-                
-            for i in range(self.num_points):
-                start_point = points[i]
-                # Calculate the destination point using the multiplier
-                dest_index = (i * int(multiplier)) % self.num_points
-                end_point = points[dest_index]
-                
-                # Use a color based on the starting point for visual interest
-                color_index = i % len(HIGHLIGHT_COLORS)
-                pygame.draw.line(screen, HIGHLIGHT_COLORS[color_index], start_point, end_point, 1)
-    
+            screen.blit(self.draw_chords(multiplier), (0, 0))
+        else:
+            screen.blit(self.draw_static(), (0, 0))
+
+        # Draw title
+        if self.animate:
+            title_text = f"Musical Harmonics - Ratio: 1:{self.animation_value:.2f}"
+        else:
+            title_text = f"Musical Harmonics - Ratio: 1:{self.current_multiplier}"
+        title_surf = self.text.render(title_font, title_text, TEXT_COLOR)
+        screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, 30))
+
     def draw(self):
         if self.mode == "harmonic":
             self.draw_harmonic()
@@ -249,6 +199,7 @@ class HarmonicVisualizer:
             self.draw_collision()
         
         # Update the display
+        profiler.draw(screen)
         pygame.display.flip()
     
     def update_animation(self):
@@ -322,18 +273,22 @@ def main():
     running = True
     while running:
         # Handle events
+        profiler.frame("events")
         for event in pygame.event.get():
             if event.type == QUIT:
                 running = False
             visualizer.handle_events(event)
         
         # Update animation/physics if active
+        profiler.mark("physics")
         visualizer.update_animation()
         
         # Draw everything
+        profiler.mark("draw")
         visualizer.draw()
         
         # Cap the frame rate
+        profiler.mark("tick")
         clock.tick(60)
     
     pygame.quit()
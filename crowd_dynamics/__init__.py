@@ -0,0 +1,52 @@
+"""Simulation cores of the demos, importable without opening a window.
+
+    from crowd_dynamics import event_table, Circuit, TuringMachine
+
+Nothing here imports pygame, Qt, tkinter or matplotlib. Submodules are only
+loaded when one of their names is first used, so `import crowd_dynamics`
+costs next to nothing and a worker process pays only for what it touches:
+
+    blocks      two blocks and a wall: exact collisions (main.py) numpy
+    particles   elastic disc collisions (computePI.py)            stdlib
+    nbody       direct-sum gravity (gravitySImulator.py)          numpy
+    circuits    DC / Monte Carlo / transient circuit analysis     numpy, scipy
+    turing      Turing machine engine and trace recorder          stdlib
+    ode         Lorenz system                                     numpy (scipy on solve)
+    springs     linear spring networks                            numpy, scipy
+    waves       2D wave equation on a grid                        numpy
+    scenarios   YAML scenario files for the above                 numpy, yaml
+
+main.py, computePI.py, turing_machine.py, export_video.py and the
+gravitySImulator, mainSimulator, lorrentz, springMass and waveField2D
+scripts run on these modules. block_simulation.py keeps its own per-frame block physics,
+since its gravity and live mass/velocity controls have no counterpart here.
+"""
+import importlib
+
+_EXPORTS = {
+    'blocks': ['EventStream', 'EventTable', 'SlidingBlocks', 'event_table', 'velocity_matrices'],
+    'particles': ['Particle'],
+    'nbody': ['GravitySystem'],
+    'circuits': ['Capacitor', 'Circuit', 'Inductor', 'MonteCarloResult', 'Resistor', 'TransientResult',
+                 'VoltageSource'],
+    'turing': ['MacroMachine', 'Tape', 'TraceRecorder', 'TuringMachine', 'check_macro', 'parse_transitions'],
+    'ode': ['lorenz', 'lorenz_trajectory'],
+    'springs': ['SpringNetwork', 'oscillator_displacement'],
+    'waves': ['PointSource', 'WaveField'],
+    'scenarios': ['Scenario'],
+}
+_LOCATION = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_EXPORTS) + sorted(_LOCATION)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name in _LOCATION:
+        value = getattr(importlib.import_module(f'{__name__}.{_LOCATION[name]}'), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,325 @@
+"""Two blocks and a wall: exact collision events.
+
+Between collisions both blocks move at constant speed, so a whole run is
+described by its list of collision events (time, positions, velocities).
+event_table() builds that list with the same mulA / mulW velocity matrices
+and collision-time formulas as analyzecondition() in collision.html;
+EventStream generates it in pages on demand for runs with 10^7+ collisions.
+SlidingBlocks is the pixel-space setup of main.py, stepped event by event.
+"""
+import json
+import math
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+import numpy as np
+
+BOX_WIDTH = 1.0
+WALL = 0.0
+START = (5.0, 10.0)
+PAGE_SIZE = 16384       # events per page
+CACHE_PAGES = 64        # pages kept in each run's LRU cache
+BLOCK = 256             # events per level-of-detail summary row
+MAX_ROWS = 1 << 20      # rows per /events response
+
+def velocity_matrices(m1, m2):
+    """mulA (block-block collision) and mulW (block 1 off the wall)."""
+    msum = m1 + m2
+    A = np.array([[(m1 - m2) / msum, 2 * m2 / msum],
+                  [2 * m1 / msum, (m2 - m1) / msum]])
+    W = np.array([[-1.0, 0.0], [0.0, 1.0]])
+    return A, W
+
+def _div(a, b):
+    # JavaScript division: x/0 is +-Infinity and 0/0 is NaN
+    if b == 0:
+        return math.copysign(math.inf, a) if a else math.nan
+    return a / b
+
+def _moving_apart(v1, v2):
+    # Negation of checkspeeds() in the page
+    return v1 >= 0 and v2 >= 0 and abs(v2) >= abs(v1)
+
+class EventTable:
+    """Collision events of one run: row i holds the state just after event
+    i (row 0 is the initial state)."""
+
+    def __init__(self, times, positions, velocities):
+        self.times = times
+        self.positions = positions
+        self.velocities = velocities
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def collisions(self):
+        return len(self.times) - 1
+
+    def at(self, t):
+        """Positions at time(s) t, by binary search over the event times."""
+        t = np.asarray(t, dtype=float)
+        i = np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self.times) - 1)
+        return self.positions[i] + self.velocities[i] * (t - self.times[i])[..., None]
+
+    def rows(self):
+        return np.column_stack([self.times, self.positions, self.velocities])
+
+    def to_bytes(self):
+        return self.rows().astype('<f8').tobytes()
+
+    def to_json(self):
+        return json.dumps({
+            'times': self.times.tolist(),
+            'positions': self.positions.tolist(),
+            'velocities': self.velocities.tolist(),
+        })
+
+def _initial_state(v1, v2, start, box_width, wall):
+    """(t, x1, x2, v1, v2, next collision kind) at time 0."""
+    d1, d2 = start
+    block_time = _div(d2 - d1 - 2 * box_width, v1 - v2)
+    wall_time = _div(box_width + wall - d1, v1)
+    if block_time > 0 and (not wall_time > 0 or block_time <= wall_time):
+        kind = 'A'
+    elif wall_time > 0:
+        kind = 'W'
+    else:
+        kind = None  # both blocks are moving away already
+    return 0.0, d1, d2, v1, v2, kind
+
+def _collide(state, count, A, box_width, wall):
+    """Up to `count` further events from `state`; returns the event rows and
+    the state after the last one (kind None once the run is over)."""
+    (a11, a12), (a21, a22) = np.asarray(A).tolist()
+    time, d1, d2, v1, v2, kind = state
+    rows = []
+    append = rows.append
+    gap = 2 * box_width
+    contact = wall + box_width
+    while count and kind and not (v1 >= 0 and v2 >= 0 and abs(v2) >= abs(v1)):
+        # Plain division here (this loop dominates long runs); a zero
+        # denominator raises before anything is assigned, and that step is
+        # redone with the JavaScript semantics of _div
+        try:
+            if kind == 'A':
+                time += (d1 - d2 + gap) / (v2 - v1)
+                hit = d2 + (d1 + gap - d2) * v2 / (v2 - v1)
+                d1, d2 = round(hit - gap, 10), round(hit, 10)
+                v1, v2 = a11 * v1 + a12 * v2, a21 * v1 + a22 * v2
+                kind = 'W'
+            else:
+                time += (contact - d1) / v1
+                d1, d2 = contact, d2 + (contact - d1) * v2 / v1
+                v1 = -v1
+                kind = 'A'
+        except ZeroDivisionError:
+            time, d1, d2, v1, v2, kind = _step((time, d1, d2, v1, v2, kind), A, box_width, wall)
+        append((time, d1, d2, v1, v2))
+        count -= 1
+    if kind and _moving_apart(v1, v2):
+        kind = None
+    return rows, (time, d1, d2, v1, v2, kind)
+
+def _step(state, A, box_width, wall):
+    """One collision with JavaScript division semantics."""
+    (a11, a12), (a21, a22) = A
+    time, d1, d2, v1, v2, kind = state
+    if kind == 'A':
+        time += _div(d1 - d2 + 2 * box_width, v2 - v1)
+        hit = d2 + _div((d1 + 2 * box_width - d2) * v2, v2 - v1)
+        d1, d2 = round(hit - 2 * box_width, 10), round(hit, 10)
+        v1, v2 = a11 * v1 + a12 * v2, a21 * v1 + a22 * v2
+        return time, d1, d2, v1, v2, 'W'
+    time += _div(wall - d1 + box_width, v1)
+    d1, d2 = wall + box_width, d2 + _div((wall - d1 + box_width) * v2, v1)
+    return time, d1, d2, -v1, v2, 'A'
+
+def event_table(m1=1.0, m2=100.0, v1=0.0, v2=-1.0, start=START, box_width=BOX_WIDTH,
+                wall=WALL, max_events=10 ** 8):
+    """Run the collision sequence of analyzecondition() until the blocks
+    separate for good (or max_events collisions)."""
+    state = _initial_state(v1, v2, start, box_width, wall)
+    rows, _ = _collide(state, max_events, velocity_matrices(m1, m2)[0], box_width, wall)
+    rows = np.array([state[:5]] + rows)
+    return EventTable(rows[:, 0], rows[:, 1:3], rows[:, 3:5])
+
+# -----------------------------
+# Paged access for long runs
+# -----------------------------
+class EventStream:
+    """Event rows of one run, generated page by page on demand.
+
+    Page k holds rows [k * page_size, (k + 1) * page_size) of the event
+    table (row 0 is the initial state). The state at the start of every
+    page generated so far is kept, so an evicted page is rebuilt from its
+    own start instead of from t = 0, together with one min/max summary row
+    per BLOCK events for zoomed-out views.
+    """
+
+    def __init__(self, m1=1.0, m2=100.0, v1=0.0, v2=-1.0, start=START, box_width=BOX_WIDTH,
+                 wall=WALL, page_size=PAGE_SIZE, cache_pages=CACHE_PAGES):
+        self.A = velocity_matrices(m1, m2)[0]
+        self.box_width = box_width
+        self.wall = wall
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self.starts = [_initial_state(v1, v2, start, box_width, wall)]
+        self.start_times = [0.0]
+        self.blocks = []
+        self.finished = False
+        self.pages = OrderedDict()
+        self.lock = threading.RLock()
+
+    def _build(self, k):
+        state = self.starts[k]
+        rows, end = _collide(state, self.page_size - 1, self.A, self.box_width, self.wall)
+        page = np.array([state[:5]] + rows)
+        if k == len(self.starts) - 1:
+            # First time through this page: record where the next one starts
+            self.blocks.append(self._summarise(page))
+            rows, following = _collide(end, 1, self.A, self.box_width, self.wall)
+            if rows:
+                self.starts.append(following)
+                self.start_times.append(following[0])
+            else:
+                self.finished = True
+        return page
+
+    @staticmethod
+    def _summarise(page):
+        edges = np.arange(0, len(page), BLOCK)
+        reduce = lambda f, col: f.reduceat(page[:, col], edges)
+        last = np.append(edges[1:], len(page)) - 1
+        return np.column_stack([page[edges, 0], page[last, 0],
+                                reduce(np.minimum, 1), reduce(np.maximum, 1),
+                                reduce(np.minimum, 2), reduce(np.maximum, 2),
+                                last - edges + 1])
+
+    def page(self, k):
+        """Rows of page k (LRU cached)."""
+        with self.lock:
+            if k in self.pages:
+                self.pages.move_to_end(k)
+                return self.pages[k]
+            while len(self.starts) <= k:
+                if self.finished:
+                    raise IndexError(f"Run has only {len(self.starts)} pages")
+                self.page(len(self.starts) - 1)
+            page = self._build(k)
+            self.pages[k] = page
+            if len(self.pages) > self.cache_pages:
+                self.pages.popitem(last=False)
+            return page
+
+    def _page_at(self, t):
+        """Index of the page holding the last event at or before time t."""
+        with self.lock:
+            while not self.finished and self.start_times[-1] <= t:
+                self.page(len(self.starts) - 1)
+            return max(bisect_right(self.start_times, t) - 1, 0)
+
+    def info(self):
+        """Generates the whole run (once) and describes it."""
+        last = self._page_at(math.inf)
+        page = self.page(last)
+        return {
+            'collisions': last * self.page_size + len(page) - 1,
+            'end_time': float(page[-1, 0]),
+            'pages': last + 1,
+            'page_size': self.page_size,
+        }
+
+    def events(self, t0=0.0, t1=math.inf, limit=MAX_ROWS):
+        """(index of the first row, rows) from the last event at or before
+        t0 through the last event at or before t1, at most `limit` rows."""
+        k = self._page_at(t0)
+        page = self.page(k)
+        first = max(np.searchsorted(page[:, 0], t0, side='right') - 1, 0)
+        index = k * self.page_size + first
+        parts = [page[first:]]
+        count = len(parts[0])
+        while page[-1, 0] <= t1 and count < limit:
+            try:
+                page = self.page(k + 1)
+            except IndexError:
+                break
+            k += 1
+            parts.append(page)
+            count += len(page)
+        rows = np.concatenate(parts)
+        end = np.searchsorted(rows[:, 0], t1, side='right')
+        return index, rows[:max(min(end, limit), 1)]
+
+    def summary(self, t0, t1, bins):
+        """Per time bin: first/last event time, min/max of both positions
+        and the event count. Empty bins are NaN with a count of 0."""
+        k0, k1 = self._page_at(t0), self._page_at(t1)
+        rows = np.concatenate([self.blocks[k] for k in range(k0, k1 + 1)])
+        if rows[:, 6].sum() <= bins * BLOCK:
+            # Zoomed in far enough to summarise the events themselves
+            _, events = self.events(t0, t1)
+            rows = np.column_stack([events[:, 0], events[:, 0], events[:, 1], events[:, 1],
+                                    events[:, 2], events[:, 2], np.ones(len(events))])
+        edges = np.linspace(t0, t1, bins + 1)
+        which = np.clip(np.searchsorted(edges, rows[:, 0], side='right') - 1, 0, bins - 1)
+        keep = (rows[:, 1] >= t0) & (rows[:, 0] <= t1)
+        rows, which = rows[keep], which[keep]
+
+        out = np.full((bins, 7), np.nan)
+        out[:, 6] = 0
+        np.add.at(out[:, 6], which, rows[:, 6])
+        for col, f in ((0, np.fmin), (1, np.fmax), (2, np.fmin), (3, np.fmax), (4, np.fmin), (5, np.fmax)):
+            f.at(out[:, col], which, rows[:, col])
+        return out
+
+# -----------------------------
+# Pixel-space blocks (main.py)
+# -----------------------------
+class SlidingBlocks:
+    """The two blocks and wall from main.py, stepped event by event.
+
+    Collisions are found exactly (time to the next contact) instead of by
+    overlap tests each frame, so the result doesn't depend on the frame rate.
+    Positions are pixels on a `width` x `height` screen.
+    """
+
+    def __init__(self, m1=100.0, v1=-300.0, m2=1.0, v2=0.0, width=1920, height=1080):
+        self.m1, self.v1, self.size1 = m1, v1, 200
+        self.m2, self.v2, self.size2 = m2, v2, 100
+        self.x1, self.y1 = width * 0.65, height * 0.5
+        self.x2, self.y2 = width * 0.4, height * 0.5 + (self.size1 - 100)
+        self.collisions = 0
+
+    def step(self, dt, hit=None):
+        """Advance dt seconds; hit(speed) is called for every collision with
+        the closing speed just before it."""
+        remaining = dt
+        while True:
+            t_wall = -self.x2 / self.v2 if self.v2 < 0 else math.inf
+            gap = max(self.x1 - (self.x2 + self.size2), 0.0)
+            t_block = gap / (self.v2 - self.v1) if self.v2 > self.v1 else math.inf
+            t = min(t_wall, t_block)
+            if t > remaining:
+                break
+            self.x1 += self.v1 * t
+            self.x2 += self.v2 * t
+            remaining -= t
+            self.collisions += 1
+            if t_block <= t_wall:
+                if hit is not None:
+                    hit(self.v2 - self.v1)
+                v1 = (self.m1 * self.v1 + self.m2 * self.v2 - self.m2 * (self.v1 - self.v2)) / (self.m1 + self.m2)
+                self.v2 = v1 + (self.v1 - self.v2)
+                self.v1 = v1
+            else:
+                if hit is not None:
+                    hit(-self.v2)
+                self.x2 = 0.0
+                self.v2 = -self.v2
+        self.x1 += self.v1 * remaining
+        self.x2 += self.v2 * remaining
+
+    def snapshot(self):
+        return (self.x1, self.v1, self.x2, self.v2, self.collisions)
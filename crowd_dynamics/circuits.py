@@ -0,0 +1,514 @@
+"""Circuit engine behind physics_projects/mainSimulator.py: modified nodal
+analysis for DC operating points, Monte Carlo tolerance sweeps and adaptive
+transient runs. numpy and scipy only; the Qt window imports this module.
+"""
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.linalg import splu
+
+# -----------------------------
+# Basic Circuit Elements
+# -----------------------------
+class Resistor:
+    def __init__(self, n1, n2, resistance):
+        self.n1 = n1
+        self.n2 = n2
+        self.resistance = resistance
+
+class VoltageSource:
+    def __init__(self, n1, n2, voltage, waveform=None):
+        self.n1 = n1
+        self.n2 = n2
+        self.voltage = voltage
+        # Optional callable t -> volts used by transient analysis instead of `voltage`
+        self.waveform = waveform
+
+class Capacitor:
+    def __init__(self, n1, n2, capacitance):
+        self.n1 = n1
+        self.n2 = n2
+        self.capacitance = capacitance
+
+class Inductor:
+    def __init__(self, n1, n2, inductance):
+        self.n1 = n1
+        self.n2 = n2
+        self.inductance = inductance
+
+# -----------------------------
+# Circuit Simulation Logic
+# -----------------------------
+class Circuit:
+    # Resistor edits are folded into the cached sparse LU factorization as
+    # low-rank (Woodbury) corrections until this many have piled up, then we
+    # refactor.
+    MAX_LOW_RANK_UPDATES = 16
+    # Monte Carlo stacks dense systems (8 * n^2 bytes each) up to this many
+    # unknowns and factors each sample's sparse matrix above it; on resistor
+    # grids the two cost the same at about 200.
+    MAX_DENSE_SAMPLE_NODES = 200
+
+    def __init__(self):
+        self.resistors = []
+        self.voltage_sources = []
+        self.capacitors = []
+        self.inductors = []
+        self._invalidate()
+
+    def add_resistor(self, r):
+        self.resistors.append(r)
+        self._invalidate()
+
+    def add_voltage_source(self, v):
+        self.voltage_sources.append(v)
+        self._invalidate()
+
+    def add_capacitor(self, c):
+        self.capacitors.append(c)
+
+    def add_inductor(self, l):
+        self.inductors.append(l)
+
+    def _invalidate(self):
+        """Drop the cached node map and factorization after a topology change."""
+        self._node_map = None
+        self._ground = None
+        self._lu = None
+        self._g_base = None
+        self._update_cols = {}
+        self._pattern = None
+
+    def _assemble(self, ground='0'):
+        """Number the nodes and cache the index arrays used to stamp the matrix.
+
+        `ground` (or the first node, if there is no such node) is pinned at
+        0 V; the other nodes are numbered 0..size-1 and ground gets `size`,
+        an extra row/column that is dropped from the matrix.
+        """
+        nodes = {}
+        for r in self.resistors:
+            nodes.setdefault(r.n1)
+            nodes.setdefault(r.n2)
+        for v in self.voltage_sources:
+            nodes.setdefault(v.n1)
+            nodes.setdefault(v.n2)
+        self._ground = ground
+        if ground not in nodes:
+            ground = next(iter(nodes), ground)
+
+        self._size = size = max(len(nodes) - 1, 0)
+        numbers = iter(range(size))
+        self._node_map = {n: size if n == ground else next(numbers) for n in nodes}
+        node_map = self._node_map
+        self._r_i = np.array([node_map[r.n1] for r in self.resistors], dtype=int)
+        self._r_j = np.array([node_map[r.n2] for r in self.resistors], dtype=int)
+        self._v_i = np.array([node_map[v.n1] for v in self.voltage_sources], dtype=int)
+        self._v_j = np.array([node_map[v.n2] for v in self.voltage_sources], dtype=int)
+
+    def _stamps(self):
+        """(rows, cols, resistor index, sign) of every entry in the reduced matrix."""
+        keep = np.flatnonzero(self._r_i != self._r_j)
+        i, j = self._r_i[keep], self._r_j[keep]
+        rows = np.concatenate([i, j, i, j])
+        cols = np.concatenate([i, j, j, i])
+        which = np.tile(keep, 4)
+        sign = np.repeat([1.0, 1.0, -1.0, -1.0], len(keep))
+        inside = (rows < self._size) & (cols < self._size)
+        return rows[inside], cols[inside], which[inside], sign[inside]
+
+    def _conductance_matrix(self, g):
+        keys, pattern = self._stamp_pattern()
+        return _csc(keys, self._size, pattern @ g)
+
+    def _rhs(self):
+        b = np.zeros(self._size + 1)
+        volts = np.array([v.voltage for v in self.voltage_sources], dtype=float)
+        np.add.at(b, self._v_i, volts)
+        np.add.at(b, self._v_j, -volts)
+        return b[:self._size]
+
+    def _factor(self, g):
+        self._lu = None
+        self._update_cols = {}
+        try:
+            lu = splu(self._conductance_matrix(g))
+        except RuntimeError:
+            # SuperLU's "Factor is exactly singular", e.g. a floating subcircuit
+            raise np.linalg.LinAlgError("Singular matrix") from None
+        self._lu = lu
+        self._g_base = g.copy()
+
+    def _lu_solve(self, b):
+        """A0^-1 b with a zero row appended for the ground node."""
+        x = self._lu.solve(b)
+        if not np.all(np.isfinite(x)):
+            raise np.linalg.LinAlgError("Singular matrix")
+        return np.concatenate([x, np.zeros((1,) + x.shape[1:])])
+
+    def _low_rank_solve(self, idx, dg, x):
+        """Correct x = A0^-1 b for the conductance changes dg on resistors idx."""
+        missing = [k for k in idx if k not in self._update_cols]
+        if missing:
+            missing = np.array(missing)
+            U = np.zeros((self._size + 1, len(missing)))
+            cols = np.arange(len(missing))
+            U[self._r_i[missing], cols] = 1.0
+            U[self._r_j[missing], cols] = -1.0
+            Z = self._lu_solve(U[:self._size])
+            for c, k in enumerate(missing):
+                self._update_cols[k] = Z[:, c]
+
+        Z = np.column_stack([self._update_cols[k] for k in idx])
+        ri, rj = self._r_i[idx], self._r_j[idx]
+        S = np.diag(1 / dg) + (Z[ri] - Z[rj])
+        y = np.linalg.solve(S, x[ri] - x[rj])
+        return x - Z @ y
+
+    def _solve(self, g, b):
+        if self._lu is None:
+            self._factor(g)
+
+        changed = np.flatnonzero(g != self._g_base)
+        changed = changed[self._r_i[changed] != self._r_j[changed]]
+        if len(changed) > self.MAX_LOW_RANK_UPDATES:
+            self._factor(g)
+            changed = changed[:0]
+
+        x = self._lu_solve(b)
+        if len(changed):
+            try:
+                x = self._low_rank_solve(changed, g[changed] - self._g_base[changed], x)
+            except np.linalg.LinAlgError:
+                self._factor(g)
+                x = self._lu_solve(b)
+        return x
+
+    def _prepare(self, ground):
+        if self._node_map is None or self._ground != ground:
+            self._invalidate()
+            self._assemble(ground)
+
+    def solve_dc(self, ground='0'):
+        """Solve the node voltages against `ground` (or the first node if the
+        circuit has no such node), reusing the last sparse factorization when
+        only component values (not connections) changed since the previous call."""
+        self._prepare(ground)
+
+        g = np.array([1 / r.resistance for r in self.resistors], dtype=float)
+        try:
+            x = self._solve(g, self._rhs())
+            return dict(zip(self._node_map, np.round(x[list(self._node_map.values())], 2).tolist()))
+        except np.linalg.LinAlgError:
+            return "Circuit cannot be solved"
+
+    def _stamp_pattern(self):
+        """(keys, pattern): the matrix's nonzeros as flat col * size + row
+        positions in CSC order, and the sparse map from resistor conductances
+        to their values."""
+        if self._pattern is None:
+            rows, cols, which, sign = self._stamps()
+            keys, position = np.unique(cols * self._size + rows, return_inverse=True)
+            self._pattern = keys, csr_matrix((sign, (position, which)), shape=(len(keys), len(self.resistors)))
+        return self._pattern
+
+    def monte_carlo(self, samples, tolerance=0.05, distribution='uniform', seed=None,
+                    processes=None, chunk_bytes=64 * 2 ** 20, dense=None, ground='0'):
+        """Solve the DC circuit for `samples` randomized sets of resistor values.
+
+        Each resistance deviates from its nominal value by up to +/-tolerance
+        ('uniform') or with tolerance as the 3-sigma width ('normal'). The
+        stamp pattern is built once. Circuits with up to MAX_DENSE_SAMPLE_NODES
+        unknowns are solved as stacked dense systems, larger ones with one
+        sparse LU per sample; `dense` forces either path, and dense=True raises
+        ValueError above the cap or when one matrix does not fit in
+        `chunk_bytes`. Samples go in chunks of about `chunk_bytes`, optionally
+        across `processes` workers. Samples whose matrix is singular come back
+        as NaN rows.
+        """
+        self._prepare(ground)
+
+        rng = np.random.default_rng(seed)
+        nominal = np.array([r.resistance for r in self.resistors], dtype=float)
+        if distribution == 'uniform':
+            spread = rng.uniform(-tolerance, tolerance, (samples, len(nominal)))
+        elif distribution == 'normal':
+            spread = rng.normal(0.0, tolerance / 3, (samples, len(nominal)))
+        else:
+            raise ValueError(f"Unknown distribution: {distribution}")
+        resistances = nominal * (1 + spread)
+
+        n = self._size
+        if dense is None:
+            dense = n <= self.MAX_DENSE_SAMPLE_NODES
+        if dense:
+            if n > self.MAX_DENSE_SAMPLE_NODES:
+                raise ValueError(f"Dense Monte Carlo is limited to {self.MAX_DENSE_SAMPLE_NODES} unknowns, "
+                                 f"this circuit has {n}; use dense=False")
+            per_sample = 8 * (n * n + n + len(nominal))
+            if per_sample > chunk_bytes:
+                raise ValueError(f"One dense sample needs {per_sample} bytes, more than chunk_bytes={chunk_bytes}")
+        else:
+            per_sample = 8 * (n + len(nominal))
+        chunk = max(1, chunk_bytes // per_sample)
+        if processes and processes > 1:
+            chunk = min(chunk, -(-samples // processes))
+        solve = solve_stacked if dense else solve_sparse
+        keys, pattern = self._stamp_pattern()
+        b = self._rhs()
+        chunks = [1 / resistances[k:k + chunk] for k in range(0, samples, chunk)]
+        if processes and processes > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(processes) as pool:
+                parts = list(pool.map(solve, [keys] * len(chunks), [pattern] * len(chunks),
+                                      [n] * len(chunks), chunks, [b] * len(chunks)))
+        else:
+            parts = [solve(keys, pattern, n, g, b) for g in chunks]
+
+        voltages = np.concatenate(parts) if parts else np.zeros((0, n))
+        # Ground's column (index n) is zero; reorder to the circuit's node order
+        voltages = np.column_stack([voltages, np.zeros(len(voltages))])[:, list(self._node_map.values())]
+        return MonteCarloResult(list(self._node_map), resistances, voltages)
+
+    def solve_transient(self, t_stop, dt, method='trap', adaptive=False,
+                        rtol=1e-3, atol=1e-6, ground='0'):
+        """Integrate the circuit from a zero initial state up to t_stop.
+
+        `method` is 'be' (backward Euler) or 'trap' (trapezoidal). With a fixed
+        step the system matrix is factored once for the whole run, plus once
+        for a shortened last step when dt does not divide t_stop; with
+        `adaptive=True` the step is halved/doubled from `dt` to meet rtol/atol
+        and one factorization is kept per step size used. Voltage sources are
+        ideal (modified nodal analysis) and voltages are measured against
+        `ground`, or against the first node if the circuit has no such node.
+        """
+        if method not in ('be', 'trap'):
+            raise ValueError(f"Unknown integration method: {method}")
+        if not (t_stop > 0 and dt > 0):
+            raise ValueError(f"t_stop and dt must be positive, got {t_stop} and {dt}")
+        system = TransientSystem(self, ground)
+        try:
+            if adaptive:
+                return system.run_adaptive(t_stop, dt, method, rtol, atol)
+            return system.run_fixed(t_stop, dt, method)
+        except np.linalg.LinAlgError:
+            return "Circuit cannot be solved"
+
+def _csc(keys, n, data):
+    """n x n CSC matrix with `data` at the flat col * n + row positions `keys`."""
+    return csc_matrix((data, keys % n, np.searchsorted(keys // n, np.arange(n + 1))), shape=(n, n))
+
+def solve_stacked(keys, pattern, n, g, b):
+    """Solve one dense DC system per row of conductances `g` sharing `pattern` and `b`."""
+    A = np.zeros((len(g), n * n))
+    # keys are col * n + row; the matrix is symmetric, so this is also row-major
+    A[:, keys] = (pattern @ g.T).T
+    A = A.reshape(len(g), n, n)
+    rhs = np.broadcast_to(b, (len(g), n))[..., None]
+    try:
+        return np.linalg.solve(A, rhs)[..., 0]
+    except np.linalg.LinAlgError:
+        x = np.full((len(g), n), np.nan)
+        for k in range(len(g)):
+            try:
+                x[k] = np.linalg.solve(A[k], b)
+            except np.linalg.LinAlgError:
+                pass
+        return x
+
+def solve_sparse(keys, pattern, n, g, b):
+    """Like solve_stacked, with one sparse LU per row of `g` on the shared pattern."""
+    data = (pattern @ g.T).T
+    x = np.full((len(g), n), np.nan)
+    for k in range(len(g)):
+        try:
+            x[k] = splu(_csc(keys, n, data[k])).solve(b)
+        except RuntimeError:
+            pass
+    return x
+
+class MonteCarloResult:
+    """Per-sample resistor values and node voltages from Circuit.monte_carlo()."""
+
+    def __init__(self, nodes, resistances, voltages):
+        self.nodes = nodes
+        self.resistances = resistances
+        self.voltages = voltages
+
+    def __getitem__(self, node):
+        return self.voltages[:, self.nodes.index(node)]
+
+    def mean(self):
+        return dict(zip(self.nodes, np.nanmean(self.voltages, axis=0)))
+
+    def std(self):
+        return dict(zip(self.nodes, np.nanstd(self.voltages, axis=0)))
+
+    def percentile(self, q):
+        return dict(zip(self.nodes, np.nanpercentile(self.voltages, q, axis=0)))
+
+class TransientResult:
+    """Node voltage waveforms produced by Circuit.solve_transient()."""
+
+    def __init__(self, time, nodes, voltages):
+        self.time = time
+        self.nodes = nodes
+        self.voltages = voltages
+
+    def __getitem__(self, node):
+        return self.voltages[:, self.nodes.index(node)]
+
+class TransientSystem:
+    """MNA matrix of a circuit with capacitors and inductors replaced by their
+    companion models (a conductance plus a current source per step)."""
+
+    def __init__(self, circuit, ground='0'):
+        nodes = {}
+        for elements in (circuit.resistors, circuit.capacitors,
+                         circuit.inductors, circuit.voltage_sources):
+            for e in elements:
+                nodes.setdefault(e.n1)
+                nodes.setdefault(e.n2)
+        if ground not in nodes:
+            ground = next(iter(nodes), ground)
+
+        self.ground = ground
+        self.nodes = [n for n in nodes if n != ground]
+        self.size = len(self.nodes) + len(circuit.voltage_sources)
+        index = {n: i for i, n in enumerate(self.nodes)}
+        # Stamps on the ground node land in an extra row/column that is dropped
+        index[ground] = self.size
+
+        def terminals(elements):
+            return (np.array([index[e.n1] for e in elements], dtype=int),
+                    np.array([index[e.n2] for e in elements], dtype=int))
+
+        self.r_i, self.r_j = terminals(circuit.resistors)
+        self.c_i, self.c_j = terminals(circuit.capacitors)
+        self.l_i, self.l_j = terminals(circuit.inductors)
+        self.v_i, self.v_j = terminals(circuit.voltage_sources)
+        self.g = np.array([1 / r.resistance for r in circuit.resistors], dtype=float)
+        self.c = np.array([c.capacitance for c in circuit.capacitors], dtype=float)
+        self.l = np.array([l.inductance for l in circuit.inductors], dtype=float)
+
+        self.sources = circuit.voltage_sources
+        self.branch = np.arange(len(self.nodes), self.size)
+        self.source_values = np.array([v.voltage for v in self.sources], dtype=float)
+        self.waveforms = [(k, v.waveform) for k, v in enumerate(self.sources) if v.waveform]
+
+        static = np.zeros((self.size + 1, self.size + 1))
+        self._stamp(static, self.r_i, self.r_j, self.g)
+        static[self.branch, self.v_i] += 1.0
+        static[self.branch, self.v_j] -= 1.0
+        static[self.v_i, self.branch] += 1.0
+        static[self.v_j, self.branch] -= 1.0
+        self.static = static
+        self._factors = {}
+
+    @staticmethod
+    def _stamp(A, i, j, g):
+        np.add.at(A, (i, i), g)
+        np.add.at(A, (j, j), g)
+        np.add.at(A, (i, j), -g)
+        np.add.at(A, (j, i), -g)
+
+    def companion(self, h, method):
+        """Capacitor and inductor companion conductances for step size h."""
+        if method == 'trap':
+            return 2 * self.c / h, h / (2 * self.l)
+        return self.c / h, h / self.l
+
+    def factor(self, h, method):
+        key = (h, method)
+        if key not in self._factors:
+            gc, gl = self.companion(h, method)
+            A = self.static.copy()
+            self._stamp(A, self.c_i, self.c_j, gc)
+            self._stamp(A, self.l_i, self.l_j, gl)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", LinAlgWarning)
+                lu = lu_factor(A[:self.size, :self.size])
+            if not np.all(np.diag(lu[0])):
+                raise np.linalg.LinAlgError("Singular matrix")
+            self._factors[key] = lu
+        return self._factors[key]
+
+    def _inject(self, i, j, current):
+        n = self.size + 1
+        return (np.bincount(i, weights=current, minlength=n)
+                - np.bincount(j, weights=current, minlength=n))
+
+    def initial_state(self):
+        """Zero capacitor voltages/currents and inductor currents/voltages."""
+        return (np.zeros(len(self.c)), np.zeros(len(self.c)),
+                np.zeros(len(self.l)), np.zeros(len(self.l)))
+
+    def step(self, state, t, h, method):
+        """Advance `state` by h to time t; returns (node voltages, new state)."""
+        vc, ic, il, vl = state
+        gc, gl = self.companion(h, method)
+        if method == 'trap':
+            ieq_c = gc * vc + ic
+            ieq_l = -(il + gl * vl)
+        else:
+            ieq_c = gc * vc
+            ieq_l = -il
+
+        b = self._inject(self.c_i, self.c_j, ieq_c) + self._inject(self.l_i, self.l_j, ieq_l)
+        volts = self.source_values
+        if self.waveforms:
+            volts = volts.copy()
+            for k, waveform in self.waveforms:
+                volts[k] = waveform(t)
+        b[self.branch] = volts
+
+        x = lu_solve(self.factor(h, method), b[:self.size], check_finite=False)
+        v = np.append(x, 0.0)
+        vc_new = v[self.c_i] - v[self.c_j]
+        vl_new = v[self.l_i] - v[self.l_j]
+        state = (vc_new, gc * vc_new - ieq_c, gl * vl_new - ieq_l, vl_new)
+        return x[:len(self.nodes)], state
+
+    def run_fixed(self, t_stop, dt, method):
+        steps = max(1, int(np.ceil(t_stop / dt - 1e-9)))
+        time = np.arange(steps + 1) * dt
+        time[-1] = t_stop
+        # The last step is shortened to land on t_stop; one that is dt to
+        # rounding keeps dt so it reuses the run's factorization
+        last = t_stop - time[-2]
+        if abs(last - dt) <= 1e-9 * dt:
+            last = dt
+        voltages = np.zeros((steps + 1, len(self.nodes)))
+        state = self.initial_state()
+        for k in range(1, steps + 1):
+            # A backward Euler first step damps the jump from the zero initial state
+            voltages[k], state = self.step(state, time[k], dt if k < steps else last, method if k > 1 else 'be')
+        return TransientResult(time, self.nodes, voltages)
+
+    def run_adaptive(self, t_stop, dt, method, rtol, atol, max_halvings=10, max_doublings=6):
+        # The gap between the backward Euler and trapezoidal solutions from the
+        # same state is used as a (conservative) local error estimate. Steps
+        # stay on the dt * 2**k ladder so factorizations get reused.
+        other = 'be' if method == 'trap' else 'trap'
+        h_min, h_max = dt / 2 ** max_halvings, dt * 2 ** max_doublings
+        h, t = dt, 0.0
+        times = [0.0]
+        voltages = [np.zeros(len(self.nodes))]
+        state = self.initial_state()
+        while t_stop - t > h_min * 1e-6:
+            step = min(h, t_stop - t)
+            v, new_state = self.step(state, t + step, step, method)
+            v_other, _ = self.step(state, t + step, step, other)
+            err = np.max(np.abs(v - v_other) / (atol + rtol * np.abs(v)), initial=0.0)
+            if err > 1 and h > h_min:
+                h /= 2
+                continue
+            t += step
+            state = new_state
+            times.append(t)
+            voltages.append(v)
+            if err < 0.25 and h < h_max:
+                h *= 2
+        return TransientResult(np.array(times), self.nodes, np.array(voltages))
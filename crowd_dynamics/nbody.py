@@ -0,0 +1,45 @@
+"""Direct-sum N-body gravity (the sun and planets of gravitySImulator.py)."""
+from collections import deque
+
+import numpy as np
+
+class GravitySystem:
+    """Bodies in the plane, integrated with the interactive version's Euler step.
+
+    `mass` has one entry per body and `pos`/`vel` one (x, y) row each. The
+    interactive version advances `dt` once per frame at 60 FPS; step()
+    takes the same steps `rate` times per simulated second whatever it is
+    called with, and keeps the last `trail` positions.
+    """
+
+    def __init__(self, mass, pos, vel, G=6.67430e-1, dt=0.1, rate=60, trail=100):
+        self.mass = np.array(mass, dtype=float).reshape(-1)
+        self.pos = np.array(pos, dtype=float).reshape(-1, 2)
+        self.vel = np.array(vel, dtype=float).reshape(-1, 2)
+        if not len(self.mass) == len(self.pos) == len(self.vel):
+            raise ValueError(f"Got {len(self.mass)} masses, {len(self.pos)} positions and "
+                             f"{len(self.vel)} velocities")
+        self.G = G
+        self.dt, self.rate = dt, rate
+        self.trail = deque(maxlen=trail)
+        self.time = 0.0
+        self.steps = 0
+
+    @classmethod
+    def sun_and_planets(cls, width=1920, height=1080, **options):
+        """gravitySImulator.py's sun with two planets, centred on a width x height screen."""
+        cx, cy = width / 2, height / 2
+        return cls([10000.0, 1.0, 1.0], [[cx, cy], [cx + 100, cy], [cx - 100, cy]],
+                   [[0.0, 0.0], [0.0, 5.0], [0.0, -5.0]], **options)
+
+    def step(self, dt):
+        self.time += dt
+        target = int(round(self.time * self.rate, 9))
+        for _ in range(target - self.steps):
+            d = self.pos[None, :, :] - self.pos[:, None, :]
+            r = np.hypot(d[..., 0], d[..., 1])
+            np.fill_diagonal(r, np.inf)
+            self.vel += self.G * np.sum(self.mass[None, :, None] * d / r[..., None] ** 3, axis=1) * self.dt
+            self.pos += self.vel * self.dt
+            self.trail.append(self.pos.astype(int))
+        self.steps = target
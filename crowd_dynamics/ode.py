@@ -0,0 +1,19 @@
+"""Right-hand sides and solves for the small ODE demos (lorrentz.py).
+
+scipy is imported on the first solve, not with the module.
+"""
+import numpy as np
+
+def lorenz(t, state, sigma, rho, beta):
+    x, y, z = state
+    dx = sigma * (y - x)
+    dy = x * (rho - z) - y
+    dz = x * y - beta * z
+    return [dx, dy, dz]
+
+def lorenz_trajectory(sigma=10.0, rho=28.0, beta=8 / 3, t_end=40.0, state=(1, 1, 1), samples=10000):
+    """solve_ivp result for the Lorenz system sampled at `samples` times in [0, t_end]."""
+    from scipy.integrate import solve_ivp
+
+    return solve_ivp(lambda t, y: lorenz(t, y, sigma, rho, beta), [0, t_end], list(state),
+                     t_eval=np.linspace(0, t_end, samples))
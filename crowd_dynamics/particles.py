@@ -0,0 +1,96 @@
+"""Elastic disc collisions from computePI.py, without any drawing."""
+import math
+import random
+
+class Particle:
+    """A disc bouncing inside a `width` x `height` box (pixels per frame)."""
+
+    width, height = 800, 800
+
+    def __init__(self, x, y, radius=10):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.vx = random.uniform(-2, 2)
+        self.vy = random.uniform(-2, 2)
+        self.mass = self.radius ** 2  # Mass proportional to area
+        
+    def move(self):
+        self.x += self.vx
+        self.y += self.vy
+        
+        # Bounce off walls
+        if self.x - self.radius < 0:
+            self.x = self.radius
+            self.vx = -self.vx
+        elif self.x + self.radius > self.width:
+            self.x = self.width - self.radius
+            self.vx = -self.vx
+            
+        if self.y - self.radius < 0:
+            self.y = self.radius
+            self.vy = -self.vy
+        elif self.y + self.radius > self.height:
+            self.y = self.height - self.radius
+            self.vy = -self.vy
+    
+    def distance(self, other):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx**2 + dy**2)
+    
+    def check_collision(self, other):
+        distance = self.distance(other)
+        if distance < self.radius + other.radius:
+            return True
+        return False
+    
+    def resolve_collision(self, other):
+        # Calculate direction vector
+        dx = other.x - self.x
+        dy = other.y - self.y
+        distance = math.sqrt(dx**2 + dy**2)
+        
+        # Normalize direction vector
+        if distance == 0:  # Avoid division by zero
+            dx, dy = 1, 0
+        else:
+            dx, dy = dx/distance, dy/distance
+            
+        # Calculate relative velocity
+        dvx = self.vx - other.vx
+        dvy = self.vy - other.vy
+        
+        # Calculate velocity along the normal direction
+        velocity_along_normal = dvx * dx + dvy * dy
+        
+        # If particles are moving away from each other, no collision response
+        if velocity_along_normal > 0:
+            return
+        
+        # Calculate impulse scalar
+        restitution = 1.0  # Perfect elasticity
+        impulse_scalar = -(1 + restitution) * velocity_along_normal
+        impulse_scalar /= 1/self.mass + 1/other.mass
+        
+        # Apply impulse
+        self.vx -= impulse_scalar * dx / self.mass
+        self.vy -= impulse_scalar * dy / self.mass
+        other.vx += impulse_scalar * dx / other.mass
+        other.vy += impulse_scalar * dy / other.mass
+        
+        # Separate the particles to avoid sticking
+        overlap = (self.radius + other.radius - distance) / 2.0
+        self.x -= overlap * dx
+        self.y -= overlap * dy
+        other.x += overlap * dx
+        other.y += overlap * dy
+
+def step(particles):
+    """Move every particle one frame, then resolve each overlapping pair."""
+    for particle in particles:
+        particle.move()
+    for i in range(len(particles)):
+        for j in range(i + 1, len(particles)):
+            if particles[i].check_collision(particles[j]):
+                particles[i].resolve_collision(particles[j])
@@ -0,0 +1,252 @@
+"""Scenario files: declarative setups for the blocks, particles, bodies and circuits.
+
+A scenario file is YAML holding one scenario, a list of them, or several
+`---` separated documents. Each scenario has a `name`, a `kind` and that
+kind's fields:
+
+    name: giant_mass
+    kind: blocks
+    m1: 10000            # masses must be positive; velocities in px/s
+    v1: -2
+    m2: 1
+    v2: 0
+    ---
+    name: gas
+    kind: particles
+    count: 200           # random discs (seeded), or an explicit list:
+    radius: [5, 15]      #   particles: [{x: 100, y: 100, radius: 10, vx: 1, vy: 0}]
+    seed: 0
+    ---
+    name: binary
+    kind: bodies
+    bodies:
+      - {mass: 10000, x: 960, y: 540}
+      - {mass: 1, x: 1060, y: 540, vy: 5}
+    ---
+    name: divider
+    kind: circuit
+    sources: [[a, "0", 5]]
+    resistors: [[a, b, 100], [b, "0", 100]]
+
+load() validates everything up front and raises ValueError naming the file,
+the scenario and the offending field; Scenario.build() then constructs the
+crowd_dynamics object directly. PyYAML's C parser is used when it is
+available, since batch runs may read thousands of files.
+
+    python -m crowd_dynamics.scenarios scenarios/     # validate and list
+"""
+import os
+import random
+import sys
+
+import numpy as np
+import yaml
+
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+REQUIRED = object()
+
+def _number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value)
+
+def _positive(value):
+    return _number(value) and value > 0
+
+def _count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+def _range(value):
+    return (isinstance(value, list) and len(value) == 2 and all(_count(v) and v > 0 for v in value)
+            and value[0] <= value[1])
+
+def _elements(value):
+    return isinstance(value, list) and all(
+        isinstance(e, list) and len(e) == 3 and _number(e[2]) for e in value)
+
+# kind -> {field: (check, default)}; fields whose default is REQUIRED must be given
+FIELDS = {
+    'blocks': {
+        'm1': (_positive, REQUIRED), 'v1': (_number, REQUIRED),
+        'm2': (_positive, REQUIRED), 'v2': (_number, 0.0),
+        'width': (_positive, 1920), 'height': (_positive, 1080),
+    },
+    'particles': {
+        'count': (_count, 0), 'radius': (_range, [5, 15]), 'speed': (_positive, 2.0),
+        'seed': (_count, None), 'particles': (lambda v: isinstance(v, list), []),
+        'width': (_positive, 800), 'height': (_positive, 800),
+    },
+    'bodies': {
+        'bodies': (lambda v: isinstance(v, list) and len(v) > 0, REQUIRED),
+        'G': (_positive, 6.67430e-1), 'dt': (_positive, 0.1), 'rate': (_positive, 60), 'trail': (_count, 100),
+    },
+    'circuit': {
+        'resistors': (_elements, []), 'sources': (_elements, []),
+        'capacitors': (_elements, []), 'inductors': (_elements, []),
+    },
+}
+ITEM_FIELDS = {
+    'particles': {'x': (_number, REQUIRED), 'y': (_number, REQUIRED), 'radius': (_positive, 10),
+                  'vx': (_number, 0.0), 'vy': (_number, 0.0)},
+    'bodies': {'mass': (_positive, REQUIRED), 'x': (_number, REQUIRED), 'y': (_number, REQUIRED),
+               'vx': (_number, 0.0), 'vy': (_number, 0.0)},
+}
+
+def _fields(data, fields, where):
+    if not isinstance(data, dict):
+        raise ValueError(f"{where}: expected a mapping, got {type(data).__name__}")
+    unknown = set(data) - set(fields)
+    if unknown:
+        raise ValueError(f"{where}: unknown field(s) {', '.join(sorted(map(str, unknown)))}")
+    out = {}
+    for key, (check, default) in fields.items():
+        if key not in data:
+            if default is REQUIRED:
+                raise ValueError(f"{where}: missing field '{key}'")
+            out[key] = default
+        elif (data[key] is None and default is None) or check(data[key]):
+            out[key] = data[key]
+        else:
+            raise ValueError(f"{where}: invalid {key}: {data[key]!r}")
+    return out
+
+class Scenario:
+    """One validated scenario; `params` has every field of its kind filled in."""
+
+    def __init__(self, name, kind, params, source=None):
+        self.name = name
+        self.kind = kind
+        self.params = params
+        self.source = source
+
+    def __repr__(self):
+        return f"Scenario({self.name!r}, {self.kind!r})"
+
+    def build(self):
+        """SlidingBlocks, list of Particle, GravitySystem or Circuit for this scenario."""
+        return BUILDERS[self.kind](self.params)
+
+def validate(data, where='scenario'):
+    if not isinstance(data, dict):
+        raise ValueError(f"{where}: expected a mapping, got {type(data).__name__}")
+    data = dict(data)
+    name, kind = data.pop('name', None), data.pop('kind', None)
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"{where}: missing or invalid 'name'")
+    where = f"{where} '{name}'"
+    if kind not in FIELDS:
+        raise ValueError(f"{where}: kind must be one of {', '.join(FIELDS)}, got {kind!r}")
+    params = _fields(data, FIELDS[kind], where)
+    if kind in ITEM_FIELDS:
+        params[kind] = [_fields(item, ITEM_FIELDS[kind], f"{where} {kind}[{i}]")
+                        for i, item in enumerate(params[kind])]
+    if kind == 'circuit':
+        for key in ('resistors', 'capacitors', 'inductors'):
+            if any(e[2] <= 0 for e in params[key]):
+                raise ValueError(f"{where}: {key} values must be positive")
+        params = {key: [[str(e[0]), str(e[1]), float(e[2])] for e in value] for key, value in params.items()}
+    return Scenario(name, kind, params)
+
+def loads(text, source='<string>'):
+    """Validated scenarios from YAML text; names must be unique within it."""
+    scenarios = []
+    try:
+        documents = list(yaml.load_all(text, Loader=Loader))
+    except yaml.YAMLError as error:
+        raise ValueError(f"{source}: {error}") from None
+    for document in documents:
+        if document is None:
+            continue
+        for data in document if isinstance(document, list) else [document]:
+            scenario = validate(data, source)
+            scenario.source = source
+            scenarios.append(scenario)
+    names = [s.name for s in scenarios]
+    if len(set(names)) != len(names):
+        duplicate = next(n for n in names if names.count(n) > 1)
+        raise ValueError(f"{source}: scenario '{duplicate}' is defined more than once")
+    return scenarios
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        return loads(f.read(), path)
+
+def iter_scenarios(*paths):
+    """Scenarios from files and (recursively) from the .yaml/.yml files in directories."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file in sorted(files):
+                    if file.endswith(('.yaml', '.yml')):
+                        yield from load(os.path.join(root, file))
+        else:
+            yield from load(path)
+
+def presets(path, kind=None):
+    """{name: Scenario} from one file, optionally only scenarios of `kind`."""
+    return {s.name: s for s in load(path) if kind is None or s.kind == kind}
+
+def select(path, name, kind=None):
+    """The scenario called `name` in `path`; ValueError listing the choices if absent."""
+    found = presets(path, kind)
+    if name not in found:
+        raise ValueError(f"{path}: no scenario named '{name}' (available: {', '.join(found) or 'none'})")
+    return found[name]
+
+# -----------------------------
+# Builders
+# -----------------------------
+def _build_blocks(p):
+    from .blocks import SlidingBlocks
+    return SlidingBlocks(p['m1'], p['v1'], p['m2'], p['v2'], p['width'], p['height'])
+
+def _build_particles(p):
+    from .particles import Particle
+    rng = random.Random(p['seed'])
+    particles = []
+    for item in p['particles']:
+        particle = Particle(item['x'], item['y'], item['radius'])
+        particle.vx, particle.vy = item['vx'], item['vy']
+        particles.append(particle)
+    for _ in range(p['count']):
+        radius = rng.randint(*p['radius'])
+        particle = Particle(rng.uniform(radius, p['width'] - radius), rng.uniform(radius, p['height'] - radius), radius)
+        particle.vx, particle.vy = rng.uniform(-p['speed'], p['speed']), rng.uniform(-p['speed'], p['speed'])
+        particles.append(particle)
+    for particle in particles:
+        particle.width, particle.height = p['width'], p['height']
+    return particles
+
+def _build_bodies(p):
+    from .nbody import GravitySystem
+    bodies = p['bodies']
+    return GravitySystem([b['mass'] for b in bodies], [[b['x'], b['y']] for b in bodies],
+                         [[b['vx'], b['vy']] for b in bodies], p['G'], p['dt'], p['rate'], p['trail'])
+
+def _build_circuit(p):
+    from .circuits import Capacitor, Circuit, Inductor, Resistor, VoltageSource
+    circuit = Circuit()
+    for n1, n2, value in p['resistors']:
+        circuit.add_resistor(Resistor(n1, n2, value))
+    for n1, n2, value in p['sources']:
+        circuit.add_voltage_source(VoltageSource(n1, n2, value))
+    for n1, n2, value in p['capacitors']:
+        circuit.add_capacitor(Capacitor(n1, n2, value))
+    for n1, n2, value in p['inductors']:
+        circuit.add_inductor(Inductor(n1, n2, value))
+    return circuit
+
+BUILDERS = {'blocks': _build_blocks, 'particles': _build_particles, 'bodies': _build_bodies,
+            'circuit': _build_circuit}
+
+def main(argv=None):
+    paths = (sys.argv[1:] if argv is None else argv) or ['.']
+    try:
+        for scenario in iter_scenarios(*paths):
+            print(f"{scenario.source}: {scenario.name} ({scenario.kind})")
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eigh
+from scipy.sparse.linalg import eigsh
+
+class SpringNetwork:
+    """Linear network of point masses joined by springs.
+
+    Each mass has one displacement coordinate x_i (the same model as the
+    single oscillator in springMass.py, generalised to a graph). Springs
+    between masses and "anchor" springs to a fixed wall are collected into a
+    sparse stiffness matrix K, so the equations of motion are
+
+        M x'' + C x' + K x = F(t)
+
+    with diagonal mass and damping matrices and harmonic driving forces.
+    """
+
+    # Largest network whose modes are all found with a dense eigensolver
+    # (8 * n^2 bytes, O(n^3) time); bigger ones must ask for a mode count
+    MAX_DENSE_MODES = 2000
+
+    def __init__(self, masses, damping=0.0):
+        self.m = np.asarray(masses, dtype=float)
+        self.c = np.broadcast_to(np.asarray(damping, dtype=float), self.m.shape).copy()
+        self._i = []
+        self._j = []
+        self._k = []
+        self._anchors = np.zeros(len(self.m))
+        self.drives = []
+        self._K = None
+        self._modes = {}
+
+    @classmethod
+    def lattice(cls, nx, ny=1, k=1.0, mass=1.0, damping=0.0, anchor=0.0):
+        """Rectangular nx * ny grid with nearest-neighbour springs."""
+        idx = np.arange(nx * ny).reshape(ny, nx)
+        net = cls(np.full(nx * ny, mass), damping)
+        net.add_springs(idx[:, :-1].ravel(), idx[:, 1:].ravel(), k)
+        net.add_springs(idx[:-1, :].ravel(), idx[1:, :].ravel(), k)
+        if anchor:
+            net.add_anchors(idx.ravel(), anchor)
+        return net
+
+    def add_spring(self, i, j, k):
+        self.add_springs([i], [j], k)
+
+    def add_springs(self, i, j, k):
+        i = np.asarray(i, dtype=int)
+        j = np.asarray(j, dtype=int)
+        self._i.append(i)
+        self._j.append(j)
+        self._k.append(np.broadcast_to(np.asarray(k, dtype=float), i.shape))
+        self._invalidate()
+
+    def add_anchors(self, i, k):
+        np.add.at(self._anchors, np.asarray(i, dtype=int), k)
+        self._invalidate()
+
+    def add_drive(self, i, amplitude, frequency, phase=0.0):
+        """Harmonic force amplitude * cos(frequency * t + phase) on mass i."""
+        self.drives.append((i, amplitude, frequency, phase))
+
+    def _invalidate(self):
+        self._K = None
+        self._modes = {}
+
+    @property
+    def stiffness(self):
+        if self._K is None:
+            n = len(self.m)
+            i = np.concatenate(self._i) if self._i else np.zeros(0, dtype=int)
+            j = np.concatenate(self._j) if self._j else np.zeros(0, dtype=int)
+            k = np.concatenate(self._k) if self._k else np.zeros(0)
+            diag = np.bincount(i, k, n) + np.bincount(j, k, n) + self._anchors
+            rows = np.concatenate([i, j, np.arange(n)])
+            cols = np.concatenate([j, i, np.arange(n)])
+            vals = np.concatenate([-k, -k, diag])
+            self._K = sp.csr_matrix((vals, (rows, cols)), shape=(n, n))
+        return self._K
+
+    def force(self, t):
+        f = np.zeros(len(self.m))
+        for i, amplitude, frequency, phase in self.drives:
+            f[i] += amplitude * np.cos(frequency * t + phase)
+        return f
+
+    # -----------------------------
+    # Time stepping
+    # -----------------------------
+    def integrate(self, x0, v0, t_end, dt, record_every=1):
+        """Step the network with velocity Verlet; damping is applied exactly as
+        exp(-c/m dt/2) half-steps around the conservative update.
+
+        Returns (times, positions) sampled every `record_every` steps and the
+        final velocities.
+        """
+        K = self.stiffness
+        inv_m = 1 / self.m
+        decay = np.exp(-self.c * inv_m * dt / 2)
+        x = np.array(x0, dtype=float)
+        v = np.array(v0, dtype=float)
+        steps = int(round(t_end / dt))
+
+        times = [0.0]
+        frames = [x.copy()]
+        t = 0.0
+        a = (self.force(t) - K @ x) * inv_m
+        for n in range(1, steps + 1):
+            v *= decay
+            v += 0.5 * dt * a
+            x += dt * v
+            t = n * dt
+            a = (self.force(t) - K @ x) * inv_m
+            v += 0.5 * dt * a
+            v *= decay
+            if n % record_every == 0:
+                times.append(t)
+                frames.append(x.copy())
+        return np.array(times), np.array(frames), v
+
+    # -----------------------------
+    # Modal analysis
+    # -----------------------------
+    def modes(self, count=None):
+        """Natural frequencies and mass-normalised mode shapes (columns).
+
+        With `count`, only that many lowest modes are computed, with a sparse
+        shift-invert eigensolver. All modes (count=None, or count >= n - 1)
+        need a dense solve, which is refused with ValueError above
+        MAX_DENSE_MODES masses. Results are cached until the topology changes.
+        """
+        n = len(self.m)
+        if count is None or count >= n - 1:
+            count = None
+            if n > self.MAX_DENSE_MODES:
+                raise ValueError(f"Finding all {n} modes needs a dense {n}x{n} solve; pass count to "
+                                 f"compute only the lowest modes of networks over {self.MAX_DENSE_MODES} masses")
+        if count not in self._modes:
+            scale = 1 / np.sqrt(self.m)
+            D = sp.diags(scale)
+            A = D @ self.stiffness @ D
+            if count is None:
+                lam, vecs = eigh(A.toarray())
+            else:
+                lam, vecs = eigsh(A.tocsc(), k=count, sigma=-1e-6, which='LM')
+            lam = np.clip(lam, 0, None)
+            self._modes[count] = (np.sqrt(lam), scale[:, None] * vecs)
+        return self._modes[count]
+
+    def response(self, times, x0, v0, modes=None):
+        """Displacements at arbitrary `times` by modal superposition.
+
+        Needs damping proportional to mass (c_i = alpha * m_i) so the modes
+        stay uncoupled. With `modes` set, only that many low modes are used
+        and the result is the projection onto them; without it every mode is
+        used, which is only possible for small networks (see modes()).
+        """
+        ratio = self.c / self.m
+        if not np.allclose(ratio, ratio[0]):
+            raise ValueError("Modal response needs mass-proportional damping")
+        alpha = ratio[0]
+        omega, phi = self.modes(modes)
+
+        times = np.atleast_1d(np.asarray(times, dtype=float))[:, None]
+        # Mass-normalised shapes: q = phi^T M x
+        q0 = phi.T @ (self.m * np.asarray(x0, dtype=float))
+        qd0 = phi.T @ (self.m * np.asarray(v0, dtype=float))
+
+        # Steady-state response to each harmonic drive, removed from the
+        # initial conditions of the free (homogeneous) part
+        q = np.zeros((len(times), len(omega)))
+        for i, amplitude, frequency, phase in self.drives:
+            fm = amplitude * phi[i]
+            gain = fm / (omega ** 2 - frequency ** 2 + 1j * alpha * frequency)
+            q += np.real(gain * np.exp(1j * (frequency * times + phase)))
+            q0 = q0 - np.real(gain * np.exp(1j * phase))
+            qd0 = qd0 - np.real(1j * frequency * gain * np.exp(1j * phase))
+
+        beta = alpha / 2
+        wd = np.sqrt((omega ** 2 - beta ** 2).astype(complex))
+        tiny = np.abs(wd) < 1e-12
+        wd_safe = np.where(tiny, 1.0, wd)
+        sin_term = np.where(tiny, times, np.sin(wd_safe * times) / wd_safe)
+        q += np.real(np.exp(-beta * times) * (q0 * np.cos(wd * times) + (qd0 + beta * q0) * sin_term))
+        return q @ phi.T
+
+# -----------------------------
+# Single oscillator parameter sweeps
+# -----------------------------
+def oscillator_displacement(k, x0, damping, t, mass=1.0, max_bytes=64 * 2 ** 20):
+    """Displacement of m x'' + c x' + k x = 0 released from rest at x0.
+
+    k, x0, damping and t may each be scalars or 1-D arrays; every combination
+    is evaluated and the result has shape (len(k), len(x0), len(damping), len(t)).
+    The time factor does not depend on x0, so it is computed once per
+    (k, damping) pair, working through k in chunks that keep the complex
+    temporaries under about `max_bytes`.
+    """
+    k = np.atleast_1d(np.asarray(k, dtype=float))
+    x0 = np.atleast_1d(np.asarray(x0, dtype=float))
+    c = np.atleast_1d(np.asarray(damping, dtype=float))
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    out = np.empty((len(k), len(x0), len(c), len(t)))
+
+    chunk = max(1, max_bytes // (4 * 16 * len(c) * len(t)))
+    beta = (c / (2 * mass))[None, :, None]
+    for start in range(0, len(k), chunk):
+        w0 = np.sqrt(k[start:start + chunk] / mass)[:, None, None]
+        iw = 1j * np.sqrt((w0 ** 2 - beta ** 2).astype(complex))
+        # Written as two decaying exponentials so overdamped cases don't overflow
+        critical = np.abs(iw) < 1e-9 * np.maximum(w0, 1.0)
+        a = 0.5 * (1 + beta / np.where(critical, 1.0, iw))
+        g = np.real(a * np.exp((iw - beta) * t) + (1 - a) * np.exp((-iw - beta) * t))
+        g = np.where(critical, (1 + beta * t) * np.exp(-beta * t), g)
+        np.multiply(x0[None, :, None, None], g[:, None], out=out[start:start + chunk])
+    return out
+
+def plot_displacement_grid(x, t, values, label, ax=None, curves=False):
+    """Draw a (len(values), len(t)) slice of a sweep as a heatmap or curve family."""
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        ax = plt.figure(figsize=(8, 5)).add_subplot(111)
+    if curves:
+        colors = plt.cm.viridis(np.linspace(0, 1, len(values)))
+        for row, value, color in zip(x, values, colors):
+            ax.plot(t, row, color=color, lw=1, label=f"{label} = {value:.3g}")
+        if len(values) <= 10:
+            ax.legend(fontsize='small')
+        ax.set_ylabel("Displacement (x)")
+    else:
+        mesh = ax.pcolormesh(t, values, x, cmap='RdBu_r', shading='auto')
+        ax.figure.colorbar(mesh, ax=ax, label="Displacement (x)")
+        ax.set_ylabel(label)
+    ax.set_xlabel("Time (s)")
+    return ax
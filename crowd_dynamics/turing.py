@@ -0,0 +1,764 @@
+"""Turing machine engine: growable byte tape, compiled and macro runners,
+and a trace recorder for rewinding runs. No GUI imports; TuringGUI lives in
+turing_machine.py.
+"""
+import json
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from itertools import groupby
+
+MOVES = {'R': 1, 'L': -1}
+
+class Tape:
+    """Two-way infinite tape, one byte per cell.
+
+    Cells hold small integer codes (0 is the blank '#') in a bytearray that
+    at least doubles towards whichever end is run off, so growth is
+    amortized O(1) in both directions. Positions are tape coordinates and
+    may be negative; slices use them too. runs() gives a run-length encoded
+    copy for storing long, mostly blank tapes.
+    """
+
+    BLANK = '#'
+
+    def __init__(self, content='', capacity=128):
+        self.symbols = [self.BLANK]
+        self.codes = {self.BLANK: 0}
+        size = max(capacity, 2 * len(content))
+        self.cells = bytearray(size)
+        # Leave a quarter of the buffer free on the left
+        self.offset = (size - len(content)) // 4
+        for i, symbol in enumerate(content):
+            self.cells[self.offset + i] = self.code(symbol)
+
+    @classmethod
+    def from_runs(cls, start, runs):
+        tape = cls()
+        pos = start
+        for symbol, count in runs:
+            if symbol != cls.BLANK:
+                tape.ensure(pos + count - 1)
+                tape.ensure(pos)
+                i = pos + tape.offset
+                tape.cells[i:i + count] = tape._filled(tape.code(symbol), count)
+            pos += count
+        return tape
+
+    def code(self, symbol):
+        """Integer code of symbol, registering it on first use."""
+        code = self.codes.get(symbol)
+        if code is None:
+            code = len(self.symbols)
+            if code == 256 and isinstance(self.cells, bytearray):
+                self.cells = array('H', list(self.cells))
+            self.codes[symbol] = code
+            self.symbols.append(symbol)
+        return code
+
+    def _filled(self, code, count):
+        if isinstance(self.cells, bytearray):
+            return bytearray([code]) * count
+        return array('H', [code]) * count
+
+    def ensure(self, pos):
+        """Grow the buffer until position pos is stored."""
+        i = pos + self.offset
+        size = len(self.cells)
+        if i < 0:
+            extra = max(size, -i)
+            self.cells[:0] = self._filled(0, extra)
+            self.offset += extra
+        elif i >= size:
+            self.cells.extend(self._filled(0, max(size, i - size + 1)))
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[p] for p in range(pos.start, pos.stop)]
+        i = pos + self.offset
+        if 0 <= i < len(self.cells):
+            return self.symbols[self.cells[i]]
+        return self.BLANK
+
+    def __setitem__(self, pos, symbol):
+        self.ensure(pos)
+        self.cells[pos + self.offset] = self.code(symbol)
+
+    def bounds(self):
+        """First and last non-blank positions, or None for a blank tape."""
+        cells = self.cells
+        if isinstance(cells, bytearray):
+            first = len(cells) - len(cells.lstrip(b'\0'))
+            last = len(cells.rstrip(b'\0')) - 1
+        else:
+            used = [i for i, code in enumerate(cells) if code]
+            first, last = (used[0], used[-1]) if used else (len(cells), -1)
+        if last < first:
+            return None
+        return first - self.offset, last - self.offset
+
+    def runs(self):
+        """(start, [(symbol, count), ...]) covering the non-blank region."""
+        span = self.bounds()
+        if span is None:
+            return 0, []
+        first, last = span
+        runs = []
+        for code, group in groupby(self.cells[first + self.offset:last + self.offset + 1]):
+            runs.append((self.symbols[code], sum(1 for _ in group)))
+        return first, runs
+
+    def __str__(self):
+        span = self.bounds()
+        if span is None:
+            return ''
+        return ''.join(self[span[0]:span[1] + 1])
+
+class TuringMachine:
+    MACRO_MIN_GAIN = 16     # base steps a macro step must average to beat run()
+
+    def __init__(self, tape, transitions, head_position=0, start_state='q0'):
+        self.initial_tape = tape
+        self.transitions = transitions
+        self.head = head_position
+        self.state = start_state
+        self.running = False
+        self.tape = Tape(tape)
+        self.step_count = 0
+        self.compiled = None
+        self.recorder = None
+
+    def reset(self):
+        self.head = 0
+        self.state = 'q0'
+        self.tape = Tape(self.initial_tape)
+        self.running = False
+        self.step_count = 0
+        self.compiled = None
+        if self.recorder is not None:
+            self.record(self.recorder.interval, self.recorder.limit)
+
+    def record(self, interval=1024, limit=None):
+        """Start recording every step from the current configuration."""
+        self.recorder = TraceRecorder(self, interval, limit)
+        return self.recorder
+
+    def step(self):
+        if self.state == 'HALT':
+            return False, "Machine halted."
+
+        symbol = self.tape[self.head]
+        key = (self.state, symbol)
+
+        if key in self.transitions:
+            new_state, new_symbol, direction = self.transitions[key]
+            explanation = (
+                f"Step {self.step_count + 1}: In state {self.state}, reading '{symbol}' -> "
+                f"Write '{new_symbol}', move {direction}, go to {new_state}"
+            )
+            if self.recorder is not None:
+                self.recorder.record(new_symbol, MOVES.get(direction, 0), new_state)
+            self.tape[self.head] = new_symbol
+            self.state = new_state
+            self.head += MOVES.get(direction, 0)
+            self.step_count += 1
+            if self.recorder is not None:
+                self.recorder.recorded()
+            return True, explanation
+        else:
+            if self.recorder is not None:
+                self.recorder.record_halt()
+            self.state = 'HALT'
+            return False, f"Step {self.step_count}: No transition for ({self.state}, {symbol}). Halting."
+
+    def compile(self):
+        """Number states and flatten the transitions into lists indexed by
+        state * n_symbols + symbol, using the tape's symbol codes. Missing
+        transitions get -1."""
+        width = len(self.tape.symbols)
+        if self.compiled is None or self.compiled[1] != width:
+            states = {'HALT': 0}
+            for (state, symbol), (new_state, write, _) in self.transitions.items():
+                for s in (state, new_state):
+                    states.setdefault(s, len(states))
+                self.tape.code(symbol)
+                self.tape.code(write)
+
+            width = len(self.tape.symbols)
+            size = len(states) * width
+            next_state = [-1] * size
+            write = [0] * size
+            move = [0] * size
+            for (state, symbol), (new_state, new_symbol, direction) in self.transitions.items():
+                k = states[state] * width + self.tape.code(symbol)
+                # States are stored pre-multiplied by the row width
+                next_state[k] = states[new_state] * width
+                write[k] = self.tape.code(new_symbol)
+                move[k] = MOVES.get(direction, 0)
+            self.compiled = (states, width, next_state, write, move)
+        return self.compiled
+
+    def run(self, max_steps, trace=None):
+        """Run until the machine halts or max_steps steps have been taken.
+
+        Without `trace` this uses the compiled tables and works on the raw
+        tape cells, building no explanation strings; with `trace` (a callable)
+        every step goes through step() and its explanation is passed to trace.
+        Returns (steps taken, steps per second).
+        """
+        started = time.perf_counter()
+        if trace is not None:
+            steps = 0
+            while steps < max_steps and self.state != 'HALT':
+                advanced, explanation = self.step()
+                trace(explanation)
+                steps += advanced
+        else:
+            steps = self._run_compiled(max_steps)
+        elapsed = time.perf_counter() - started
+        return steps, steps / elapsed if elapsed > 0 else float('inf')
+
+    def _run_compiled(self, max_steps):
+        # Checked before the missing-rule halt below: zero steps change nothing
+        if max_steps <= 0:
+            return 0
+        if self.recorder is not None:
+            return self.recorder.run(max_steps)
+        states, width, next_state, write, move = self.compile()
+        halt = states['HALT'] * width
+        if self.state not in states:
+            self.state = 'HALT'
+            return 0
+
+        tape = self.tape
+        tape.ensure(self.head)
+        cells = tape.cells
+        size = len(cells)
+        pos = self.head + tape.offset
+        state = states[self.state] * width
+        steps = 0
+        while steps < max_steps and state != halt:
+            k = state + cells[pos]
+            new_state = next_state[k]
+            if new_state < 0:
+                state = halt
+                break
+            cells[pos] = write[k]
+            pos += move[k]
+            state = new_state
+            steps += 1
+            if not 0 <= pos < size:
+                head = pos - tape.offset
+                tape.ensure(head)
+                cells = tape.cells
+                size = len(cells)
+                pos = head + tape.offset
+
+        state_names = list(states)
+        self.state = state_names[state // width]
+        self.head = pos - tape.offset
+        self.step_count += steps
+        return steps
+
+    def run_macro(self, max_steps, block_size=1, window=1 << 12):
+        """Like run(), but through a MacroMachine, which jumps over repeated
+        sweeps. The final tape is written back in full, so use MacroMachine
+        directly for runs whose tape would not fit in memory.
+
+        A macro step costs about as much as ten compiled base steps, so the
+        macro machine runs in rounds of `window` steps, doubling while its
+        steps average at least MACRO_MIN_GAIN base steps each. After a round
+        below that, the compiled loop takes over for a round 16 times longer
+        (doubling each time) before the next macro probe.
+        """
+        started = time.perf_counter()
+        steps = 0
+        compiled_window = 16 * window
+        while steps < max_steps and self.state != 'HALT':
+            macro = MacroMachine(self, block_size)
+            budget, slow = window, False
+            while steps < max_steps and macro.state != 'HALT' and macro.inside is None:
+                moves = macro.moves
+                taken = macro.run(min(budget, max_steps - steps), exact=False)
+                steps += taken
+                if taken == 0:
+                    # The next block step does not fit the budget: spend it cell by cell
+                    steps += macro.run(min(budget, max_steps - steps))
+                elif taken < self.MACRO_MIN_GAIN * (macro.moves - moves):
+                    slow = True
+                    break
+                budget *= 2
+            macro.sync()
+            if slow and steps < max_steps and self.state != 'HALT':
+                steps += self._run_compiled(min(compiled_window, max_steps - steps))
+                compiled_window *= 2
+        elapsed = time.perf_counter() - started
+        return steps, steps / elapsed if elapsed > 0 else float('inf')
+
+class MacroMachine:
+    """Block-symbol simulator for long Turing machine runs.
+
+    The tape is cut into blocks of `block_size` cells, stored as run-length
+    encoded stacks on either side of the head. Entering a block from one side
+    is simulated once per (state, block, side) and cached as a macro
+    transition. When a macro transition leaves the state unchanged and
+    carries on in the same direction, the head sweeps the whole run of
+    identical blocks ahead of it, so that run is rewritten in a single chain
+    step. Step counts are exact: when the remaining budget is smaller than
+    the next macro step, the last block is simulated cell by cell.
+    """
+
+    def __init__(self, machine, block_size=1):
+        self.machine = machine
+        self.transitions = machine.transitions
+        self.k = block_size
+        self.blank = (Tape.BLANK,) * block_size
+        self.state = machine.state
+        self.steps = 0
+        self.moves = 0          # block and chain steps taken, for run_macro's payoff check
+        self.cache = {}
+
+        # Blocks are aligned so the head starts at the left edge of one
+        tape, head, k = machine.tape, machine.head, block_size
+        span = tape.bounds() or (head, head)
+        first = head - k * -(-(head - span[0]) // k) if span[0] < head else head
+        last = head + k * -(-(span[1] - head + 1) // k) if span[1] >= head else head
+        self.left = []
+        self.right = []
+        for start in range(first, head, k):
+            self._push(self.left, tuple(tape[start:start + k]), 1)
+        for start in range(last - k, head - 1, -k):
+            self._push(self.right, tuple(tape[start:start + k]), 1)
+        self.boundary = head
+        self.facing = 1
+        self.inside = None
+
+    @staticmethod
+    def _push(stack, block, count):
+        if stack and stack[-1][0] == block:
+            stack[-1][1] += count
+        else:
+            stack.append([block, count])
+
+    def _take(self, stack, count):
+        if not stack:
+            return
+        if stack[-1][1] <= count:
+            stack.pop()
+        else:
+            stack[-1][1] -= count
+
+    def _walk(self, state, cells, p, budget=None):
+        """Run the base machine inside one block from cell p.
+
+        Returns (kind, cells, p_or_exit_direction, state, steps) where kind is
+        'exit', 'halt', 'budget' (ran out of steps) or 'loop' (never leaves;
+        only without a budget). Cycles inside the block are skipped when a
+        budget is given. A 'halt' because no rule matches keeps the last live
+        state: the plain machine only halts there if it has a step to spare,
+        which the caller decides.
+        """
+        steps = 0
+        seen = {}
+        while True:
+            if state == 'HALT':
+                return 'halt', cells, p, state, steps
+            if budget is not None and steps == budget:
+                return 'budget', cells, p, state, steps
+            rule = self.transitions.get((state, cells[p]))
+            if rule is None:
+                return 'halt', cells, p, state, steps
+            config = (state, p, tuple(cells))
+            if config in seen:
+                if budget is None:
+                    return 'loop', cells, p, state, steps
+                period = steps - seen[config]
+                steps += (budget - steps) // period * period
+                seen = {}
+                continue
+            seen[config] = steps
+
+            state, cells[p], direction = rule
+            p += MOVES.get(direction, 0)
+            steps += 1
+            if p < 0:
+                return 'exit', cells, -1, state, steps
+            if p >= self.k:
+                return 'exit', cells, 1, state, steps
+
+    def _macro(self, state, block, facing):
+        key = (state, block, facing)
+        if key not in self.cache:
+            entry = 0 if facing > 0 else self.k - 1
+            kind, cells, where, new_state, steps = self._walk(state, list(block), entry)
+            self.cache[key] = (kind, tuple(cells), where, new_state, steps)
+        return self.cache[key]
+
+    def run(self, max_steps, exact=True):
+        """Advance by up to max_steps base steps; returns the steps taken.
+
+        With exact=False the run stops before a block step that would not
+        fit in the budget instead of finishing it cell by cell, so it can
+        be resumed with another run() call.
+        """
+        start_steps = self.steps
+        limit = self.steps + max_steps
+        while self.steps < limit and self.state != 'HALT' and self.inside is None:
+            front, back = (self.right, self.left) if self.facing > 0 else (self.left, self.right)
+            block, available = front[-1] if front else (self.blank, None)
+            kind, new_block, where, new_state, steps = self._macro(self.state, block, self.facing)
+            remaining = limit - self.steps
+            self.moves += 1
+
+            if kind == 'exit' and new_state == self.state and where == self.facing:
+                # Chain step: sweep every identical block ahead in one go
+                count = remaining // steps
+                if available is not None:
+                    count = min(count, available)
+                if count == 0:
+                    if exact:
+                        self._finish(front, block, remaining)
+                    break
+                self._take(front, count)
+                self._push(back, new_block, count)
+                self.boundary += self.facing * self.k * count
+                self.steps += count * steps
+            elif kind == 'exit' and steps <= remaining:
+                self._take(front, 1)
+                if where == self.facing:
+                    self._push(back, new_block, 1)
+                    self.boundary += self.facing * self.k
+                else:
+                    self._push(front, new_block, 1)
+                    self.facing = where
+                self.state = new_state
+                self.steps += steps
+            elif kind == 'halt' and steps <= remaining:
+                self._take(front, 1)
+                self.inside = (list(new_block), where)
+                # Stuck without a rule: the plain run notices only with budget left
+                self.state = 'HALT' if steps < remaining else new_state
+                self.steps += steps
+            else:
+                if exact:
+                    self._finish(front, block, remaining)
+                break
+        return self.steps - start_steps
+
+    def _finish(self, front, block, budget):
+        """Spend the remaining budget cell by cell inside the next block."""
+        self._take(front, 1)
+        entry = 0 if self.facing > 0 else self.k - 1
+        kind, cells, p, self.state, steps = self._walk(self.state, list(block), entry, budget)
+        if kind == 'halt':
+            self.state = 'HALT'
+        self.inside = (cells, p)
+        self.steps += steps
+
+    @property
+    def head(self):
+        if self.inside is None:
+            return self.boundary if self.facing > 0 else self.boundary - 1
+        return self._block_start() + self.inside[1]
+
+    def _block_start(self):
+        return self.boundary if self.facing > 0 else self.boundary - self.k
+
+    def runs(self):
+        """(start, [(symbol, count), ...]) of the tape in base symbols."""
+        blocks = [(tuple(b), n) for b, n in self.left]
+        if self.inside is not None:
+            blocks.append((tuple(self.inside[0]), 1))
+        blocks += [(tuple(b), n) for b, n in reversed(self.right)]
+
+        left_cells = sum(n for _, n in self.left) * self.k
+        start = (self.boundary if self.inside is None else self._block_start()) - left_cells
+        runs = []
+        for block, count in blocks:
+            if len(set(block)) == 1:
+                pieces = [(block[0], self.k * count)]
+            else:
+                pieces = [(symbol, sum(1 for _ in group)) for symbol, group in groupby(block * count)]
+            for symbol, length in pieces:
+                if runs and runs[-1][0] == symbol:
+                    runs[-1] = (symbol, runs[-1][1] + length)
+                else:
+                    runs.append((symbol, length))
+        return start, runs
+
+    def sync(self):
+        """Write state, head, step count and the expanded tape back."""
+        machine = self.machine
+        machine.tape = Tape.from_runs(*self.runs())
+        machine.head = self.head
+        machine.state = self.state
+        machine.step_count += self.steps
+        machine.compiled = None
+        # A macro run has no per-step history to add to a recording
+        machine.recorder = None
+        self.steps = 0
+
+class TraceRecorder:
+    """Compact step log of a TuringMachine with random access.
+
+    Each step is stored as three array entries (symbol written, head move,
+    new state) and the full tape is checkpointed as runs every `interval`
+    steps, so any recorded step is rebuilt from the checkpoint before it in
+    at most `interval` replayed steps. Once the tape buffer is longer than
+    `interval`, checkpoints are spaced by its length instead, which keeps
+    checkpointing from dominating long runs on a long tape. Recording after a seek drops the history past that point.
+    With a `limit`, the oldest checkpoint segments are dropped and `start`
+    moves forward once the log grows past `limit` steps, so it holds at most
+    `limit` plus one checkpoint spacing (a step costs about 7 bytes).
+    """
+
+    def __init__(self, machine, interval=1024, limit=None):
+        self.machine = machine
+        self.transitions = machine.transitions
+        self.interval = interval
+        self.limit = limit
+        self.start = machine.step_count
+        self.symbols = []
+        self.symbol_codes = {}
+        self.states = []
+        self.state_codes = {}
+        self.writes = array('H')
+        self.moves = array('b')
+        self.next_states = array('I')
+        self.checkpoints = []
+        self.checkpoint_steps = []
+        self.next_checkpoint = 0
+        self.halted = False
+        self.checkpoint()
+
+    def __len__(self):
+        return len(self.moves)
+
+    def _symbol(self, symbol):
+        code = self.symbol_codes.get(symbol)
+        if code is None:
+            code = self.symbol_codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return code
+
+    def _state(self, state):
+        code = self.state_codes.get(state)
+        if code is None:
+            code = self.state_codes[state] = len(self.states)
+            self.states.append(state)
+        return code
+
+    def checkpoint(self):
+        m = self.machine
+        start, runs = m.tape.runs()
+        self.checkpoints.append((m.state, m.head, start, runs))
+        self.checkpoint_steps.append(len(self))
+        # Taking a checkpoint scans the whole tape buffer
+        self.next_checkpoint = len(self) + max(self.interval, len(m.tape.cells))
+        if self.limit is not None and len(self) > self.limit:
+            self._drop_oldest()
+
+    def _drop_oldest(self):
+        """Forget whole checkpoint segments from the front until within limit."""
+        if len(self.checkpoint_steps) < 2:
+            return
+        keep = 1
+        while keep < len(self.checkpoint_steps) - 1 and len(self) - self.checkpoint_steps[keep] > self.limit:
+            keep += 1
+        dropped = self.checkpoint_steps[keep]
+        del self.writes[:dropped]
+        del self.moves[:dropped]
+        del self.next_states[:dropped]
+        del self.checkpoints[:keep]
+        self.checkpoint_steps = [step - dropped for step in self.checkpoint_steps[keep:]]
+        self.next_checkpoint -= dropped
+        self.start += dropped
+
+    def _truncate(self):
+        """Forget everything after the machine's current step."""
+        n = self.machine.step_count - self.start
+        if n != len(self):
+            del self.writes[n:]
+            del self.moves[n:]
+            del self.next_states[n:]
+            keep = bisect_right(self.checkpoint_steps, n)
+            del self.checkpoints[keep:]
+            del self.checkpoint_steps[keep:]
+            self.next_checkpoint = n
+            self.halted = False
+
+    def record(self, write, move, state):
+        """Log one step; call before the machine applies it."""
+        self._truncate()
+        self.writes.append(self._symbol(write))
+        self.moves.append(move)
+        self.next_states.append(self._state(state))
+
+    def recorded(self):
+        """Call after the machine applied a recorded step."""
+        if len(self) >= self.next_checkpoint:
+            self.checkpoint()
+
+    def record_halt(self):
+        self._truncate()
+        self.halted = True
+
+    def run(self, max_steps):
+        """Compiled run loop of the machine that also fills the log."""
+        m = self.machine
+        states, width, next_state, write, move = m.compile()
+        halt = states['HALT'] * width
+        if m.state == 'HALT' or max_steps <= 0:
+            return 0
+        if m.state not in states:
+            self.record_halt()
+            m.state = 'HALT'
+            return 0
+        self._truncate()
+
+        tape = m.tape
+        names = list(states)
+        # Per-transition log entries in the recorder's own codes
+        logged_write = [self._symbol(tape.symbols[code]) for code in write]
+        logged_state = [self._state(names[s // width]) if s >= 0 else 0 for s in next_state]
+        writes, moves, next_states = self.writes, self.moves, self.next_states
+        tape.ensure(m.head)
+        cells = tape.cells
+        size = len(cells)
+        pos = m.head + tape.offset
+        state = states[m.state] * width
+        steps = 0
+        recorded = len(moves)
+        checkpoint = max(self.next_checkpoint, recorded + 1)
+        while steps < max_steps and state != halt:
+            k = state + cells[pos]
+            new_state = next_state[k]
+            if new_state < 0:
+                self.halted = True
+                state = halt
+                break
+            cells[pos] = write[k]
+            pos += move[k]
+            state = new_state
+            steps += 1
+            writes.append(logged_write[k])
+            moves.append(move[k])
+            next_states.append(logged_state[k])
+
+            if not 0 <= pos < size or recorded + steps == checkpoint:
+                head = pos - tape.offset
+                tape.ensure(head)
+                cells = tape.cells
+                size = len(cells)
+                pos = head + tape.offset
+                if recorded + steps == checkpoint:
+                    m.state, m.head = names[state // width], head
+                    self.checkpoint()
+                    # Checkpointing may have dropped old steps off the front
+                    recorded = len(moves) - steps
+                    checkpoint = self.next_checkpoint
+
+        m.state = names[state // width]
+        m.head = pos - tape.offset
+        m.step_count += steps
+        return steps
+
+    def configuration(self, step):
+        """(state, head, Tape) after `step` steps of the recording."""
+        if not 0 <= step - self.start <= len(self):
+            raise IndexError(f"Step {step} was not recorded")
+        n = step - self.start
+        i = bisect_right(self.checkpoint_steps, n) - 1
+        state, head, start, runs = self.checkpoints[i]
+        tape = Tape.from_runs(start, runs)
+        symbols, states = self.symbols, self.states
+        for i in range(self.checkpoint_steps[i], n):
+            tape[head] = symbols[self.writes[i]]
+            head += self.moves[i]
+            state = states[self.next_states[i]]
+        if n == len(self) and self.halted:
+            state = 'HALT'
+        return state, head, tape
+
+    def seek(self, step):
+        """Put the machine into its recorded configuration at `step`."""
+        m = self.machine
+        m.state, m.head, m.tape = self.configuration(step)
+        m.step_count = step
+        m.compiled = None
+
+    # -----------------------------
+    # Save / load
+    # -----------------------------
+    def save(self, path):
+        """One JSON header line followed by the raw step arrays."""
+        m = self.machine
+        header = {
+            'version': 1,
+            'byteorder': sys.byteorder,
+            'interval': self.interval,
+            'limit': self.limit,
+            'start': self.start,
+            'steps': len(self),
+            'halted': self.halted,
+            'initial_tape': m.initial_tape,
+            'transitions': [[s, sym, ns, w, d] for (s, sym), (ns, w, d) in self.transitions.items()],
+            'symbols': self.symbols,
+            'states': self.states,
+            'checkpoints': self.checkpoints,
+            'checkpoint_steps': self.checkpoint_steps,
+        }
+        with open(path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b'\n')
+            for data in (self.writes, self.moves, self.next_states):
+                data.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Recorder of a saved run, attached to a new machine at its last step."""
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            transitions = {(s, sym): (ns, w, d) for s, sym, ns, w, d in header['transitions']}
+            machine = TuringMachine(header['initial_tape'], transitions)
+            machine.step_count = header['start']
+            recorder = machine.record(header['interval'], header.get('limit'))
+            recorder.checkpoints = [(state, head, start, [tuple(run) for run in runs])
+                                    for state, head, start, runs in header['checkpoints']]
+            recorder.checkpoint_steps = header['checkpoint_steps']
+            recorder.halted = header['halted']
+            for name in header['symbols']:
+                recorder._symbol(name)
+            for name in header['states']:
+                recorder._state(name)
+            for data in (recorder.writes, recorder.moves, recorder.next_states):
+                data.fromfile(f, header['steps'])
+                if header['byteorder'] != sys.byteorder:
+                    data.byteswap()
+        recorder.seek(recorder.start + len(recorder))
+        return recorder
+
+def parse_transitions(text):
+    """Parse lines of "state symbol -> new_state write dir" into a transitions
+    dict. Lines without "->" are skipped; malformed ones raise ValueError."""
+    transitions = {}
+    for line in text.strip().split('\n'):
+        if '->' not in line:
+            continue
+        try:
+            left, right = line.split('->')
+            state, symbol = left.strip().split()
+            new_state, write, move = right.strip().split()
+        except ValueError:
+            raise ValueError(f"Invalid transition format: {line}") from None
+        transitions[(state, symbol)] = (new_state, write, move)
+    return transitions
+
+def check_macro(tape, transitions, max_steps, block_size=1):
+    """Run a machine plainly and through MacroMachine; True if they agree."""
+    plain = TuringMachine(tape, transitions)
+    plain.run(max_steps)
+    fast = TuringMachine(tape, transitions)
+    fast.run_macro(max_steps, block_size)
+    return ((plain.state, plain.head, str(plain.tape), plain.step_count)
+            == (fast.state, fast.head, str(fast.tape), fast.step_count))
@@ -0,0 +1,280 @@
+"""Render the block, gravity and particle scenes offline at a fixed frame rate.
+
+    python export_video.py blocks clip.mp4 --size 3840x2160 --fps 60 --seconds 20 --m1 10000
+    python export_video.py gravity frames/%05d.png --seconds 10
+    python export_video.py particles gas.mp4 --count 200 --seed 1
+
+Physics advances exactly 1/fps of simulated time per frame no matter how
+long a frame takes to draw, so the same arguments always give the same
+frames. The main process steps the scene and hands small per-frame
+snapshots to a pool of worker processes, which draw them on off-screen
+surfaces. Frames are either piped in order to an ffmpeg subprocess as raw
+RGB or, for an output like frames/%05d.png, saved as PNGs by the workers.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import numpy as np
+import pygame as game
+
+from crowd_dynamics.blocks import SlidingBlocks
+from crowd_dynamics.nbody import GravitySystem
+from crowd_dynamics.particles import Particle, step as particle_step
+from hud import TextCache
+
+REFERENCE = (1920, 1080)   # scenes lay out in these units and are scaled to the output
+WHITE = (255, 255, 255)
+
+# -----------------------------
+# Scenes
+# -----------------------------
+class BlockScene(SlidingBlocks):
+    """The blocks from main.py laid out on the reference screen."""
+
+    def __init__(self, m1=100.0, v1=-300.0, m2=1.0, v2=0.0):
+        super().__init__(m1, v1, m2, v2, *REFERENCE)
+
+    def draw(self, frame, snapshot):
+        x1, v1, x2, v2, collisions = snapshot
+        width = REFERENCE[0]
+        frame.text(48, f"Collisions: {collisions}", (50, 30))
+        frame.text(48, f"Distance: {int(x1 - (x2 + self.size2))} px", (50, 80))
+        for row, (label, m, v, x) in enumerate([("Block 1 (Big):", self.m1, v1, x1),
+                                                 ("Block 2 (Small):", self.m2, v2, x2)]):
+            top = 150 + 200 * row
+            frame.text(28, label, (50, top))
+            frame.text(22, f"Mass: {m} kg", (60, top + 30))
+            frame.text(22, f"Velocity: {round(v, 3)} px/s", (60, top + 60))
+            frame.text(22, f"Momentum: {round(m * v, 3)} kg·px/s", (60, top + 90))
+            frame.text(22, f"X-Position: {round(x, 2)} px", (60, top + 120))
+        frame.rect(WHITE, (x1, self.y1, self.size1, self.size1))
+        frame.rect(WHITE, (max(x2, 0.0), self.y2, self.size2, self.size2))
+        floor = self.y1 + self.size1
+        frame.line((0, 255, 0), (0, floor), (width, floor), 5)
+
+class GravityScene(GravitySystem):
+    """The sun and two planets from gravitySImulator.py; build with sun_and_planets()."""
+
+    names = ["Sun", "Blue", "Red"]
+    colors = [(255, 255, 0), (0, 0, 255), (255, 0, 0)]
+    radii = [20, 5, 5]
+
+    def snapshot(self):
+        return (self.pos.copy(), self.vel.copy(), np.array(self.trail).reshape(-1, len(self.mass), 2))
+
+    def draw(self, frame, snapshot):
+        pos, vel, trail = snapshot
+        for i, color in enumerate(self.colors):
+            for point in trail[:, i]:
+                frame.circle(color, point, 2)
+            frame.circle(color, pos[i], self.radii[i])
+            frame.text(18, f"{self.names[i]} v=({vel[i, 0]:.1f},{vel[i, 1]:.1f})",
+                       (pos[i, 0] + self.radii[i] + 5, pos[i, 1] - self.radii[i] - 5))
+
+class ParticleScene:
+    """The colliding discs of computePI.py's collision mode, filling the reference screen.
+
+    The interactive version moves the discs one step per frame at 60 FPS;
+    step() takes `rate` such steps per simulated second. Discs are placed
+    from `seed`, so the same arguments give the same clip.
+    """
+
+    COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0),
+              (255, 0, 255), (0, 255, 255), (255, 128, 0), (128, 0, 255)]
+
+    def __init__(self, count=40, seed=0, rate=60):
+        rng = random.Random(seed)
+        self.particles = []
+        self.colors = []
+        for _ in range(count):
+            radius = rng.randint(5, 15)
+            particle = Particle(rng.uniform(radius, REFERENCE[0] - radius), rng.uniform(radius, REFERENCE[1] - radius),
+                                radius)
+            particle.width, particle.height = REFERENCE
+            particle.vx, particle.vy = rng.uniform(-2, 2), rng.uniform(-2, 2)
+            self.particles.append(particle)
+            self.colors.append(rng.choice(self.COLORS))
+        self.rate = rate
+        self.time = 0.0
+        self.steps = 0
+
+    def step(self, dt):
+        self.time += dt
+        target = int(round(self.time * self.rate, 9))
+        for _ in range(target - self.steps):
+            particle_step(self.particles)
+        self.steps = target
+
+    def snapshot(self):
+        return np.array([(p.x, p.y) for p in self.particles])
+
+    def draw(self, frame, snapshot):
+        for (x, y), particle, color in zip(snapshot, self.particles, self.colors):
+            frame.circle(color, (x, y), particle.radius)
+        frame.text(28, f"Particles: {len(self.particles)}", (50, 30))
+
+SCENES = {'blocks': BlockScene, 'gravity': GravityScene, 'particles': ParticleScene}
+
+# -----------------------------
+# Drawing
+# -----------------------------
+class Frame:
+    """Off-screen surface that scenes draw on in REFERENCE coordinates."""
+
+    def __init__(self, scene, size, background=(0, 0, 0)):
+        self.scene = scene
+        self.surface = game.Surface(size)
+        self.background = background
+        self.scale = min(size[0] / REFERENCE[0], size[1] / REFERENCE[1])
+        self.offset = ((size[0] - REFERENCE[0] * self.scale) / 2, (size[1] - REFERENCE[1] * self.scale) / 2)
+        self.fonts = {}
+        self.cache = TextCache()
+
+    def _xy(self, point):
+        return (self.offset[0] + point[0] * self.scale, self.offset[1] + point[1] * self.scale)
+
+    def text(self, size, text, pos, color=WHITE):
+        if size not in self.fonts:
+            self.fonts[size] = game.font.Font(None, max(1, round(size * self.scale)))
+        self.surface.blit(self.cache.render(self.fonts[size], text, color), self._xy(pos))
+
+    def rect(self, color, rect):
+        x, y = self._xy(rect[:2])
+        game.draw.rect(self.surface, color, game.Rect(x, y, rect[2] * self.scale, rect[3] * self.scale))
+
+    def line(self, color, start, end, width=1):
+        game.draw.line(self.surface, color, self._xy(start), self._xy(end), max(1, round(width * self.scale)))
+
+    def circle(self, color, center, radius):
+        game.draw.circle(self.surface, color, self._xy(center), max(1, radius * self.scale))
+
+    def render(self, snapshot):
+        self.surface.fill(self.background)
+        self.scene.draw(self, snapshot)
+        return self.surface
+
+_frame = None
+
+def _init_worker(scene, size):
+    global _frame
+    game.font.init()
+    _frame = Frame(scene, size)
+
+def _render_raw(snapshot):
+    return game.image.tobytes(_frame.render(snapshot), 'RGB')
+
+def _render_png(job):
+    snapshot, path = job
+    game.image.save(_frame.render(snapshot), path)
+    return path
+
+# -----------------------------
+# Export
+# -----------------------------
+def snapshots(scene, fps, frames):
+    """Per-frame snapshots, stepping the scene 1/fps of simulated time each."""
+    for _ in range(frames):
+        yield scene.snapshot()
+        scene.step(1 / fps)
+
+def _ordered(pool, fn, jobs, window):
+    """pool.map that keeps at most `window` frames in flight, in order."""
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.submit(fn, job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def encoder_command(output, size, fps, crf=18):
+    return ['ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+            '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', str(crf), output]
+
+def export(scene, output, size=(1920, 1080), fps=60, seconds=10.0, processes=None, crf=18,
+           progress=None):
+    """Render `seconds` of `scene` to a video file or a PNG sequence.
+
+    An output containing a printf-style frame number (frames/%05d.png) is
+    written as PNGs; anything else is encoded by ffmpeg. Returns the number
+    of frames written.
+    """
+    frames = int(round(seconds * fps))
+    processes = processes or os.cpu_count() or 1
+    window = 2 * processes
+    png = '%' in output
+    # Spawned rather than forked: a forked worker would inherit the encoder's
+    # stdin pipe and ffmpeg would never see end of input
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(processes, context, _init_worker, (scene, size)) as pool:
+        if png:
+            directory = os.path.dirname(output)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            jobs = ((snapshot, output % i) for i, snapshot in enumerate(snapshots(scene, fps, frames)))
+            for i, _ in enumerate(_ordered(pool, _render_png, jobs, window)):
+                if progress:
+                    progress(i + 1, frames)
+            return frames
+
+        encoder = subprocess.Popen(encoder_command(output, size, fps, crf), stdin=subprocess.PIPE)
+        try:
+            for i, data in enumerate(_ordered(pool, _render_raw, snapshots(scene, fps, frames), window)):
+                encoder.stdin.write(data)
+                if progress:
+                    progress(i + 1, frames)
+        finally:
+            encoder.stdin.close()
+            if encoder.wait() != 0:
+                raise RuntimeError(f"ffmpeg exited with status {encoder.returncode}")
+    return frames
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a simulation offline to video or PNG frames.")
+    parser.add_argument('scene', choices=sorted(SCENES))
+    parser.add_argument('output', help="video file (encoded with ffmpeg) or PNG pattern like frames/%%05d.png")
+    parser.add_argument('--size', default='1920x1080', help="WIDTHxHEIGHT (default 1920x1080)")
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--crf', type=int, default=18, help="x264 quality (lower is better)")
+    parser.add_argument('-j', '--processes', type=int, help="render processes (default: CPU count)")
+    parser.add_argument('--m1', type=float, default=100.0, help="block 1 mass (blocks scene)")
+    parser.add_argument('--v1', type=float, default=-300.0, help="block 1 velocity in px/s")
+    parser.add_argument('--m2', type=float, default=1.0, help="block 2 mass")
+    parser.add_argument('--v2', type=float, default=0.0, help="block 2 velocity in px/s")
+    parser.add_argument('--count', type=int, default=40, help="number of discs (particles scene)")
+    parser.add_argument('--seed', type=int, default=0, help="disc placement seed (particles scene)")
+    args = parser.parse_args(argv)
+
+    try:
+        size = tuple(int(n) for n in args.size.lower().split('x'))
+    except ValueError:
+        size = ()
+    if len(size) != 2:
+        parser.error(f"Invalid --size: {args.size}")
+    if args.scene == 'blocks':
+        scene = BlockScene(args.m1, args.v1, args.m2, args.v2)
+    elif args.scene == 'gravity':
+        scene = GravityScene.sun_and_planets(*REFERENCE)
+    else:
+        scene = ParticleScene(args.count, args.seed)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} frames", end='', file=sys.stderr, flush=True)
+
+    try:
+        export(scene, args.output, size, args.fps, args.seconds, args.processes, args.crf, progress)
+    except FileNotFoundError:
+        parser.error("ffmpeg not found; install it or write PNG frames (e.g. frames/%05d.png)")
+    print(file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Per-phase frame timing for the pygame programs.
+
+Enabled with the FRAME_PROFILE environment variable:
+
+    FRAME_PROFILE=1 python main.py             # on-screen p50/p99 overlay
+    FRAME_PROFILE=trace.json python main.py    # overlay, plus a Chrome trace written at exit
+
+Loops call profiler.frame(first_phase) at the top of each frame and
+profiler.mark(phase) where the next phase begins; each phase lasts until the
+next mark. The trace keeps only the last `trace_events` phases (100k is
+about five minutes of a five-phase loop at 60 FPS); load it in
+chrome://tracing or Perfetto. When the variable is unset,
+profiler_from_env() returns a NullProfiler whose methods do nothing.
+"""
+import atexit
+import json
+import os
+import time
+from collections import deque
+
+import numpy as np
+import pygame as game
+
+from hud import Hud, TextCache
+
+class NullProfiler:
+    enabled = False
+
+    def frame(self, phase):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def draw(self, target):
+        pass
+
+    def dump(self, path=None):
+        pass
+
+class FrameProfiler:
+    """Rolling per-phase timings with an overlay and optional Chrome trace."""
+
+    enabled = True
+
+    def __init__(self, window=240, trace_path=None, refresh=30, trace_events=100_000):
+        self.window = window
+        self.refresh = refresh
+        self.trace_path = trace_path
+        self.trace = deque(maxlen=trace_events) if trace_path else None
+        self.samples = {}           # phase -> recent durations in ns
+        self.phase = None
+        self.started = 0
+        self.frame_started = 0
+        self.frames = 0
+        self.rows = []
+        self.font = None
+        self.cache = TextCache(max_size=64)
+
+    def _close(self, now):
+        duration = now - self.started
+        samples = self.samples.get(self.phase)
+        if samples is None:
+            samples = self.samples[self.phase] = deque(maxlen=self.window)
+        samples.append(duration)
+        if self.trace is not None:
+            self.trace.append((self.phase, self.started, duration))
+
+    def frame(self, phase):
+        """End the previous frame (and its last phase) and start `phase`."""
+        now = time.perf_counter_ns()
+        if self.phase is not None:
+            self._close(now)
+            self.samples.setdefault('frame', deque(maxlen=self.window)).append(now - self.frame_started)
+        self.frames += 1
+        self.frame_started = self.started = now
+        self.phase = phase
+
+    def mark(self, phase):
+        now = time.perf_counter_ns()
+        if self.phase is not None:
+            self._close(now)
+        self.started = now
+        self.phase = phase
+
+    def summary(self):
+        """(phase, p50 ms, p99 ms) over the last `window` frames."""
+        rows = []
+        for phase, samples in self.samples.items():
+            p50, p99 = np.percentile(np.fromiter(samples, float, len(samples)), [50, 99]) / 1e6
+            rows.append((phase, p50, p99))
+        return rows
+
+    # -----------------------------
+    # Overlay
+    # -----------------------------
+    def draw(self, target):
+        """Draw the p50/p99 table in the bottom right of a Surface or Hud."""
+        if self.frames % self.refresh == 1 or not self.rows:
+            self.rows = [f"{'phase, ms':<10}{'p50':>8}{'p99':>8}"] + [
+                f"{phase:<10}{p50:8.2f}{p99:8.2f}" for phase, p50, p99 in self.summary()]
+        if self.font is None:
+            if not game.font.get_init():
+                return
+            self.font = game.font.SysFont('monospace', 16)
+        surface = target.screen if isinstance(target, Hud) else target
+        width, height = surface.get_size()
+        line = self.font.get_linesize()
+        x, y = width - 260, height - 10 - line * len(self.rows)
+        for i, text in enumerate(self.rows):
+            color = (255, 200, 0) if i == 0 else (200, 200, 200)
+            if isinstance(target, Hud):
+                target.text(self.font, text, (x, y + i * line), color)
+            else:
+                surface.blit(self.cache.render(self.font, text, color), (x, y + i * line))
+
+    # -----------------------------
+    # Chrome trace
+    # -----------------------------
+    def dump(self, path=None):
+        """Write the recorded phases as Chrome trace-event JSON."""
+        path = path or self.trace_path
+        if path is None or self.trace is None:
+            return
+        events = [{'name': phase, 'cat': 'frame', 'ph': 'X', 'ts': start / 1000, 'dur': duration / 1000,
+                   'pid': os.getpid(), 'tid': 0} for phase, start, duration in self.trace]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+def profiler_from_env(variable='FRAME_PROFILE'):
+    """FrameProfiler if `variable` is set ("1" or a trace path), else NullProfiler."""
+    value = os.environ.get(variable, '')
+    if value in ('', '0'):
+        return NullProfiler()
+    profiler = FrameProfiler(trace_path=None if value == '1' else value)
+    if profiler.trace_path:
+        atexit.register(profiler.dump)
+    return profiler
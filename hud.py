@@ -0,0 +1,128 @@
+import pygame as game
+from collections import OrderedDict
+
+class TextCache:
+    """Rendered text surfaces keyed on (font, text, color).
+
+    Labels whose value doesn't change between frames are rendered once; the
+    least recently used surfaces are dropped past `max_size` so labels
+    showing live numbers don't grow the cache without bound.
+    """
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+class Hud:
+    """Draw list for one frame that only pushes the parts that changed.
+
+    Drawing calls mirror pygame.draw / Surface.blit but are recorded instead
+    of drawn. present() compares the list with the previous frame's: every
+    item that appeared, disappeared or moved marks its bounding rect dirty,
+    only those rects are cleared and redrawn (with everything overlapping
+    them, in order), and only they are sent to pygame.display.update().
+    """
+
+    def __init__(self, screen, background="black", cache=None):
+        self.screen = screen
+        self.background = background
+        self.cache = cache if cache is not None else TextCache()
+        self.items = []
+        self.previous = None
+
+    def _add(self, key, bounds, draw, *args):
+        self.items.append((key, game.Rect(bounds), draw, args))
+
+    # -----------------------------
+    # Drawing
+    # -----------------------------
+    def text(self, font, text, pos, color=(255, 255, 255)):
+        surface = self.cache.render(font, text, color)
+        rect = surface.get_rect(topleft=(int(pos[0]), int(pos[1])))
+        self._add(('text', font, text, color, rect.topleft), rect, self.screen.blit, surface, rect)
+        return rect
+
+    def rect(self, color, rect, width=0):
+        rect = game.Rect(rect)
+        self._add(('rect', color, tuple(rect), width), rect, game.draw.rect, self.screen, color, rect, width)
+
+    def line(self, color, start, end, width=1):
+        self.lines(color, False, [start, end], width)
+
+    def lines(self, color, closed, points, width=1):
+        points = tuple((int(x), int(y)) for x, y in points)
+        self._add(('lines', color, closed, points, width), _bounds(points, width),
+                  game.draw.lines, self.screen, color, closed, points, width)
+
+    def polygon(self, color, points, width=0):
+        points = tuple((int(x), int(y)) for x, y in points)
+        self._add(('polygon', color, points, width), _bounds(points, width),
+                  game.draw.polygon, self.screen, color, points, width)
+
+    # -----------------------------
+    # Frame
+    # -----------------------------
+    def dirty_rects(self):
+        current = {key: bounds for key, bounds, _, _ in self.items}
+        if self.previous is None:
+            return [self.screen.get_rect()]
+        changed = [bounds for key, bounds in current.items() if key not in self.previous]
+        changed += [bounds for key, bounds in self.previous.items() if key not in current]
+        if len(changed) > 64:
+            changed = [changed[0].unionall(changed[1:])]
+        # Clipped lines and polygons don't rasterise exactly like unclipped
+        # ones, so an area that touches one grows to cover it whole
+        outlines = [bounds for key, bounds in current.items() if key[0] in ('lines', 'polygon')]
+        screen_rect = self.screen.get_rect()
+        dirty = []
+        for area in changed:
+            grown = True
+            while grown:
+                grown = False
+                for bounds in outlines:
+                    if area.colliderect(bounds) and not area.contains(bounds):
+                        area = area.union(bounds)
+                        grown = True
+            area = area.clip(screen_rect)
+            if area.width and area.height:
+                dirty.append(area)
+        return dirty
+
+    def present(self):
+        """Redraw the dirty rects, update the display and start a new frame."""
+        dirty = self.dirty_rects()
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.fill(self.background)
+            for _, bounds, draw, args in self.items:
+                if bounds.colliderect(area):
+                    draw(*args)
+        self.screen.set_clip(None)
+        if dirty:
+            game.display.update(dirty)
+        self.previous = {key: bounds for key, bounds, _, _ in self.items}
+        self.items = []
+        return dirty
+
+    def invalidate(self):
+        """Redraw the whole screen on the next present()."""
+        self.previous = None
+
+def _bounds(points, width):
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    pad = max(width, 1)
+    return game.Rect(min(xs) - pad, min(ys) - pad, max(xs) - min(xs) + 2 * pad + 1,
+                     max(ys) - min(ys) + 2 * pad + 1)
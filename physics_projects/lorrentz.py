@@ -1,33 +1,19 @@
-import numpy as np
+import os
+import sys
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
-from scipy.integrate import solve_ivp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crowd_dynamics.ode import lorenz_trajectory
 
 # Initial parameters
 sigma_init = 10
 rho_init = 28
 beta_init = 8 / 3
 
-# Lorenz system definition
-def lorenz(t, state, sigma, rho, beta):
-    x, y, z = state
-    dx = sigma * (y - x)
-    dy = x * (rho - z) - y
-    dz = x * y - beta * z
-    return [dx, dy, dz]
-
 # Solve and plot the Lorenz attractor
 def update_plot(val=None):
-    sigma = s_sigma.val
-    rho = s_rho.val
-    beta = s_beta.val
-
-    sol = solve_ivp(
-        lambda t, y: lorenz(t, y, sigma, rho, beta),
-        [0, 40],
-        [1, 1, 1],
-        t_eval=np.linspace(0, 40, 10000)
-    )
+    sol = lorenz_trajectory(s_sigma.val, s_rho.val, s_beta.val, t_end=40, state=(1, 1, 1), samples=10000)
     
     ax.cla()
     ax.plot(sol.y[0], sol.y[1], sol.y[2], lw=0.5)
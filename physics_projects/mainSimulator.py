@@ -1,8 +1,8 @@
 # Enhanced Falstad-like Circuit Simulator in Python
-# Includes: DC Analysis, Interactive Component Placement, Oscilloscope, Node Highlighting, and Future Extension Hooks
+# Includes: DC and Transient Analysis, Interactive Component Placement, Oscilloscope, Node Highlighting, and Future Extension Hooks
 
+import os
 import sys
-import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout,
                              QLabel, QGraphicsScene, QGraphicsView, QGraphicsLineItem,
                              QHBoxLayout, QLineEdit, QMessageBox)
@@ -11,67 +11,11 @@ from PyQt5.QtCore import Qt, QPointF
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-# -----------------------------
-# Basic Circuit Elements
-# -----------------------------
-class Resistor:
-    def __init__(self, n1, n2, resistance):
-        self.n1 = n1
-        self.n2 = n2
-        self.resistance = resistance
-
-class VoltageSource:
-    def __init__(self, n1, n2, voltage):
-        self.n1 = n1
-        self.n2 = n2
-        self.voltage = voltage
-
-# -----------------------------
-# Circuit Simulation Logic
-# -----------------------------
-class Circuit:
-    def __init__(self):
-        self.resistors = []
-        self.voltage_sources = []
-
-    def add_resistor(self, r):
-        self.resistors.append(r)
-
-    def add_voltage_source(self, v):
-        self.voltage_sources.append(v)
-
-    def solve_dc(self):
-        nodes = set()
-        for r in self.resistors:
-            nodes.update([r.n1, r.n2])
-        for v in self.voltage_sources:
-            nodes.update([v.n1, v.n2])
-
-        node_map = {n: i for i, n in enumerate(nodes)}
-        n = len(node_map)
-        A = np.zeros((n, n))
-        b = np.zeros(n)
-
-        for r in self.resistors:
-            i = node_map[r.n1]
-            j = node_map[r.n2]
-            if i != j:
-                A[i, i] += 1 / r.resistance
-                A[j, j] += 1 / r.resistance
-                A[i, j] -= 1 / r.resistance
-                A[j, i] -= 1 / r.resistance
-
-        for v in self.voltage_sources:
-            i = node_map[v.n1]
-            j = node_map[v.n2]
-            b[i] += v.voltage
-            b[j] -= v.voltage
-
-        try:
-            x = np.linalg.solve(A, b)
-            return {node: round(x[i], 2) for node, i in node_map.items()}
-        except np.linalg.LinAlgError:
-            return "Circuit cannot be solved"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The engine lives in crowd_dynamics.circuits; these names are re-exported so
+# existing `from mainSimulator import Circuit` code keeps working
+from crowd_dynamics.circuits import (Capacitor, Circuit, Inductor, MonteCarloResult, Resistor, TransientResult,
+                                     TransientSystem, VoltageSource, solve_stacked)
 
 # -----------------------------
 # Circuit Drawing Canvas
@@ -84,7 +28,8 @@ class CircuitCanvas(QGraphicsScene):
         self.node_count = 1
 
     def add_component(self, x1, y1, x2, y2, ctype, value):
-        pen = QPen(Qt.blue if ctype == 'R' else Qt.red, 2)
+        colors = {'R': Qt.blue, 'C': Qt.darkGreen, 'L': Qt.darkMagenta}
+        pen = QPen(colors.get(ctype, Qt.red), 2)
         line = QGraphicsLineItem(x1, y1, x2, y2)
         line.setPen(pen)
         self.addItem(line)
@@ -112,6 +57,17 @@ class Oscilloscope(FigureCanvas):
         self.axes.set_ylabel("Voltage (V)")
         self.draw()
 
+    def plot_waveforms(self, result, max_traces=8):
+        self.axes.clear()
+        for node in result.nodes[:max_traces]:
+            self.axes.plot(result.time, result[node], label=str(node))
+        self.axes.set_title("Transient Response")
+        self.axes.set_xlabel("Time (s)")
+        self.axes.set_ylabel("Voltage (V)")
+        if result.nodes:
+            self.axes.legend(loc='upper right', fontsize='small')
+        self.draw()
+
 # -----------------------------
 # Main GUI Window
 # -----------------------------
@@ -132,15 +88,24 @@ class CircuitSimulator(QMainWindow):
         self.label = QLabel("Add components below, then solve:")
         self.res_input = QLineEdit("100")
         self.volt_input = QLineEdit("10")
+        self.cap_input = QLineEdit("1e-6")
+        self.ind_input = QLineEdit("1e-3")
+        self.tstop_input = QLineEdit("0.01")
 
         self.btn_add_resistor = QPushButton("Add Resistor")
         self.btn_add_voltage = QPushButton("Add Voltage Source")
+        self.btn_add_capacitor = QPushButton("Add Capacitor")
+        self.btn_add_inductor = QPushButton("Add Inductor")
         self.btn_solve = QPushButton("Solve DC Circuit")
+        self.btn_transient = QPushButton("Run Transient")
 
         # Actions
         self.btn_add_resistor.clicked.connect(self.add_resistor)
         self.btn_add_voltage.clicked.connect(self.add_voltage_source)
+        self.btn_add_capacitor.clicked.connect(self.add_capacitor)
+        self.btn_add_inductor.clicked.connect(self.add_inductor)
         self.btn_solve.clicked.connect(self.solve_circuit)
+        self.btn_transient.clicked.connect(self.run_transient)
 
         # Layouts
         input_layout = QHBoxLayout()
@@ -148,6 +113,12 @@ class CircuitSimulator(QMainWindow):
         input_layout.addWidget(self.res_input)
         input_layout.addWidget(QLabel("Voltage (V):"))
         input_layout.addWidget(self.volt_input)
+        input_layout.addWidget(QLabel("Capacitance (F):"))
+        input_layout.addWidget(self.cap_input)
+        input_layout.addWidget(QLabel("Inductance (H):"))
+        input_layout.addWidget(self.ind_input)
+        input_layout.addWidget(QLabel("Stop Time (s):"))
+        input_layout.addWidget(self.tstop_input)
 
         layout = QVBoxLayout()
         layout.addWidget(self.label)
@@ -155,7 +126,10 @@ class CircuitSimulator(QMainWindow):
         layout.addLayout(input_layout)
         layout.addWidget(self.btn_add_resistor)
         layout.addWidget(self.btn_add_voltage)
+        layout.addWidget(self.btn_add_capacitor)
+        layout.addWidget(self.btn_add_inductor)
         layout.addWidget(self.btn_solve)
+        layout.addWidget(self.btn_transient)
         layout.addWidget(self.oscilloscope)
 
         container = QWidget()
@@ -178,6 +152,22 @@ class CircuitSimulator(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, "Input Error", "Invalid voltage value")
 
+    def add_capacitor(self):
+        try:
+            capacitance = float(self.cap_input.text())
+            n1, n2, _ = self.canvas.add_component(300, 200, 100, 200, 'C', capacitance)
+            self.circuit.add_capacitor(Capacitor(n1, n2, capacitance))
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Invalid capacitance value")
+
+    def add_inductor(self):
+        try:
+            inductance = float(self.ind_input.text())
+            n1, n2, _ = self.canvas.add_component(100, 200, 100, 100, 'L', inductance)
+            self.circuit.add_inductor(Inductor(n1, n2, inductance))
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Invalid inductance value")
+
     def solve_circuit(self):
         result = self.circuit.solve_dc()
         if isinstance(result, dict):
@@ -186,6 +176,22 @@ class CircuitSimulator(QMainWindow):
         else:
             self.label.setText(result)
 
+    def run_transient(self):
+        try:
+            t_stop = float(self.tstop_input.text())
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Invalid stop time")
+            return
+        if not t_stop > 0:
+            QMessageBox.warning(self, "Input Error", "Stop time must be positive")
+            return
+        result = self.circuit.solve_transient(t_stop, t_stop / 1000)
+        if isinstance(result, TransientResult):
+            self.label.setText(f"Transient: {len(result.time)} steps to {result.time[-1]:g} s")
+            self.oscilloscope.plot_waveforms(result)
+        else:
+            self.label.setText(result)
+
 # -----------------------------
 # Run App
 # -----------------------------
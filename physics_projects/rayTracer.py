@@ -0,0 +1,502 @@
+import math
+import numpy as np
+
+EPS = 1e-9
+# Scenes with more surfaces than this are intersected through a BVH
+BRUTE_FORCE_SURFACES = 16
+
+class Scene:
+    """Optical interfaces for the batched 2D ray tracer.
+
+    Every surface separates two media. Straight segments have a "front" side,
+    the one their normal (dy, -dx) points to (the left of p0 -> p1 in screen
+    coordinates), and a "back" side; circular arcs have an outside and an
+    inside. Rays pick up the refractive index of the side they arrive
+    from, so layered media, prisms and lenses are all just sets of surfaces.
+    """
+
+    def __init__(self):
+        # Segments: endpoints and (front, back) indices
+        self.seg_a = np.zeros((0, 2))
+        self.seg_b = np.zeros((0, 2))
+        self.seg_n = np.zeros((0, 2))
+        # Arcs: centre, radius, start angle, angular span and (outside, inside) indices
+        self.arc_c = np.zeros((0, 2))
+        self.arc_r = np.zeros(0)
+        self.arc_start = np.zeros(0)
+        self.arc_span = np.zeros(0)
+        self.arc_n = np.zeros((0, 2))
+        self._bvh = None
+
+    @property
+    def surface_count(self):
+        return len(self.seg_a) + len(self.arc_c)
+
+    def add_segment(self, p0, p1, n_front, n_back):
+        self.add_segments([p0], [p1], n_front, n_back)
+
+    def add_segments(self, p0, p1, n_front, n_back):
+        p0 = np.asarray(p0, dtype=float).reshape(-1, 2)
+        p1 = np.asarray(p1, dtype=float).reshape(-1, 2)
+        n = np.column_stack([np.broadcast_to(n_front, len(p0)), np.broadcast_to(n_back, len(p0))])
+        self.seg_a = np.vstack([self.seg_a, p0])
+        self.seg_b = np.vstack([self.seg_b, p1])
+        self.seg_n = np.vstack([self.seg_n, n])
+        self._bvh = None
+
+    def add_arc(self, center, radius, start, end, n_outside, n_inside):
+        """Arc running counter-clockwise from angle `start` to `end` (radians)."""
+        self.arc_c = np.vstack([self.arc_c, np.asarray(center, dtype=float)])
+        self.arc_r = np.append(self.arc_r, radius)
+        self.arc_start = np.append(self.arc_start, start)
+        self.arc_span = np.append(self.arc_span, (end - start) % (2 * math.pi) or 2 * math.pi)
+        self.arc_n = np.vstack([self.arc_n, [n_outside, n_inside]])
+        self._bvh = None
+
+    def add_polygon(self, points, n_inside, n_outside=1.0):
+        """Closed polygon (e.g. a prism); `points` may be in either winding order."""
+        pts = np.asarray(points, dtype=float)
+        x, y = pts[:, 0], pts[:, 1]
+        ccw = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y) > 0
+        # Segment normals (dy, -dx) point out of a polygon with positive signed area
+        if ccw:
+            self.add_segments(pts, np.roll(pts, -1, axis=0), n_outside, n_inside)
+        else:
+            self.add_segments(pts, np.roll(pts, -1, axis=0), n_inside, n_outside)
+
+    def add_lens(self, center, radius, aperture, n_lens, n_outside=1.0):
+        """Symmetric biconvex lens with its axis along x."""
+        cx, cy = center
+        sag = radius - math.sqrt(radius ** 2 - aperture ** 2)
+        half = math.asin(aperture / radius)
+        self.add_arc((cx - sag + radius, cy), radius, math.pi - half, math.pi + half, n_outside, n_lens)
+        self.add_arc((cx + sag - radius, cy), radius, -half, half, n_outside, n_lens)
+
+    def add_layers(self, x0, x1, ys, indices):
+        """Horizontal slabs: interface k at ys[k] has indices[k] above, indices[k + 1] below."""
+        ys = np.asarray(ys, dtype=float)
+        indices = np.asarray(indices, dtype=float)
+        # Screen coordinates: y grows downwards, so the left of x0 -> x1 is "above"
+        self.add_segments(np.column_stack([np.full(len(ys), x0), ys]),
+                          np.column_stack([np.full(len(ys), x1), ys]),
+                          indices[:-1], indices[1:])
+
+    # -----------------------------
+    # Intersection
+    # -----------------------------
+    def _arc_limits(self, k=slice(None)):
+        """Unit vectors to the arc ends and whether each arc spans over pi."""
+        start, end = self.arc_start[k], self.arc_start[k] + self.arc_span[k]
+        return np.cos(start), np.sin(start), np.cos(end), np.sin(end), self.arc_span[k] > math.pi
+
+    def _distances(self, ox, oy, dx, dy, prim):
+        """Distance along each ray to primitive `prim` (segments first, then
+        arcs); all arguments broadcast together."""
+        nseg = len(self.seg_a)
+        is_seg = prim < nseg
+        k_seg = np.where(is_seg, prim, 0)
+        k_arc = np.where(is_seg, 0, prim - nseg)
+        t = np.full(np.broadcast(ox, prim).shape, np.inf)
+        if nseg:
+            a, b = self.seg_a[k_seg], self.seg_b[k_seg]
+            hit = segment_distance(ox, oy, dx, dy, a[..., 0], a[..., 1],
+                                   b[..., 0] - a[..., 0], b[..., 1] - a[..., 1])
+            t = np.where(is_seg, hit, t)
+        if len(self.arc_c):
+            c = self.arc_c[k_arc]
+            hit = arc_distance(ox, oy, dx, dy, c[..., 0], c[..., 1], self.arc_r[k_arc],
+                               *self._arc_limits(k_arc))
+            t = np.where(is_seg, t, hit)
+        return t
+
+    def _nearest_brute(self, origin, direction):
+        # Segments and arcs are tested separately (rather than through
+        # _distances) so neither formula is evaluated for the other kind
+        ox, oy = origin[:, 0, None], origin[:, 1, None]
+        dx, dy = direction[:, 0, None], direction[:, 1, None]
+        t = np.full((len(origin), max(self.surface_count, 1)), np.inf)
+        nseg = len(self.seg_a)
+        if nseg:
+            a, e = self.seg_a, self.seg_b - self.seg_a
+            t[:, :nseg] = segment_distance(ox, oy, dx, dy, a[:, 0], a[:, 1], e[:, 0], e[:, 1])
+        if len(self.arc_c):
+            t[:, nseg:] = arc_distance(ox, oy, dx, dy, self.arc_c[:, 0], self.arc_c[:, 1], self.arc_r,
+                                       *self._arc_limits())
+        k = np.argmin(t, axis=1)
+        return t[np.arange(len(origin)), k], k
+
+    def _nearest_bvh(self, origin, direction):
+        """Nearest hit by walking the BVH for all rays in lock-step.
+
+        Each ray keeps its own small node stack. Every iteration, each ray with
+        work left pops one node: leaves are tested against their surfaces,
+        and for inner nodes the children the ray enters are pushed with the
+        nearer one on top. A node is skipped once the best hit so far is
+        closer than where the ray enters its box.
+        """
+        bvh = self.bvh
+        count = len(origin)
+        best_t = np.full(count, np.inf)
+        best_k = np.zeros(count, dtype=int)
+        with np.errstate(divide='ignore'):
+            inv = 1 / np.where(direction == 0, 1e-300, direction)
+
+        stack = np.zeros((count, bvh.depth + 2), dtype=int)
+        entry = np.zeros((count, bvh.depth + 2))
+        entry[:, 0] = bvh.enter(0, origin, inv)
+        top = np.isfinite(entry[:, 0]).astype(int)
+        ray = np.flatnonzero(top)
+        while len(ray):
+            top[ray] -= 1
+            node = stack[ray, top[ray]]
+            live = entry[ray, top[ray]] < best_t[ray]
+            popped, ray, node = ray, ray[live], node[live]
+
+            leaf = bvh.count[node] > 0
+            leaf_ray, leaf_node = ray[leaf], node[leaf]
+            if len(leaf_ray):
+                counts = bvh.count[leaf_node]
+                pair_ray = np.repeat(leaf_ray, counts)
+                offset = np.arange(len(pair_ray)) - np.repeat(np.cumsum(counts) - counts, counts)
+                prim = bvh.prims[np.repeat(bvh.first[leaf_node], counts) + offset]
+                t = self._distances(origin[pair_ray, 0], origin[pair_ray, 1],
+                                    direction[pair_ray, 0], direction[pair_ray, 1], prim)
+                np.minimum.at(best_t, pair_ray, t)
+                won = np.isfinite(t) & (t == best_t[pair_ray])
+                best_k[pair_ray[won]] = prim[won]
+
+            inner_ray, inner_node = ray[~leaf], node[~leaf]
+            if len(inner_ray):
+                left, right = bvh.left[inner_node], bvh.right[inner_node]
+                t_left = bvh.enter(left, origin[inner_ray], inv[inner_ray])
+                t_right = bvh.enter(right, origin[inner_ray], inv[inner_ray])
+                left_first = t_left <= t_right
+                near = np.where(left_first, left, right)
+                far = np.where(left_first, right, left)
+                # Far child first so the near one ends up on top of the stack
+                for child, t_child in ((far, np.maximum(t_left, t_right)),
+                                       (near, np.minimum(t_left, t_right))):
+                    ok = t_child < best_t[inner_ray]
+                    rows = inner_ray[ok]
+                    stack[rows, top[rows]] = child[ok]
+                    entry[rows, top[rows]] = t_child[ok]
+                    top[rows] += 1
+
+            ray = popped[top[popped] > 0]
+        return best_t, best_k
+
+    @property
+    def bvh(self):
+        if self._bvh is None:
+            self._bvh = BVH(*self.bounds())
+        return self._bvh
+
+    def bounds(self):
+        """Axis-aligned (lo, hi) boxes of every surface, segments first."""
+        seg_lo = np.minimum(self.seg_a, self.seg_b)
+        seg_hi = np.maximum(self.seg_a, self.seg_b)
+        # Arc boxes: the two end points plus any axis extremes inside the span
+        angles = np.column_stack([self.arc_start, self.arc_start + self.arc_span,
+                                  np.zeros((len(self.arc_c), 4)) + np.arange(4) * math.pi / 2])
+        inside = (angles - self.arc_start[:, None]) % (2 * math.pi) <= self.arc_span[:, None]
+        angles = np.where(inside, angles, self.arc_start[:, None])
+        x = self.arc_c[:, 0, None] + self.arc_r[:, None] * np.cos(angles)
+        y = self.arc_c[:, 1, None] + self.arc_r[:, None] * np.sin(angles)
+        arc_lo = np.column_stack([x.min(axis=1), y.min(axis=1)])
+        arc_hi = np.column_stack([x.max(axis=1), y.max(axis=1)])
+        return np.vstack([seg_lo, arc_lo]), np.vstack([seg_hi, arc_hi])
+
+    def intersect(self, origin, direction):
+        """Nearest hit of each ray: (distance, unit normal facing the ray,
+        index on the incoming side, index on the far side). Misses get inf."""
+        if self.surface_count > BRUTE_FORCE_SURFACES:
+            t, k = self._nearest_bvh(origin, direction)
+        else:
+            t, k = self._nearest_brute(origin, direction)
+
+        normal = np.zeros_like(origin)
+        n_pair = np.ones((len(origin), 2))
+        hit = np.isfinite(t)
+        nseg = len(self.seg_a)
+
+        rows = np.flatnonzero(hit & (k < nseg))
+        edge = self.seg_b[k[rows]] - self.seg_a[k[rows]]
+        normal[rows] = np.column_stack([edge[:, 1], -edge[:, 0]]) / np.hypot(edge[:, 0], edge[:, 1])[:, None]
+        n_pair[rows] = self.seg_n[k[rows]]
+
+        rows = np.flatnonzero(hit & (k >= nseg))
+        arc = k[rows] - nseg
+        point = origin[rows] + t[rows, None] * direction[rows]
+        normal[rows] = (point - self.arc_c[arc]) / self.arc_r[arc, None]
+        n_pair[rows] = self.arc_n[arc]
+
+        # Orient normals against the ray; the side it came from is n1
+        cos = np.einsum('ij,ij->i', normal, direction)
+        back = cos > 0
+        normal[back] *= -1
+        n1 = np.where(back, n_pair[:, 1], n_pair[:, 0])
+        n2 = np.where(back, n_pair[:, 0], n_pair[:, 1])
+        return t, normal, n1, n2
+
+    # -----------------------------
+    # Tracing
+    # -----------------------------
+    def trace(self, origin, direction, intensity=None, max_depth=16, min_intensity=1e-3,
+              far=2000.0, chunk=None):
+        """Trace rays through the scene, splitting each hit into a refracted and a
+        Fresnel-weighted reflected ray (all reflected on total internal reflection).
+
+        Returns (start, end, intensity) arrays with one row per straight segment
+        of every ray path; rays that leave the scene run on for `far` units, and
+        paths still bouncing after `max_depth` hits end at the last one.
+        """
+        origin = np.asarray(origin, dtype=float).reshape(-1, 2)
+        direction = np.asarray(direction, dtype=float).reshape(-1, 2)
+        direction = direction / np.hypot(direction[:, 0], direction[:, 1])[:, None]
+        intensity = np.ones(len(origin)) if intensity is None else np.asarray(intensity, dtype=float)
+        if chunk is None:
+            chunk = max(1024, 2 ** 22 // min(max(1, self.surface_count), BRUTE_FORCE_SURFACES))
+
+        starts, ends, weights = [], [], []
+        for depth in range(max_depth + 1):
+            if not len(origin):
+                break
+            t = np.empty(len(origin))
+            normal = np.empty_like(origin)
+            n1 = np.empty(len(origin))
+            n2 = np.empty(len(origin))
+            for lo in range(0, len(origin), chunk):
+                part = slice(lo, lo + chunk)
+                t[part], normal[part], n1[part], n2[part] = self.intersect(origin[part], direction[part])
+
+            miss = ~np.isfinite(t)
+            t = np.where(miss, far, t)
+            hit = origin + t[:, None] * direction
+            starts.append(origin)
+            ends.append(hit)
+            weights.append(intensity)
+            if depth == max_depth:
+                # Out of bounces: the path ends at the surface it reached
+                break
+
+            live = ~miss
+            origin, direction, normal = hit[live], direction[live], normal[live]
+            n1, n2, intensity = n1[live], n2[live], intensity[live]
+            origin, direction, intensity = refract(origin, direction, normal, n1, n2, intensity)
+            keep = intensity > min_intensity
+            origin, direction, intensity = origin[keep], direction[keep], intensity[keep]
+
+        if not starts:
+            return np.zeros((0, 2)), np.zeros((0, 2)), np.zeros(0)
+        return np.concatenate(starts), np.concatenate(ends), np.concatenate(weights)
+
+def segment_distance(ox, oy, dx, dy, ax, ay, ex, ey):
+    """Distance t with o + t d = a + s e for s in [0, 1] (inf if missed)."""
+    denom = dx * ey - dy * ex
+    wx, wy = ax - ox, ay - oy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (wx * ey - wy * ex) / denom
+        s = (wx * dy - wy * dx) / denom
+    return np.where((t > EPS) & (s >= 0) & (s <= 1), t, np.inf)
+
+def arc_distance(ox, oy, dx, dy, cx, cy, r, sx, sy, fx, fy, wide):
+    """Nearest positive distance to a circular arc (inf if missed).
+
+    (sx, sy) and (fx, fy) are unit vectors to the arc's start and end; a hit
+    is on the arc when it is counter-clockwise of the start and clockwise of
+    the end (either one for arcs wider than pi)."""
+    px, py = ox - cx, oy - cy
+    half_b = px * dx + py * dy
+    disc = half_b ** 2 - (px ** 2 + py ** 2 - r ** 2)
+    miss = disc < 0
+    root = np.sqrt(np.where(miss, 0.0, disc))
+    best = np.full(np.broadcast(disc, wide).shape, np.inf)
+    for t in (-half_b - root, -half_b + root):
+        hx = px + t * dx
+        hy = py + t * dy
+        after_start = sx * hy - sy * hx >= 0
+        before_end = hx * fy - hy * fx >= 0
+        on_arc = np.where(wide, after_start | before_end, after_start & before_end)
+        best = np.where(on_arc & (t > EPS) & ~miss & (t < best), t, best)
+    return best
+
+class BVH:
+    """Bounding-volume hierarchy over axis-aligned surface boxes.
+
+    Built top-down by splitting at the median centroid along the longest
+    axis. Nodes are stored as flat arrays; leaves have count > 0 and own
+    prims[first:first + count], inner nodes have left/right children.
+    """
+
+    LEAF_SIZE = 4
+
+    def __init__(self, lo, hi):
+        count = len(lo)
+        size = max(1, 2 * count)
+        self.lo = np.zeros((size, 2))
+        self.hi = np.zeros((size, 2))
+        self.left = np.zeros(size, dtype=int)
+        self.right = np.zeros(size, dtype=int)
+        self.first = np.zeros(size, dtype=int)
+        self.count = np.zeros(size, dtype=int)
+        self.prims = np.arange(count)
+
+        # Pad flat boxes (horizontal/vertical segments) so slab tests still hit
+        lo = lo - EPS * 10
+        hi = hi + EPS * 10
+        centroid = (lo + hi) / 2
+        nodes = 1
+        self.depth = 0
+        stack = [(0, count, 0, 0)]
+        while stack:
+            start, end, node, depth = stack.pop()
+            self.depth = max(self.depth, depth)
+            idx = self.prims[start:end]
+            self.lo[node] = lo[idx].min(axis=0) if len(idx) else 0
+            self.hi[node] = hi[idx].max(axis=0) if len(idx) else -1
+            if end - start <= self.LEAF_SIZE:
+                self.first[node] = start
+                self.count[node] = end - start
+                continue
+            spread = centroid[idx].max(axis=0) - centroid[idx].min(axis=0)
+            axis = np.argmax(spread)
+            mid = (start + end) // 2
+            self.prims[start:end] = idx[np.argpartition(centroid[idx, axis], mid - start)]
+            self.left[node], self.right[node] = nodes, nodes + 1
+            stack.append((start, mid, nodes, depth + 1))
+            stack.append((mid, end, nodes + 1, depth + 1))
+            nodes += 2
+
+        self.lo, self.hi = self.lo[:nodes], self.hi[:nodes]
+        self.left, self.right = self.left[:nodes], self.right[:nodes]
+        self.first, self.count = self.first[:nodes], self.count[:nodes]
+
+    def enter(self, node, origin, inv_direction):
+        """Distance at which each ray enters the box of `node` (inf if it misses)."""
+        t0 = (self.lo[node] - origin) * inv_direction
+        t1 = (self.hi[node] - origin) * inv_direction
+        near = np.maximum(np.minimum(t0, t1).max(axis=-1), 0)
+        far = np.maximum(t0, t1).min(axis=-1)
+        return np.where(far >= near, near, np.inf)
+
+def refract(origin, direction, normal, n1, n2, intensity):
+    """Snell refraction and reflection at the hit points, as parallel arrays.
+
+    `normal` must face the incoming rays. The outputs stack the transmitted
+    rays (where there is no total internal reflection) on top of the
+    reflected ones, each carrying its Fresnel share of the intensity.
+    """
+    cos_i = -np.einsum('ij,ij->i', normal, direction)
+    eta = n1 / n2
+    k = 1 - eta ** 2 * (1 - cos_i ** 2)
+    tir = k < 0
+    cos_t = np.sqrt(np.where(tir, 0.0, k))
+
+    rs = ((n1 * cos_i - n2 * cos_t) / (n1 * cos_i + n2 * cos_t)) ** 2
+    rp = ((n1 * cos_t - n2 * cos_i) / (n1 * cos_t + n2 * cos_i)) ** 2
+    reflectance = np.where(tir, 1.0, 0.5 * (rs + rp))
+
+    reflected = direction + 2 * cos_i[:, None] * normal
+    transmitted = eta[:, None] * direction + (eta * cos_i - cos_t)[:, None] * normal
+
+    through = ~tir
+    return (np.concatenate([origin[through], origin]),
+            np.concatenate([transmitted[through], reflected]),
+            np.concatenate([(intensity * (1 - reflectance))[through], intensity * reflectance]))
+
+def beam(start, end, direction, count):
+    """Parallel rays launched from evenly spaced points between start and end."""
+    s = np.linspace(0, 1, count)[:, None]
+    origin = np.asarray(start, dtype=float) + s * (np.asarray(end, dtype=float) - start)
+    return origin, np.broadcast_to(np.asarray(direction, dtype=float), origin.shape).copy()
+
+def point_source(position, count, angle_from=0.0, angle_to=2 * math.pi):
+    angles = np.linspace(angle_from, angle_to, count, endpoint=False)
+    origin = np.broadcast_to(np.asarray(position, dtype=float), (count, 2)).copy()
+    return origin, np.column_stack([np.cos(angles), np.sin(angles)])
+
+def rasterize(start, end, intensity, width, height, max_samples=4_000_000):
+    """Accumulate ray segments into a (height, width) brightness image by
+    sampling points along each segment (at most `max_samples` in total)."""
+    length = np.hypot(*(end - start).T)
+    spacing = max(1.0, length.sum() / max_samples)
+    n = np.maximum(1, np.ceil(length / spacing)).astype(int)
+    seg = np.repeat(np.arange(len(length)), n)
+    offset = np.arange(len(seg)) - np.repeat(np.cumsum(n) - n, n)
+    frac = (offset + 0.5) / n[seg]
+    pts = start[seg] + frac[:, None] * (end - start)[seg]
+    x = pts[:, 0].astype(int)
+    y = pts[:, 1].astype(int)
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    weight = (intensity * length / n)[seg][inside]
+    image = np.bincount(y[inside] * width + x[inside], weight, minlength=width * height)
+    return image.reshape(height, width)
+
+if __name__ == '__main__':
+    import pygame
+
+    width, height = 1000, 600
+    ray_count = 100000
+    preview_count = 5000
+
+    scene = Scene()
+    scene.add_lens((420, 300), 260, 150, 1.5)
+    scene.add_polygon([(640, 420), (820, 420), (730, 260)], 1.6)
+    scene.add_layers(0, width, [520], [1.0, 1.33])
+
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption("Batched Ray Tracer")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("Arial", 16)
+
+    source = [80, 300]
+    dragging = False
+    # The traced image only changes with the source: it is kept as a surface
+    # and retraced with a cheap preview while dragging, in full on release
+    frame = None
+    pending = ray_count
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if math.hypot(event.pos[0] - source[0], event.pos[1] - source[1]) < 20:
+                    dragging = True
+            elif event.type == pygame.MOUSEBUTTONUP:
+                if dragging:
+                    pending = ray_count
+                dragging = False
+            elif event.type == pygame.MOUSEMOTION and dragging:
+                source = list(event.pos)
+                pending = preview_count
+
+        if pending:
+            time_start = pygame.time.get_ticks()
+            origin, direction = beam((source[0], source[1] - 120), (source[0], source[1] + 120), (1, 0), pending)
+            seg_start, seg_end, seg_intensity = scene.trace(origin, direction, min_intensity=0.01, far=1500)
+            image = rasterize(seg_start, seg_end, seg_intensity, width, height,
+                              max_samples=4_000_000 if pending == ray_count else 500_000)
+
+            # Log tone mapping into an RGB surface (surfarray is x-major)
+            level = np.log1p(image * (2000.0 / pending))
+            level = (255 * np.clip(level / max(level.max(), 1e-9), 0, 1)).astype(np.uint8).T
+            frame = pygame.surfarray.make_surface(np.dstack([level, level, (level * 0.6).astype(np.uint8)]))
+            status = f"{pending} rays, {len(seg_start)} segments, {pygame.time.get_ticks() - time_start} ms"
+            pending = 0
+
+        screen.blit(frame, (0, 0))
+        for a, b in zip(scene.seg_a, scene.seg_b):
+            pygame.draw.line(screen, (90, 90, 160), a, b, 1)
+        for c, r, s0, span in zip(scene.arc_c, scene.arc_r, scene.arc_start, scene.arc_span):
+            # pygame arcs run counter-clockwise in y-up coordinates
+            rect = pygame.Rect(c[0] - r, c[1] - r, 2 * r, 2 * r)
+            pygame.draw.arc(screen, (90, 90, 160), rect, -(s0 + span), -s0, 1)
+        pygame.draw.circle(screen, (0, 255, 0), source, 6)
+        screen.blit(font.render(status, True, (255, 255, 255)), (10, 10))
+
+        pygame.display.flip()
+        clock.tick(60)
+
+    pygame.quit()
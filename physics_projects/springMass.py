@@ -1,46 +1,74 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 from matplotlib.animation import FuncAnimation
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crowd_dynamics.springs import oscillator_displacement, plot_displacement_grid
+
 # Initial values
 k_init = 5
 x0_init = 1
+c_init = 0
 t = np.linspace(0, 10, 500)
+k_sweep = np.linspace(1, 10, 200)
 
 # Create the main figure and axis
 fig, ax = plt.subplots(figsize=(8, 5))
-plt.subplots_adjust(left=0.1, bottom=0.35)
+plt.subplots_adjust(left=0.1, bottom=0.4)
 line, = ax.plot(t, x0_init * np.cos(np.sqrt(k_init) * t), lw=2, color='deepskyblue')
 ax.set_ylim(-2, 2)
 ax.set_xlabel("Time (s)")
 ax.set_ylabel("Displacement (x)")
 ax.set_title("🎯 Interactive Spring-Mass Oscillator", fontsize=14)
 
-# Sliders for k and x0
-ax_k = plt.axes([0.1, 0.2, 0.8, 0.03])
-ax_x0 = plt.axes([0.1, 0.15, 0.8, 0.03])
+# Sliders for k, x0 and damping
+ax_k = plt.axes([0.1, 0.25, 0.8, 0.03])
+ax_x0 = plt.axes([0.1, 0.2, 0.8, 0.03])
+ax_c = plt.axes([0.1, 0.15, 0.8, 0.03])
 slider_k = Slider(ax_k, 'Spring Constant k', 1, 10, valinit=k_init, color='orange')
 slider_x0 = Slider(ax_x0, 'Initial Displacement x₀', -2, 2, valinit=x0_init, color='limegreen')
+slider_c = Slider(ax_c, 'Damping c', 0, 3, valinit=c_init, color='orchid')
 
 # Reset button
 reset_ax = plt.axes([0.8, 0.05, 0.1, 0.04])
 reset_button = Button(reset_ax, 'Reset', color='lightcoral', hovercolor='salmon')
 
+# Sweep buttons: whole k range at the current x0 and damping in one evaluation
+sweep_ax = plt.axes([0.45, 0.05, 0.15, 0.04])
+sweep_button = Button(sweep_ax, 'Sweep k (map)', color='lightblue', hovercolor='skyblue')
+family_ax = plt.axes([0.62, 0.05, 0.15, 0.04])
+family_button = Button(family_ax, 'Sweep k (curves)', color='lightblue', hovercolor='skyblue')
+
 # Update function for sliders
 def update(val):
     k = slider_k.val
     x0 = slider_x0.val
-    line.set_ydata(x0 * np.cos(np.sqrt(k) * t))
+    c = slider_c.val
+    line.set_ydata(oscillator_displacement(k, x0, c, t)[0, 0, 0])
     fig.canvas.draw_idle()
 
 slider_k.on_changed(update)
 slider_x0.on_changed(update)
+slider_c.on_changed(update)
+
+def sweep(curves):
+    k_values = k_sweep[::20] if curves else k_sweep
+    x = oscillator_displacement(k_values, slider_x0.val, slider_c.val, t)[:, 0, 0]
+    ax_sweep = plot_displacement_grid(x, t, k_values, 'k', curves=curves)
+    ax_sweep.set_title(f"Displacement over k (x₀ = {slider_x0.val:.2f}, c = {slider_c.val:.2f})")
+    ax_sweep.figure.show()
+
+sweep_button.on_clicked(lambda event: sweep(False))
+family_button.on_clicked(lambda event: sweep(True))
 
 # Reset functionality
 def reset(event):
     slider_k.reset()
     slider_x0.reset()
+    slider_c.reset()
 
 reset_button.on_clicked(reset)
 
@@ -0,0 +1,26 @@
+import os
+import sys
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crowd_dynamics.waves import PointSource, WaveField
+
+# Two in-phase sources on a 512 x 512 grid
+grid = 512
+steps_per_frame = 4
+field = WaveField(grid, grid)
+field.add_source(PointSource(grid // 2, grid // 2 - 40, frequency=0.04))
+field.add_source(PointSource(grid // 2, grid // 2 + 40, frequency=0.04))
+
+fig, ax = plt.subplots(figsize=(7, 7))
+image = ax.imshow(field.u, cmap='seismic', vmin=-0.5, vmax=0.5, animated=True)
+ax.set_title("2D Wave Interference")
+ax.set_axis_off()
+
+def update(frame):
+    image.set_data(field.step(steps_per_frame))
+    return image,
+
+ani = FuncAnimation(fig, update, interval=15, blit=True, cache_frame_data=False)
+plt.show()
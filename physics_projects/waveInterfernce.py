@@ -1,11 +1,19 @@
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.widgets import Slider, CheckButtons
 
-# Constants
-x = np.linspace(0, 4 * np.pi, 1000)
-t_vals = np.linspace(0, 2 * np.pi, 300)
+# Constants; the point count may be given on the command line
+# (python waveInterfernce.py 9000), capped so the three frame tables of
+# num_frames x num_points floats stay within MAX_TABLE_BYTES
+num_frames = 300
+MAX_TABLE_BYTES = 64 * 2 ** 20
+num_points = min(int(sys.argv[1]) if len(sys.argv) > 1 else 8000, MAX_TABLE_BYTES // (3 * num_frames * 8))
+x = np.linspace(0, 4 * np.pi, num_points)
+t_vals = np.linspace(0, 2 * np.pi, num_frames)
+cos_t = np.cos(t_vals)[:, None]
+sin_t = np.sin(t_vals)[:, None]
 
 # Default params
 amp1_init = 1.0
@@ -60,24 +68,44 @@ def toggle_visibility(label):
 
 check.on_clicked(toggle_visibility)
 
+# Frame tables for the whole cycle, rebuilt only when a slider moves
+wave1_frames = np.empty((num_frames, num_points))
+wave2_frames = np.empty((num_frames, num_points))
+sum_frames = np.empty((num_frames, num_points))
+hidden = np.zeros_like(x)
+cached_params = None
+
+def build_frames(a1, a2, f1, f2, phi):
+    # sin(f*x -/+ t) expanded so each table is two outer products instead of
+    # num_frames * num_points sine evaluations; sum_frames is the scratch
+    # table until the last line
+    scratch = sum_frames
+    np.multiply(cos_t, a1 * np.sin(f1 * x), out=wave1_frames)
+    np.multiply(sin_t, a1 * np.cos(f1 * x), out=scratch)
+    np.subtract(wave1_frames, scratch, out=wave1_frames)
+
+    np.multiply(cos_t, a2 * np.sin(f2 * x + phi), out=wave2_frames)
+    np.multiply(sin_t, a2 * np.cos(f2 * x + phi), out=scratch)
+    np.add(wave2_frames, scratch, out=wave2_frames)
+
+    np.add(wave1_frames, wave2_frames, out=sum_frames)
+
 # Animation function
 def update(frame):
-    t = t_vals[frame]
-    a1 = slider_amp1.val
-    a2 = slider_amp2.val
-    f1 = slider_freq1.val
-    f2 = slider_freq2.val
-    phi = slider_phase.val
-
-    wave1 = a1 * np.sin(f1 * x - t)
-    wave2 = a2 * np.sin(f2 * x + t + phi)
-    superposed = wave1 + wave2
+    global cached_params
+    params = (slider_amp1.val, slider_amp2.val, slider_freq1.val,
+              slider_freq2.val, slider_phase.val)
+    if params != cached_params:
+        build_frames(*params)
+        cached_params = params
 
-    line1.set_ydata(wave1 if show_wave1 else np.zeros_like(x))
-    line2.set_ydata(wave2 if show_wave2 else np.zeros_like(x))
-    line_sum.set_ydata(superposed)
+    line1.set_ydata(wave1_frames[frame] if show_wave1 else hidden)
+    line2.set_ydata(wave2_frames[frame] if show_wave2 else hidden)
+    line_sum.set_ydata(sum_frames[frame])
 
     return line1, line2, line_sum
 
-ani = FuncAnimation(fig, update, frames=len(t_vals), interval=30, blit=False)
+# Blitting redraws only the three lines; a full figure redraw per frame would
+# cost far more than the lines themselves
+ani = FuncAnimation(fig, update, frames=len(t_vals), interval=30, blit=True)
 plt.show()
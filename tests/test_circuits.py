@@ -0,0 +1,53 @@
+"""Cached, low-rank updated DC solves must match solving the edited circuit from scratch."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crowd_dynamics.circuits import Circuit, Resistor, VoltageSource
+
+def grid(side, rng):
+    circuit = Circuit()
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                circuit.add_resistor(Resistor(f"{r}_{c}", f"{r}_{c + 1}", rng.uniform(50, 150)))
+            if r + 1 < side:
+                circuit.add_resistor(Resistor(f"{r}_{c}", f"{r + 1}_{c}", rng.uniform(50, 150)))
+    circuit.add_voltage_source(VoltageSource("0_0", f"{side - 1}_{side - 1}", 5.0))
+    return circuit
+
+def test_edited_solves_match_fresh_solves():
+    rng = random.Random(0)
+    circuit = grid(8, rng)
+    circuit.solve_dc()
+    for _ in range(40):
+        rng.choice(circuit.resistors).resistance *= rng.uniform(0.5, 2.0)
+        fresh = Circuit()
+        for r in circuit.resistors:
+            fresh.add_resistor(Resistor(r.n1, r.n2, r.resistance))
+        for v in circuit.voltage_sources:
+            fresh.add_voltage_source(VoltageSource(v.n1, v.n2, v.voltage))
+        assert circuit.solve_dc() == fresh.solve_dc()
+
+def test_ground_is_pinned_at_zero():
+    circuit = Circuit()
+    circuit.add_resistor(Resistor('a', '0', 100))
+    circuit.add_resistor(Resistor('a', 'b', 100))
+    circuit.add_resistor(Resistor('b', '0', 100))
+    circuit.add_voltage_source(VoltageSource('a', '0', 5))
+    assert circuit.solve_dc()['0'] == 0.0
+    assert circuit.solve_dc(ground='b')['b'] == 0.0
+
+def test_floating_subcircuit_cannot_be_solved():
+    circuit = Circuit()
+    circuit.add_resistor(Resistor('a', '0', 1))
+    circuit.add_resistor(Resistor('x', 'y', 1))
+    circuit.add_voltage_source(VoltageSource('a', '0', 1))
+    assert circuit.solve_dc() == "Circuit cannot be solved"
+
+def test_monte_carlo_dense_and_sparse_agree():
+    circuit = grid(6, random.Random(1))
+    dense = circuit.monte_carlo(20, seed=2, dense=True).voltages
+    sparse = circuit.monte_carlo(20, seed=2, dense=False).voltages
+    assert abs(dense - sparse).max() < 1e-9
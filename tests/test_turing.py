@@ -0,0 +1,86 @@
+"""MacroMachine must agree with plain stepping on state, head, tape and step count."""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crowd_dynamics.turing import TuringMachine, check_macro
+
+STATES = ['q0', 'q1', 'q2', 'q3']
+SYMBOLS = ['#', '0', '1']
+
+def random_machine(rng):
+    """Random rules over a few states; some pairs have no rule, some halt."""
+    transitions = {}
+    for state in STATES:
+        for symbol in SYMBOLS:
+            if rng.random() < 0.15:
+                continue
+            new_state = 'HALT' if rng.random() < 0.05 else rng.choice(STATES)
+            transitions[(state, symbol)] = (new_state, rng.choice(SYMBOLS), rng.choice('LR'))
+    return transitions
+
+def test_macro_matches_plain_on_random_machines():
+    rng = random.Random(0)
+    failures = []
+    for case in range(3000):
+        transitions = random_machine(rng)
+        tape = ''.join(rng.choice(SYMBOLS) for _ in range(rng.randint(0, 12))) or '#'
+        block_size = rng.randint(1, 4)
+        max_steps = rng.choice([rng.randint(0, 20), rng.randint(0, 500)])
+        if not check_macro(tape, transitions, max_steps, block_size):
+            failures.append((case, tape, block_size, max_steps))
+    assert not failures, failures[:5]
+
+def test_budget_ends_on_the_step_before_a_missing_rule():
+    transitions = {('q0', '#'): ('q1', '#', 'R'), ('q0', '1'): ('q0', '1', 'R'), ('q1', '1'): ('q1', '1', 'L')}
+    for max_steps in range(4):
+        for block_size in range(1, 5):
+            assert check_macro('##1#', transitions, max_steps, block_size)
+
+def test_recorder_limit_keeps_the_latest_steps():
+    transitions = {('q0', '#'): ('q1', '1', 'R'), ('q0', '1'): ('q1', '#', 'R'), ('q1', '#'): ('q0', '#', 'L')}
+    machine = TuringMachine('#', transitions)
+    recorder = machine.record(interval=64, limit=1000)
+    recorder.run(5000)
+    for _ in range(500):
+        machine.step()
+    assert len(recorder) <= 1000 + 64
+    assert recorder.start + len(recorder) == machine.step_count == 5500
+    for step in range(recorder.start, machine.step_count + 1, 97):
+        plain = TuringMachine('#', transitions)
+        plain.run(step)
+        state, head, tape = recorder.configuration(step)
+        assert (state, head, str(tape)) == (plain.state, plain.head, str(plain.tape))
+    with pytest.raises(IndexError):
+        recorder.configuration(recorder.start - 1)
+
+def test_zero_step_run_leaves_an_unknown_state_alone():
+    transitions = {('q0', '#'): ('q1', '#', 'R')}
+    for record in (False, True):
+        machine = TuringMachine('#', transitions, start_state='q9')
+        if record:
+            machine.record()
+        assert machine.run(0)[0] == 0
+        assert machine.state == 'q9'
+        if record:
+            assert not machine.recorder.halted
+        assert machine.run(1)[0] == 0
+        assert machine.state == 'HALT'
+
+def test_run_macro_matches_step_by_step_across_rounds():
+    rng = random.Random(1)
+    for case in range(300):
+        transitions = random_machine(rng)
+        tape = ''.join(rng.choice(SYMBOLS) for _ in range(rng.randint(0, 12))) or '#'
+        max_steps = rng.randint(0, 400)
+        plain = TuringMachine(tape, transitions)
+        while plain.step_count < max_steps and plain.state != 'HALT':
+            plain.step()
+        fast = TuringMachine(tape, transitions)
+        # A tiny window makes the run switch between macro and compiled rounds
+        fast.run_macro(max_steps, rng.randint(1, 4), window=rng.randint(1, 8))
+        assert ((fast.state, fast.head, str(fast.tape), fast.step_count)
+                == (plain.state, plain.head, str(plain.tape), plain.step_count)), case
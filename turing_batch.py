@@ -0,0 +1,105 @@
+"""Run one transition table against many input tapes in parallel.
+
+    python turing_batch.py rules.txt tapes.txt -o results.jsonl --max-steps 1000000 --timeout 5
+
+The transition file uses the same "state symbol -> new_state write dir"
+lines as the GUI; the tape file has one input tape per line. Every line is a
+run, so an empty line is a blank tape and a result's `index` is its 0-based
+line number. Each run is written as a JSON line as soon as it finishes, so
+results come out in completion order; sort on `index` for input order.
+
+The --timeout is cooperative: it is checked every CHUNK_STEPS steps, so a run
+can overshoot it by the time one chunk takes.
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+
+from crowd_dynamics.turing import TuringMachine, parse_transitions
+
+CHUNK_STEPS = 100_000   # steps between timeout checks
+
+def run_tape(transitions, tape, max_steps, timeout=None):
+    """Run one tape to a halt, the step limit or the wall-clock timeout."""
+    machine = TuringMachine(tape, transitions)
+    started = time.perf_counter()
+    status = 'step_limit'
+    while machine.state != 'HALT' and machine.step_count < max_steps:
+        machine.run(min(CHUNK_STEPS, max_steps - machine.step_count))
+        if timeout is not None and time.perf_counter() - started > timeout:
+            status = 'timeout'
+            break
+    if machine.state == 'HALT':
+        status = 'halted'
+    return {
+        'tape': tape,
+        'status': status,
+        'state': machine.state,
+        'steps': machine.step_count,
+        'head': machine.head,
+        'final_tape': str(machine.tape),
+        'seconds': round(time.perf_counter() - started, 6),
+    }
+
+def _run_indexed(job):
+    index, transitions, tape, max_steps, timeout = job
+    try:
+        result = run_tape(transitions, tape, max_steps, timeout)
+    except Exception as error:
+        result = {'tape': tape, 'status': 'error', 'error': repr(error)}
+    result['index'] = index
+    return result
+
+def run_batch(transitions, tapes, max_steps=1_000_000, timeout=None, processes=None,
+              chunksize=1):
+    """Yield one result dict per tape, tagged with its input `index`, as the
+    runs finish in a process pool.
+
+    Tapes go to the workers `chunksize` at a time and a chunk's results come
+    back together, so a larger chunksize cuts overhead on many short runs
+    but lets one slow tape hold back the rest of its chunk.
+    `processes=1` runs everything in this process, in input order (no pool).
+    """
+    jobs = ((i, transitions, tape, max_steps, timeout) for i, tape in enumerate(tapes))
+    if processes == 1:
+        yield from map(_run_indexed, jobs)
+        return
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(_run_indexed, jobs, chunksize)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Turing machine on many tapes.")
+    parser.add_argument('transitions', help="transition file (state symbol -> new_state write dir)")
+    parser.add_argument('tapes', help="file with one input tape per line ('-' for stdin)")
+    parser.add_argument('-o', '--output', help="JSON lines output file (default stdout)")
+    parser.add_argument('--max-steps', type=int, default=1_000_000)
+    parser.add_argument('--timeout', type=float, help=f"seconds per run, checked every {CHUNK_STEPS:,} steps")
+    parser.add_argument('-j', '--processes', type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    with open(args.transitions) as f:
+        try:
+            transitions = parse_transitions(f.read())
+        except ValueError as error:
+            parser.error(str(error))
+    source = sys.stdin if args.tapes == '-' else open(args.tapes)
+    with source:
+        tapes = source.read().splitlines()
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    counts = {}
+    try:
+        for result in run_batch(transitions, tapes, args.max_steps, args.timeout, args.processes):
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{len(tapes)} tapes: " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())),
+          file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
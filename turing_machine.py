@@ -1,60 +1,40 @@
-import tkinter as tk
-from tkinter import messagebox
-import time
 import threading
+import queue
 import math
+import time
 
-class TuringMachine:
-    def __init__(self, tape, transitions, head_position=0, start_state='q0'):
-        self.initial_tape = tape
-        self.transitions = transitions
-        self.head = head_position
-        self.state = start_state
-        self.running = False
-        self.tape = list(tape + '#' * 100)
-        self.step_count = 0
+# The engine lives in crowd_dynamics.turing; these names are re-exported so
+# existing `from turing_machine import TuringMachine` code keeps working
+from crowd_dynamics.turing import (MOVES, MacroMachine, Tape, TraceRecorder, TuringMachine,
+                                   check_macro, parse_transitions)
 
-    def reset(self):
-        self.head = 0
-        self.state = 'q0'
-        self.tape = list(self.initial_tape + '#' * 100)
-        self.running = False
-        self.step_count = 0
-
-    def step(self):
-        if self.state == 'HALT':
-            return False, "Machine halted."
-
-        symbol = self.tape[self.head]
-        key = (self.state, symbol)
-
-        if key in self.transitions:
-            new_state, new_symbol, direction = self.transitions[key]
-            explanation = (
-                f"Step {self.step_count + 1}: In state {self.state}, reading '{symbol}' -> "
-                f"Write '{new_symbol}', move {direction}, go to {new_state}"
-            )
-            self.tape[self.head] = new_symbol
-            self.state = new_state
-            if direction == 'R':
-                self.head += 1
-            elif direction == 'L':
-                self.head = max(0, self.head - 1)
-            self.step_count += 1
-            return True, explanation
-        else:
-            self.state = 'HALT'
-            return False, f"Step {self.step_count}: No transition for ({self.state}, {symbol}). Halting."
+try:
+    import tkinter as tk
+    from tkinter import messagebox, filedialog
+except ImportError:
+    # Only TuringGUI needs Tk; the machine itself runs without it
+    tk = None
 
 class TuringGUI:
+    FRAME_MS = 33           # redraw interval for auto-run (about 30 fps)
+    MAX_LOG_LINES = 500     # explanation lines kept in the log
+    TAPE_CELLS = 30
+    FAST_BATCH = 50_000     # steps per snapshot when the delay is 0
+    RECORD_LIMIT = 2_000_000  # steps kept for rewinding (about 7 bytes each)
+
     def __init__(self, root):
         self.root = root
         self.root.title("🎛️ Fun Turing Machine Simulator with Graph")
         self.machine = None
         self.running_thread = None
+        self.stop_event = threading.Event()
+        # Worker -> Tk thread; bounded so a fast machine waits for the GUI
+        self.snapshots = queue.Queue(maxsize=64)
         self.auto_run = False
         self.speed = 500
+        self.tape_items = []
         self.create_widgets()
+        self.root.after(self.FRAME_MS, self.poll_snapshots)
 
     def create_widgets(self):
         top_frame = tk.Frame(self.root)
@@ -90,11 +70,22 @@ q1 # -> HALT # S""")
         self.pause_button = tk.Button(control_frame, text="⏸ Pause", command=self.toggle_auto_run, state=tk.DISABLED)
         self.pause_button.pack(side=tk.LEFT, padx=5)
         tk.Button(control_frame, text="🔁 Reset", command=self.reset).pack(side=tk.LEFT, padx=5)
+        tk.Button(control_frame, text="⏩ Run Fast", command=self.run_fast).pack(side=tk.LEFT, padx=5)
+
+        trace_frame = tk.Frame(left_frame)
+        trace_frame.pack(pady=5)
+        tk.Button(trace_frame, text="⏪ Back", command=self.step_back).pack(side=tk.LEFT, padx=5)
+        tk.Label(trace_frame, text="Step:").pack(side=tk.LEFT)
+        self.jump_entry = tk.Entry(trace_frame, width=10)
+        self.jump_entry.pack(side=tk.LEFT)
+        tk.Button(trace_frame, text="↪ Go", command=self.jump).pack(side=tk.LEFT, padx=5)
+        tk.Button(trace_frame, text="💾 Save Trace", command=self.save_trace).pack(side=tk.LEFT, padx=5)
+        tk.Button(trace_frame, text="📂 Load Trace", command=self.load_trace).pack(side=tk.LEFT, padx=5)
 
         speed_frame = tk.Frame(left_frame)
         speed_frame.pack()
         tk.Label(speed_frame, text="⏱ Speed (ms):").pack(side=tk.LEFT)
-        self.speed_scale = tk.Scale(speed_frame, from_=100, to=1000, orient=tk.HORIZONTAL, command=self.update_speed)
+        self.speed_scale = tk.Scale(speed_frame, from_=0, to=1000, orient=tk.HORIZONTAL, command=self.update_speed)
         self.speed_scale.set(500)
         self.speed_scale.pack(side=tk.LEFT)
 
@@ -112,27 +103,51 @@ q1 # -> HALT # S""")
         self.graph_canvas = tk.Canvas(right_frame, width=400, height=300, bg="#ffffff")
         self.graph_canvas.pack()
 
-    def draw_tape(self):
-        self.tape_canvas.delete("all")
+    def snapshot(self, explanations=()):
+        """Everything draw_tape needs, copied out of the machine so the Tk
+        thread never reads it while the worker is stepping."""
+        m = self.machine
+        start = m.head - self.TAPE_CELLS // 2
+        window = m.tape[start:start + self.TAPE_CELLS]
+        return m.state, m.head - start, window, m.step_count, list(explanations)
+
+    def draw_tape(self, snapshot=None):
         if not self.machine:
+            self.tape_canvas.delete("all")
+            self.tape_items = []
             return
-
-        start = max(0, self.machine.head - 15)
-        end = start + 30
-        for i, symbol in enumerate(self.machine.tape[start:end], start=start):
-            x0 = (i - start) * 25 + 10
-            y0 = 10
-            x1 = x0 + 25
-            y1 = 60
-            fill = "#FFD700" if i == self.machine.head else "white"
-            self.tape_canvas.create_rectangle(x0, y0, x1, y1, fill=fill)
-            self.tape_canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=symbol, font=("Consolas", 14, "bold"))
+        if snapshot is None:
+            snapshot = self.snapshot()
+        state, head, window, step_count, _ = snapshot
+
+        # The cells are created once and only recoloured / relabelled after that
+        if not self.tape_items:
+            for i in range(self.TAPE_CELLS):
+                x0 = i * 25 + 10
+                y0 = 10
+                x1 = x0 + 25
+                y1 = 60
+                rect = self.tape_canvas.create_rectangle(x0, y0, x1, y1, fill="white")
+                text = self.tape_canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, font=("Consolas", 14, "bold"))
+                self.tape_items.append((rect, text))
+        for i, ((rect, text), symbol) in enumerate(zip(self.tape_items, window)):
+            self.tape_canvas.itemconfigure(rect, fill="#FFD700" if i == head else "white")
+            self.tape_canvas.itemconfigure(text, text=symbol)
 
         self.state_label.config(
-            text=f"State: {self.machine.state}",
-            fg="red" if self.machine.state == "HALT" else "green"
+            text=f"State: {state}   Step: {step_count}",
+            fg="red" if state == "HALT" else "green"
         )
 
+    def log(self, lines):
+        if not lines:
+            return
+        self.explain_text.insert(tk.END, "\n".join(lines) + "\n")
+        count = int(self.explain_text.index("end-1c").split(".")[0]) - 1
+        if count > self.MAX_LOG_LINES:
+            self.explain_text.delete("1.0", f"{count - self.MAX_LOG_LINES + 1}.0")
+        self.explain_text.see(tk.END)
+
     def draw_graph(self):
         self.graph_canvas.delete("all")
         transitions = self.parse_transitions()
@@ -160,70 +175,210 @@ q1 # -> HALT # S""")
             self.graph_canvas.create_text(mx, my, text=sym, fill="blue", font=("Arial", 8))
 
     def parse_transitions(self):
-        raw = self.transition_text.get("1.0", tk.END).strip().split('\n')
-        transitions = {}
-        for line in raw:
-            if '->' not in line:
-                continue
-            try:
-                left, right = line.split('->')
-                state, symbol = left.strip().split()
-                new_state, write, move = right.strip().split()
-                transitions[(state, symbol)] = (new_state, write, move)
-            except:
-                messagebox.showerror("Error", f"Invalid transition format: {line}")
-                return None
-        return transitions
+        try:
+            return parse_transitions(self.transition_text.get("1.0", tk.END))
+        except ValueError as error:
+            messagebox.showerror("Error", str(error))
+            return None
 
     def start(self):
         transitions = self.parse_transitions()
         if transitions is None:
             return
+        self.stop_worker()
         tape = self.tape_entry.get()
         self.machine = TuringMachine(tape, transitions)
+        self.machine.record(limit=self.RECORD_LIMIT)
         self.draw_tape()
         self.draw_graph()
         self.auto_run = True
         self.pause_button.config(state=tk.NORMAL)
         self.run_auto()
 
-    def run_auto(self):
-        def loop():
-            while self.auto_run and self.machine and self.machine.state != "HALT":
-                success, explain = self.machine.step()
-                self.draw_tape()
-                self.explain_text.insert(tk.END, explain + "\n")
-                self.explain_text.see(tk.END)
-                time.sleep(self.speed / 1000)
-            self.auto_run = False
-        self.running_thread = threading.Thread(target=loop)
+    # -----------------------------
+    # Auto-run: stepping happens on a worker thread, which only hands
+    # snapshots to the Tk thread through self.snapshots
+    # -----------------------------
+    def run_auto(self, budget=None):
+        if self.running_thread and self.running_thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.running_thread = threading.Thread(target=self.worker, args=(budget,), daemon=True)
         self.running_thread.start()
 
+    def worker(self, budget=None):
+        """Step at the chosen speed, or with a `budget` run that many steps
+        flat out in FAST_BATCH chunks."""
+        machine, stop = self.machine, self.stop_event
+        started, taken = time.perf_counter(), 0
+        while not stop.is_set() and machine.state != "HALT" and (budget is None or taken < budget):
+            delay = self.speed / 1000 if budget is None else 0
+            if delay > 0:
+                success, explain = machine.step()
+                self.publish(self.snapshot([explain]))
+                stop.wait(delay)
+            else:
+                chunk = self.FAST_BATCH if budget is None else min(self.FAST_BATCH, budget - taken)
+                taken += machine.run(chunk)[0]
+                self.publish(self.snapshot())
+        if budget is not None and not stop.is_set():
+            elapsed = time.perf_counter() - started
+            rate = taken / elapsed if elapsed > 0 else float('inf')
+            self.publish(self.snapshot([f"Ran {taken} steps headless ({rate:,.0f} steps/s), state {machine.state}"]))
+        if machine.state == "HALT":
+            self.publish(self.snapshot([f"Halted after {machine.step_count} steps."]))
+        self.publish(None)
+
+    def publish(self, snapshot):
+        # Blocks while the queue is full, unless the run is being stopped
+        while True:
+            try:
+                self.snapshots.put(snapshot, timeout=0.1)
+                return
+            except queue.Full:
+                if self.stop_event.is_set():
+                    return
+
+    def poll_snapshots(self):
+        """Drain the queue on the Tk thread and draw only the newest snapshot."""
+        latest, lines, finished = None, [], False
+        try:
+            while True:
+                snapshot = self.snapshots.get_nowait()
+                if snapshot is None:
+                    finished = True
+                    continue
+                latest = snapshot
+                lines.extend(snapshot[4])
+        except queue.Empty:
+            pass
+        if len(lines) > self.MAX_LOG_LINES:
+            lines = lines[-self.MAX_LOG_LINES:]
+        self.log(lines)
+        if latest is not None:
+            self.draw_tape(latest)
+        if finished and self.machine:
+            # Halted, or a run_fast / jump budget was used up
+            self.auto_run = False
+            if self.machine.state == "HALT":
+                self.pause_button.config(state=tk.DISABLED)
+            else:
+                self.pause_button.config(text="▶ Resume")
+        self.root.after(self.FRAME_MS, self.poll_snapshots)
+
+    def stop_worker(self):
+        """Stop the worker and wait for it, so the machine is ours again."""
+        self.stop_event.set()
+        if self.running_thread and self.running_thread.is_alive():
+            self.running_thread.join()
+        self.running_thread = None
+        self.auto_run = False
+        # Drop snapshots of the run that was just stopped
+        while not self.snapshots.empty():
+            self.snapshots.get_nowait()
+
     def toggle_auto_run(self):
-        self.auto_run = not self.auto_run
-        if self.auto_run:
+        if not self.auto_run:
+            self.auto_run = True
             self.pause_button.config(text="⏸ Pause")
             self.run_auto()
         else:
+            self.stop_worker()
             self.pause_button.config(text="▶ Resume")
 
     def step(self):
         if self.machine:
+            if self.auto_run:
+                self.stop_worker()
+                self.pause_button.config(text="▶ Resume")
             success, explain = self.machine.step()
             self.draw_tape()
-            self.explain_text.insert(tk.END, explain + "\n")
-            self.explain_text.see(tk.END)
+            self.log([explain])
+
+    def run_fast(self, max_steps=10_000_000):
+        if not self.machine:
+            transitions = self.parse_transitions()
+            if transitions is None:
+                return
+            self.machine = TuringMachine(self.tape_entry.get(), transitions)
+            self.machine.record(limit=self.RECORD_LIMIT)
+            self.draw_graph()
+        self.stop_worker()
+        # The worker runs the steps; Pause stops it early
+        self.auto_run = True
+        self.pause_button.config(state=tk.NORMAL, text="⏸ Pause")
+        self.run_auto(max_steps)
+
+    # -----------------------------
+    # Rewind and jump through the recorded trace
+    # -----------------------------
+    def goto_step(self, target):
+        recorder = self.machine.recorder
+        self.stop_worker()
+        end = recorder.start + len(recorder)
+        target = max(target, recorder.start)
+        if target > end:
+            # Past the recording: run the rest on the worker
+            recorder.seek(end)
+            self.auto_run = True
+            self.pause_button.config(state=tk.NORMAL, text="⏸ Pause")
+            self.run_auto(target - end)
+            return
+        recorder.seek(target)
+        self.pause_button.config(state=tk.NORMAL if self.machine.state != "HALT" else tk.DISABLED,
+                                 text="▶ Resume")
+        self.draw_tape()
+        self.log([f"Moved to step {self.machine.step_count}"])
+
+    def step_back(self):
+        if self.machine and self.machine.recorder:
+            self.goto_step(self.machine.step_count - 1)
+
+    def jump(self):
+        if not (self.machine and self.machine.recorder):
+            return
+        try:
+            target = int(self.jump_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", f"Invalid step number: {self.jump_entry.get()}")
+            return
+        self.goto_step(target)
+
+    def save_trace(self):
+        if not (self.machine and self.machine.recorder):
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".trace")
+        if path:
+            self.stop_worker()
+            self.machine.recorder.save(path)
+
+    def load_trace(self):
+        path = filedialog.askopenfilename(filetypes=[("Traces", "*.trace"), ("All files", "*")])
+        if not path:
+            return
+        self.stop_worker()
+        self.machine = TraceRecorder.load(path).machine
+        self.tape_entry.delete(0, tk.END)
+        self.tape_entry.insert(0, self.machine.initial_tape)
+        self.transition_text.delete("1.0", tk.END)
+        self.transition_text.insert(tk.END, "\n".join(
+            f"{state} {symbol} -> {new_state} {write} {move}"
+            for (state, symbol), (new_state, write, move) in self.machine.transitions.items()))
+        self.draw_graph()
+        self.draw_tape()
+        self.pause_button.config(state=tk.NORMAL if self.machine.state != "HALT" else tk.DISABLED,
+                                 text="▶ Resume")
 
     def update_speed(self, val):
         self.speed = int(val)
 
     def reset(self):
         if self.machine:
+            self.stop_worker()
             self.machine.reset()
             self.draw_tape()
             self.explain_text.delete("1.0", tk.END)
             self.pause_button.config(state=tk.DISABLED, text="⏸ Pause")
-            self.auto_run = False
 
 if __name__ == "__main__":
     root = tk.Tk()